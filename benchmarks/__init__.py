@@ -0,0 +1,7 @@
+"""
+Micro and end-to-end benchmarks for the PDDIKTI client.
+
+Run ``python -m benchmarks`` from the repository root; see
+:mod:`benchmarks.__main__` for options. Nothing here touches the live API:
+end-to-end cases use the in-memory transport or the local stand-in server.
+"""
@@ -0,0 +1,78 @@
+"""
+Run the client benchmarks and compare them with a stored baseline.
+
+Usage::
+
+    python -m benchmarks                          # run, compare with baseline.json
+    python -m benchmarks --filter e2e             # only end-to-end cases
+    python -m benchmarks --json results.json      # write machine-readable results
+    python -m benchmarks --update-baseline        # store this run as the baseline
+
+The exit status is 1 if any benchmark (fastest sample by default, see
+``--metric``) is more than ``--threshold`` times its baseline, so the run
+can gate CI. Baselines are machine specific; record one on the machine that
+runs the comparison.
+"""
+import argparse
+import json
+import os
+import sys
+
+from . import bench_client  # noqa: F401  (registers the benchmarks)
+from .runner import compare, format_table, load_baseline, measure, registered, to_json
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n")[1])
+    parser.add_argument("--filter", help="only benchmarks whose name contains this, or a group")
+    parser.add_argument("--repeat", type=int, default=5, help="timed samples per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.1,
+                        help="minimum seconds per sample (sets the calls per sample)")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON ('-' for stdout)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare with")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="fail when a benchmark exceeds its baseline by this factor")
+    parser.add_argument("--metric", choices=("min_us", "median_us"), default="min_us",
+                        help="per-call time compared with the baseline")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="write this run to --baseline instead of comparing")
+    args = parser.parse_args(argv)
+
+    results = []
+    for name, setup, group in registered(args.filter):
+        print(f"running {name} ...", file=sys.stderr)
+        results.append(measure(name, setup, group, repeat=args.repeat, min_time=args.min_time))
+
+    report = to_json(results)
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.update_baseline:
+        baseline = load_baseline(args.baseline) if os.path.exists(args.baseline) else {}
+        baseline.update(report["results"])
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(dict(report, results=baseline), f, indent=2, sort_keys=True)
+        print(f"baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+
+    comparisons, regressions = [], []
+    if os.path.exists(args.baseline):
+        comparisons, regressions = compare(
+            results, load_baseline(args.baseline), args.threshold, args.metric
+        )
+    out = sys.stderr if args.json == "-" else sys.stdout
+    print(format_table(results, comparisons), file=out)
+    for c in regressions:
+        print(f"REGRESSION {c.name}: {c.current_us:.2f} us vs baseline "
+              f"{c.baseline_us:.2f} us ({c.ratio:.2f}x)", file=out)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
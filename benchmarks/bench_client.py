@@ -0,0 +1,122 @@
+"""
+Client hot path benchmarks.
+
+Micro benchmarks isolate per-call overhead (header construction, URL
+building, the ``handle_errors`` wrapper, JSON decoding, base64 encoding).
+End-to-end benchmarks run whole endpoint calls offline, through the
+in-memory transport (no sockets) and against the local stand-in server
+(loopback HTTP).
+"""
+import json
+import logging
+import random
+
+from pddiktipy import api, MemoryTransport
+from pddiktipy.api import handle_errors
+from pddiktipy.helper import helper
+from pddiktipy.standin import SHAPES, StandInServer
+
+from .runner import benchmark
+
+SAMPLE_ID = "lCOatIX_hCe2RQSG1Rghn5kO81hHLJdY"
+# Rows in the synthetic get_prodi_pt payload (about 1 MB of JSON)
+LARGE_ROWS = 5000
+LOGO_BYTES = 64 * 1024
+
+# Keep the client's INFO/WARNING logging out of the timed loops
+logging.getLogger("pddiktipy").setLevel(logging.ERROR)
+
+
+def _large_prodi_payload() -> bytes:
+    return json.dumps(SHAPES["pt/prodi"](random.Random(0), [], LARGE_ROWS)).encode("utf-8")
+
+
+@benchmark("helper.get_headers")
+def get_headers():
+    h = helper()
+    return h.get_headers, None
+
+
+@benchmark("helper.parse")
+def parse():
+    h = helper()
+    return (lambda: h.parse("Universitas Gadjah Mada")), None
+
+
+@benchmark("api._build_endpoint")
+def build_endpoint():
+    client = api()
+    return (lambda: client._build_endpoint("pt/prodi", SAMPLE_ID, 20241)), client.close
+
+
+@benchmark("api._url")
+def url_template():
+    client = api()
+    return (lambda: client._url("get_prodi_pt", SAMPLE_ID, 20241)), client.close
+
+
+@benchmark("api.handle_errors")
+def handle_errors_overhead():
+    @handle_errors
+    def method(self, value):
+        return value
+    return (lambda: method(None, SAMPLE_ID)), None
+
+
+@benchmark("json.decode_prodi_pt")
+def decode_prodi_pt():
+    body = _large_prodi_payload()
+    return (lambda: json.loads(body)), None
+
+
+@benchmark("helper.base64_encode_image")
+def base64_encode_image():
+    h = helper()
+    image = bytes(random.Random(0).getrandbits(8) for _ in range(LOGO_BYTES))
+    return (lambda: h.base64_encode_image(image)), None
+
+
+@benchmark("e2e.memory.search_pt", group="e2e")
+def memory_search_pt():
+    fake = MemoryTransport(default=[{"id": SAMPLE_ID, "nama": "Universitas Gadjah Mada"}])
+    client = api(transport=fake)
+    return (lambda: client.search_pt("Gadjah Mada")), client.close
+
+
+@benchmark("e2e.memory.search_pt.stats", group="e2e")
+def memory_search_pt_stats():
+    # Statistics subscribe to the events, so this adds the cost of building
+    # them on every call; compare with e2e.memory.search_pt
+    fake = MemoryTransport(default=[{"id": SAMPLE_ID, "nama": "Universitas Gadjah Mada"}])
+    client = api(transport=fake, stats=True)
+    return (lambda: client.search_pt("Gadjah Mada")), client.close
+
+
+@benchmark("e2e.memory.get_prodi_pt", group="e2e")
+def memory_get_prodi_pt():
+    body = _large_prodi_payload()
+    fake = MemoryTransport(default=lambda url, headers: body)
+    client = api(transport=fake)
+    return (lambda: client.get_prodi_pt(SAMPLE_ID, 20241)), client.close
+
+
+@benchmark("e2e.standin.search_pt", group="e2e")
+def standin_search_pt():
+    server = StandInServer(rows=20).start()
+    client = api(base_url=server.url)
+
+    def teardown():
+        client.close()
+        server.stop()
+    return (lambda: client.search_pt("Gadjah Mada")), teardown
+
+
+@benchmark("e2e.standin.get_logo_pt", group="e2e")
+def standin_get_logo_pt():
+    server = StandInServer(logo_bytes=LOGO_BYTES).start()
+    client = api(base_url=server.url)
+
+    def teardown():
+        client.close()
+        server.stop()
+    return (lambda: client.get_logo_pt(SAMPLE_ID)), teardown
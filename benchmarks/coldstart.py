@@ -0,0 +1,183 @@
+"""
+Cold-start benchmark: import time and time to first response.
+
+Each sample runs in a fresh interpreter, as a serverless invocation would
+(e.g. the Vercel deployment of ``pddikti_service``):
+
+* ``interpreter`` - wall time of ``python -c pass``, for reference;
+* ``import.pddiktipy`` / ``import.service`` - importing the package or the
+  service module;
+* ``first_response.client`` - import, ``api()`` and a first ``search_pt``;
+* ``first_response.service`` - import the service and answer a first
+  request through its ASGI app directly, without uvicorn and without the
+  lifespan events (serverless runtimes may skip them).
+
+Requests go to the local stand-in, so no network is involved::
+
+    python -m benchmarks.coldstart --runs 10
+    python -m benchmarks.coldstart --profile pddikti_service   # slowest imports
+
+Samples vary a lot between runs, so compare minimums.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+from pddiktipy.standin import StandInServer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Heavy dependencies worth knowing about when they are loaded at import
+WATCHED_MODULES = ("requests", "httpx", "asyncio", "uvicorn", "sqlite3")
+
+_IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000,
+                   "loaded": [m for m in {watched!r} if m in sys.modules]}}))
+"""
+
+_CLIENT_PROBE = """
+import json, time
+start = time.perf_counter()
+from pddiktipy import api
+client = api(base_url={url!r})
+result = client.search_pt("Gadjah Mada")
+print(json.dumps({{"ms": (time.perf_counter() - start) * 1000, "ok": result is not None}}))
+"""
+
+_SERVICE_PROBE = """
+import asyncio, json, time
+start = time.perf_counter()
+import pddikti_service
+
+async def first_response(path):
+    scope = {{"type": "http", "asgi": {{"version": "3.0"}}, "http_version": "1.1",
+              "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+              "query_string": b"", "root_path": "", "headers": [(b"host", b"localhost")],
+              "client": ("127.0.0.1", 1), "server": ("localhost", 80)}}
+    statuses = []
+
+    async def receive():
+        return {{"type": "http.request", "body": b"", "more_body": False}}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    await pddikti_service.app(scope, receive, send)
+    return statuses[0]
+
+status = asyncio.run(first_response("/search/university/gadjah"))
+print(json.dumps({{"ms": (time.perf_counter() - start) * 1000, "ok": status == 200}}))
+"""
+
+
+def _run_probe(code: str, env: Dict[str, str]) -> Dict[str, object]:
+    output = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _interpreter_ms(env: Dict[str, str]) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], cwd=REPO_ROOT, env=env, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def measure(runs: int = 5, rows: int = 20) -> Dict[str, Dict[str, object]]:
+    """Sample every cold-start metric ``runs`` times, each in a new process."""
+    samples: Dict[str, List[float]] = {}
+    loaded: Dict[str, List[str]] = {}
+    failures: Dict[str, int] = {}
+    with StandInServer(rows=rows) as server:
+        env = dict(os.environ, PDDIKTI_BASE_URL=server.url)
+        probes = {
+            "import.pddiktipy": _IMPORT_PROBE.format(module="pddiktipy", watched=WATCHED_MODULES),
+            "import.service": _IMPORT_PROBE.format(module="pddikti_service",
+                                                   watched=WATCHED_MODULES),
+            "first_response.client": _CLIENT_PROBE.format(url=server.url),
+            "first_response.service": _SERVICE_PROBE.format(),
+        }
+        for _ in range(runs):
+            samples.setdefault("interpreter", []).append(_interpreter_ms(env))
+            for name, code in probes.items():
+                result = _run_probe(code, env)
+                samples.setdefault(name, []).append(result["ms"])
+                if "loaded" in result:
+                    loaded[name] = result["loaded"]
+                if result.get("ok") is False:
+                    failures[name] = failures.get(name, 0) + 1
+    report = {}
+    for name, values in samples.items():
+        report[name] = {
+            "runs": len(values),
+            "min_ms": min(values),
+            "median_ms": statistics.median(values),
+            "max_ms": max(values),
+            "loaded": loaded.get(name),
+            "failed": failures.get(name, 0),
+        }
+    return report
+
+
+def format_report(report: Dict[str, Dict[str, object]]) -> str:
+    lines = [f"{'metric':<24} {'min ms':>9} {'median ms':>10} {'max ms':>9}  loaded on import"]
+    for name, r in report.items():
+        loaded = ", ".join(r["loaded"]) if r["loaded"] is not None else ""
+        failed = f"  ({r['failed']} failed)" if r["failed"] else ""
+        lines.append(f"{name:<24} {r['min_ms']:>9.1f} {r['median_ms']:>10.1f} "
+                     f"{r['max_ms']:>9.1f}  {loaded}{failed}")
+    return "\n".join(lines)
+
+
+def profile_imports(module: str, top: int = 20) -> str:
+    """The ``top`` slowest imports (cumulative) of ``module``, via ``-X importtime``."""
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=REPO_ROOT, capture_output=True, text=True, check=True).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+    rows.sort(reverse=True)
+    lines = [f"{'cumulative ms':>13} {'self ms':>8}  module"]
+    lines += [f"{c / 1000:>13.1f} {s / 1000:>8.1f}  {n}" for c, s, n in rows[:top]]
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.coldstart",
+                                     description="Measure import time and time to first response")
+    parser.add_argument("--runs", type=int, default=5, help="fresh processes per metric")
+    parser.add_argument("--rows", type=int, default=20, help="rows per stand-in search result")
+    parser.add_argument("--json", metavar="PATH", help="write the report as JSON ('-' for stdout)")
+    parser.add_argument("--profile", metavar="MODULE",
+                        help="instead, list the slowest imports of MODULE")
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        print(profile_imports(args.profile))
+        return 0
+
+    report = measure(args.runs, args.rows)
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    print(format_report(report), file=sys.stderr if args.json == "-" else sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,342 @@
+"""
+Load test for ``pddikti_service`` against the local upstream stand-in.
+
+Starts a :class:`~pddiktipy.standin.StandInServer`, then launches the
+service under uvicorn pointed at it (``PDDIKTI_BASE_URL``). Keep-alive
+clients then replay a Zipf-distributed mix of search keywords and detail IDs
+in two phases:
+
+* cold - a freshly started service with empty caches;
+* warm - the same traffic again, against the caches the cold phase filled.
+
+For each phase the report gives latency p50/p95/p99, throughput, errors,
+upstream calls (counted by the stand-in) and response cache hit rates (read
+from the service's ``/stats``)::
+
+    python -m benchmarks.loadtest --concurrency 32 --requests 3000 --workers 1 \\
+        --latency lognormal:40:0.6 --error 503:0.01 --json load.json
+
+``--service-env KEY=VALUE`` passes settings to the service, e.g.
+``PDDIKTI_RATE_LIMIT=0`` to take the client-side rate limit out of the
+picture. With ``--workers`` above 1 every uvicorn process has its own cache,
+and ``/stats`` shows only the worker that answered it.
+"""
+import argparse
+import bisect
+import json
+import math
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import requests
+
+from pddiktipy.standin import Latency, StandInServer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Share of traffic per route template; {kw} is a keyword, {id} an ID
+DEFAULT_MIX: Dict[str, float] = {
+    "/search/mahasiswa/{kw}": 0.25,
+    "/search/dosen/{kw}": 0.15,
+    "/search/university/{kw}": 0.15,
+    "/detail/mahasiswa/{id}": 0.15,
+    "/detail/dosen/{id}": 0.10,
+    "/detail/university/{id}": 0.10,
+    "/detail/prodi/{id}": 0.05,
+    "/detail/dosen/{id}?full=true": 0.05,
+}
+WORDS = ("budi", "sari", "ahmad", "dewi", "gadjah", "mada", "indonesia", "teknik",
+         "hukum", "ekonomi", "negeri", "swasta", "unika", "brawijaya", "airlangga")
+
+
+class Zipf:
+    """Draw ranks 0..n-1 with probability proportional to 1 / (rank + 1) ** s."""
+
+    def __init__(self, n: int, s: float) -> None:
+        weights = [1.0 / (rank + 1) ** s for rank in range(n)]
+        total = sum(weights)
+        self._cumulative: List[float] = []
+        running = 0.0
+        for weight in weights:
+            running += weight / total
+            self._cumulative.append(running)
+
+    def sample(self, rng: random.Random) -> int:
+        return min(bisect.bisect_left(self._cumulative, rng.random()), len(self._cumulative) - 1)
+
+
+class Workload:
+    """Request paths drawn from a route mix with Zipf-popular keywords and IDs."""
+
+    def __init__(self, keywords: int = 500, ids: int = 2000, zipf_s: float = 1.1,
+                 mix: Optional[Dict[str, float]] = None, seed: int = 0) -> None:
+        rng = random.Random(seed)
+        self.keywords = [f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}" for i in range(keywords)]
+        alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+        self.ids = ["".join(rng.choice(alphabet) for _ in range(32)) for _ in range(ids)]
+        self._keyword_rank = Zipf(keywords, zipf_s)
+        self._id_rank = Zipf(ids, zipf_s)
+        self.mix = dict(mix or DEFAULT_MIX)
+        self._routes = list(self.mix)
+        self._weights = [self.mix[route] for route in self._routes]
+
+    def paths(self, count: int, seed: int) -> List[Tuple[str, str]]:
+        """``count`` (route template, path) pairs; the same seed gives the same traffic."""
+        rng = random.Random(seed)
+        result = []
+        for route in rng.choices(self._routes, self._weights, k=count):
+            path = route.format(
+                kw=requests.utils.quote(self.keywords[self._keyword_rank.sample(rng)]),
+                id=self.ids[self._id_rank.sample(rng)],
+            )
+            result.append((route, path))
+        return result
+
+
+def percentile(ordered: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+@dataclass
+class PhaseReport:
+    name: str
+    requests: int
+    errors: int
+    duration_s: float
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    mean_ms: float
+    statuses: Dict[str, int]
+    upstream_calls: Optional[int] = None
+    upstream_per_request: Optional[float] = None
+    cache_hit_rate: Optional[float] = None
+    routes: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+
+def _summarise(name: str, samples: List[Tuple[str, int, float]], duration: float) -> PhaseReport:
+    latencies = sorted(latency for _, _, latency in samples)
+    statuses: Dict[str, int] = {}
+    by_route: Dict[str, List[float]] = {}
+    for route, status, latency in samples:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+        by_route.setdefault(route, []).append(latency)
+    errors = sum(count for status, count in statuses.items() if not status.startswith("2"))
+    routes = {}
+    for route, values in sorted(by_route.items()):
+        values.sort()
+        routes[route] = {"requests": len(values), "p50_ms": percentile(values, 50) * 1000,
+                         "p95_ms": percentile(values, 95) * 1000}
+    return PhaseReport(
+        name=name, requests=len(samples), errors=errors, duration_s=duration,
+        throughput_rps=len(samples) / duration if duration else 0.0,
+        p50_ms=percentile(latencies, 50) * 1000, p95_ms=percentile(latencies, 95) * 1000,
+        p99_ms=percentile(latencies, 99) * 1000,
+        max_ms=(latencies[-1] if latencies else 0.0) * 1000,
+        mean_ms=(statistics.mean(latencies) if latencies else 0.0) * 1000,
+        statuses=statuses, routes=routes,
+    )
+
+
+def run_phase(base_url: str, name: str, paths: List[Tuple[str, str]],
+              concurrency: int, timeout: float = 60.0) -> PhaseReport:
+    """Send ``paths`` from ``concurrency`` keep-alive clients as fast as they answer."""
+    samples: List[Tuple[str, int, float]] = []
+    lock = threading.Lock()
+    position = iter(range(len(paths)))
+    local = threading.local()
+
+    def worker() -> None:
+        local.session = requests.Session()
+        while True:
+            with lock:
+                index = next(position, None)
+            if index is None:
+                break
+            route, path = paths[index]
+            start = time.perf_counter()
+            try:
+                status = local.session.get(base_url + path, timeout=timeout).status_code
+            except requests.RequestException:
+                status = 599  # client-side failure (timeout, reset)
+            elapsed = time.perf_counter() - start
+            with lock:
+                samples.append((route, status, elapsed))
+        local.session.close()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for _ in range(concurrency):
+            executor.submit(worker)
+    return _summarise(name, samples, time.perf_counter() - started)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class ServiceProcess:
+    """``pddikti_service`` running under uvicorn in a child process."""
+
+    def __init__(self, upstream: str, workers: int = 1,
+                 env: Optional[Dict[str, str]] = None, log: Optional[str] = None) -> None:
+        self.port = _free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self._env = dict(os.environ, PDDIKTI_BASE_URL=upstream, **(env or {}))
+        self._workers = workers
+        self._log = log
+        self._process: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> "ServiceProcess":
+        output = open(self._log, "ab") if self._log else subprocess.DEVNULL
+        self._process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "pddikti_service:app", "--host", "127.0.0.1",
+             "--port", str(self.port), "--workers", str(self._workers), "--log-level", "warning"],
+            cwd=REPO_ROOT, env=self._env, stdout=output, stderr=output
+        )
+        if self._log:
+            output.close()  # the child keeps its own handle
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError("pddikti_service exited during startup")
+            try:
+                if requests.get(self.url + "/", timeout=1).ok:
+                    return self
+            except requests.RequestException:
+                time.sleep(0.2)
+        self.__exit__()
+        raise RuntimeError("pddikti_service did not start within 60 seconds")
+
+    def __exit__(self, *exc: object) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+
+    def cache_counters(self) -> Optional[Dict[str, int]]:
+        """Summed hits (fresh and stale) and misses over all response caches."""
+        try:
+            caches = requests.get(self.url + "/stats", timeout=5).json()["caches"]
+        except (requests.RequestException, ValueError, KeyError):
+            return None
+        return {
+            "hits": sum(c["hits"] + c["stale_hits"] for c in caches.values()),
+            "misses": sum(c["misses"] for c in caches.values()),
+        }
+
+
+def _upstream_calls(stats: Dict[str, int]) -> int:
+    # Family counters are "a/b"; errors_*, not_found and not_modified are extras
+    return sum(count for key, count in stats.items() if "/" in key)
+
+
+def run(args: argparse.Namespace) -> List[PhaseReport]:
+    workload = Workload(args.keywords, args.ids, args.zipf, seed=args.seed)
+    errors = dict(args.error)
+    standin = StandInServer(latency=args.latency, errors=errors, rows=args.rows,
+                            seed=args.seed).start()
+    reports = []
+    try:
+        env = dict(item.split("=", 1) for item in args.service_env)
+        with ServiceProcess(standin.url, args.workers, env, args.service_log) as service:
+            for phase in args.phases:
+                standin.reset_stats()
+                before = service.cache_counters()
+                # Warm traffic repeats the cold traffic's popularity, not its order
+                paths = workload.paths(args.requests, seed=args.seed + len(reports))
+                print(f"{phase}: {len(paths)} requests, concurrency {args.concurrency}",
+                      file=sys.stderr)
+                report = run_phase(service.url, phase, paths, args.concurrency)
+                after = service.cache_counters()
+                report.upstream_calls = _upstream_calls(standin.stats())
+                report.upstream_per_request = report.upstream_calls / max(1, report.requests)
+                if before is not None and after is not None:
+                    hits = after["hits"] - before["hits"]
+                    lookups = hits + after["misses"] - before["misses"]
+                    report.cache_hit_rate = hits / lookups if lookups else None
+                reports.append(report)
+    finally:
+        standin.stop()
+    return reports
+
+
+def format_reports(reports: List[PhaseReport]) -> str:
+    header = (f"{'phase':<6} {'reqs':>6} {'err':>5} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} "
+              f"{'p99 ms':>8} {'max ms':>8} {'upstream':>9} {'up/req':>7} {'cache hit':>9}")
+    lines = [header]
+    for r in reports:
+        hit = f"{r.cache_hit_rate:.1%}" if r.cache_hit_rate is not None else "-"
+        lines.append(
+            f"{r.name:<6} {r.requests:>6} {r.errors:>5} {r.throughput_rps:>8.1f} {r.p50_ms:>8.1f} "
+            f"{r.p95_ms:>8.1f} {r.p99_ms:>8.1f} {r.max_ms:>8.1f} {r.upstream_calls:>9} "
+            f"{r.upstream_per_request:>7.2f} {hit:>9}"
+        )
+    return "\n".join(lines)
+
+
+def _parse_error(spec: str) -> Tuple[int, float]:
+    status, _, probability = spec.partition(":")
+    return int(status), float(probability)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.loadtest",
+                                     description="Load test pddikti_service offline")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent clients")
+    parser.add_argument("--requests", type=int, default=1000, help="requests per phase")
+    parser.add_argument("--phases", type=lambda v: v.split(","), default=["cold", "warm"],
+                        help="comma separated phase names; the first runs on empty caches")
+    parser.add_argument("--keywords", type=int, default=500, help="distinct search keywords")
+    parser.add_argument("--ids", type=int, default=2000, help="distinct detail IDs")
+    parser.add_argument("--zipf", type=float, default=1.1, help="Zipf exponent of popularity")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--latency", type=Latency.parse, default=Latency.lognormal(0.04, 0.6),
+                        help="upstream latency spec in ms, e.g. lognormal:40:0.6")
+    parser.add_argument("--error", action="append", type=_parse_error, default=[],
+                        metavar="STATUS:PROBABILITY", help="inject upstream errors")
+    parser.add_argument("--rows", type=int, default=20, help="rows per upstream search result")
+    parser.add_argument("--service-env", action="append", default=[], metavar="KEY=VALUE",
+                        help="environment for the service, e.g. PDDIKTI_RATE_LIMIT=0")
+    parser.add_argument("--service-log", metavar="PATH",
+                        help="append the service's output to this file (default: discard)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", metavar="PATH", help="write the reports as JSON ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    reports = run(args)
+    if args.json:
+        settings = {k: v for k, v in vars(args).items() if k not in ("json", "latency")}
+        settings["latency"] = repr(args.latency)
+        payload = json.dumps({"settings": settings, "phases": [asdict(r) for r in reports]},
+                             indent=2)
+        if args.json == "-":
+            print(payload)
+        else:
+            with open(args.json, "w", encoding="utf-8") as f:
+                f.write(payload)
+    print(format_reports(reports), file=sys.stderr if args.json == "-" else sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
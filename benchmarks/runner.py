@@ -0,0 +1,169 @@
+"""
+Benchmark registry, timing loop and baseline comparison.
+"""
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# A benchmark is a setup function returning the callable to time, plus an
+# optional teardown; setup runs once, outside the timed loop.
+Setup = Callable[[], Tuple[Callable[[], object], Optional[Callable[[], None]]]]
+
+_REGISTRY: Dict[str, Tuple[Setup, str]] = {}
+
+
+def benchmark(name: str, group: str = "micro") -> Callable[[Setup], Setup]:
+    """Register ``setup`` as benchmark ``name``.
+
+    Example:
+        >>> @benchmark("helper.parse")
+        ... def parse():
+        ...     h = helper()
+        ...     return (lambda: h.parse("Gadjah Mada")), None
+    """
+    def register(setup: Setup) -> Setup:
+        if name in _REGISTRY:
+            raise ValueError(f"Duplicate benchmark name: {name}")
+        _REGISTRY[name] = (setup, group)
+        return setup
+    return register
+
+
+def registered(pattern: Optional[str] = None) -> Iterator[Tuple[str, Setup, str]]:
+    for name, (setup, group) in sorted(_REGISTRY.items()):
+        if pattern is None or pattern in name or pattern == group:
+            yield name, setup, group
+
+
+@dataclass
+class Result:
+    """Timing of one benchmark; times are per call, in microseconds."""
+    name: str
+    group: str
+    number: int
+    repeat: int
+    min_us: float
+    median_us: float
+    stdev_us: float
+
+    @property
+    def ops_per_sec(self) -> float:
+        return 1e6 / self.median_us if self.median_us else float("inf")
+
+
+def _calibrate(func: Callable[[], object], min_time: float) -> int:
+    """Smallest power of ten of calls that takes at least ``min_time`` seconds."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - start >= min_time or number >= 10 ** 7:
+            return number
+        number *= 10
+
+
+def measure(name: str, setup: Setup, group: str = "micro",
+            repeat: int = 5, min_time: float = 0.1) -> Result:
+    """Time the callable built by ``setup``: ``repeat`` samples of ``number`` calls."""
+    func, teardown = setup()
+    try:
+        func()  # warm up caches, pools and lazy imports
+        number = _calibrate(func, min_time)
+        samples: List[float] = []
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                for _ in range(number):
+                    func()
+                samples.append((time.perf_counter() - start) / number * 1e6)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    finally:
+        if teardown is not None:
+            teardown()
+    return Result(
+        name=name, group=group, number=number, repeat=repeat,
+        min_us=min(samples), median_us=statistics.median(samples),
+        stdev_us=statistics.stdev(samples) if len(samples) > 1 else 0.0
+    )
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def to_json(results: List[Result]) -> Dict[str, object]:
+    """Machine-readable report; the format read back by :func:`load_baseline`."""
+    return {
+        "version": 1,
+        "environment": environment(),
+        "results": {r.name: dict(asdict(r), ops_per_sec=r.ops_per_sec) for r in results},
+    }
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, float]]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline_us: float
+    current_us: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_us / self.baseline_us if self.baseline_us else float("inf")
+
+
+def compare(results: List[Result], baseline: Dict[str, Dict[str, float]],
+            threshold: float, metric: str = "min_us") -> Tuple[List[Comparison], List[Comparison]]:
+    """Compare ``metric`` (``min_us`` or ``median_us``) with the baseline.
+
+    The minimum is the default: on a shared machine interference only ever
+    adds time, so the fastest sample is the most repeatable.
+
+    Returns:
+        All comparisons, and the regressions slower than ``threshold`` times
+        the baseline. Benchmarks missing from the baseline are skipped.
+    """
+    comparisons = [
+        Comparison(r.name, baseline[r.name][metric], getattr(r, metric))
+        for r in results if r.name in baseline
+    ]
+    return comparisons, [c for c in comparisons if c.ratio > threshold]
+
+
+def format_table(results: List[Result], comparisons: List[Comparison]) -> str:
+    ratios = {c.name: c.ratio for c in comparisons}
+    lines = [f"{'benchmark':<40} {'median':>12} {'min':>12} {'ops/s':>12} {'vs base':>8}"]
+    for r in results:
+        ratio = f"{ratios[r.name]:.2f}x" if r.name in ratios else "-"
+        lines.append(
+            f"{r.name:<40} {_fmt(r.median_us):>12} {_fmt(r.min_us):>12} "
+            f"{r.ops_per_sec:>12,.0f} {ratio:>8}"
+        )
+    return "\n".join(lines)
+
+
+def _fmt(us: float) -> str:
+    if us >= 1000:
+        return f"{us / 1000:.2f} ms"
+    if us >= 1:
+        return f"{us:.2f} us"
+    return f"{us * 1000:.0f} ns"
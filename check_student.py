@@ -27,21 +27,27 @@ def check_student():
             
             if students:
                 log_to_file(f"\nFound {len(students)} student(s):")
+                
+                # Fetch details for all matches concurrently to be sure it's the right person
+                details = {
+                    result.id: result
+                    for result in client.get_detail_mhs_many(mhs['id'] for mhs in students)
+                }
+                
                 for i, mhs in enumerate(students):
                     log_to_file(f"\n[{i+1}] Name: {mhs['nama']}")
                     log_to_file(f"    NIM: {mhs['nim']}")
                     log_to_file(f"    University: {mhs['nama_pt']}")
                     log_to_file(f"    Program: {mhs['nama_prodi']}")
                     
-                    # Fetch detailed info for the first match or all?
-                    # Let's fetch detail for all found to be sure it's the right person
-                    log_to_file("    Fetching details...")
-                    detail = client.get_detail_mhs(mhs['id'])
-                    if detail:
+                    result = details.get(mhs['id'])
+                    if result is not None and result.ok:
+                         detail = result.data
                          log_to_file(f"    Status: {detail.get('status_saat_ini')}")
                          log_to_file(f"    Entry Year: {detail.get('tahun_masuk')}")
                     else:
-                        log_to_file("    Could not retrieve details.")
+                        reason = result.error if result is not None and result.error else "no data"
+                        log_to_file(f"    Could not retrieve details ({reason}).")
             else:
                 log_to_file("\nStudent not found.")
                 
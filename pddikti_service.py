@@ -1,20 +1,133 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Optional, List, Dict, Any
-from pddiktipy import api
-import uvicorn
+from pddiktipy import AdaptiveTimeouts, ClientPool, DiskCache, EventHooks, HedgePolicy, RetryPolicy
+from pddiktipy.cache import TTLCache, ttl_cached
+from pddiktipy.deadline import deadline_scope
+from pddiktipy.metrics import CONTENT_TYPE, MetricsRegistry, UpstreamMetrics
+from pddiktipy.singleflight import singleflight
 import logging
-from functools import lru_cache
-from tenacity import retry, stop_after_attempt, wait_fixed, retry_if_exception_type
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from functools import wraps
+from anyio import to_thread
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("pddikti-api")
 
+# --- Shared Client Pool ---
+
+# One client per threadpool worker; 40 matches the anyio default limiter.
+POOL_SIZE = int(os.getenv("PDDIKTI_POOL_SIZE", "40"))
+POOL_CONNECTIONS = int(os.getenv("PDDIKTI_POOL_CONNECTIONS", "10"))
+POOL_MAXSIZE = int(os.getenv("PDDIKTI_POOL_MAXSIZE", "10"))
+# Optional upstream override, e.g. a local stand-in server
+UPSTREAM_BASE_URL = os.getenv("PDDIKTI_BASE_URL") or None
+# Optional persistent response cache file (e.g. /tmp/pddikti-cache.db on
+# Vercel) so restarts and cold starts reuse earlier upstream responses
+DISK_CACHE_PATH = os.getenv("PDDIKTI_DISK_CACHE") or None
+# Upstream requests per second across the whole pool (0 disables); backs off
+# automatically on 429 and recovers while responses are healthy
+RATE_LIMIT = float(os.getenv("PDDIKTI_RATE_LIMIT", "20"))
+# The single retry budget for each upstream request: capped attempts within
+# a total deadline, so one bad call cannot hold a worker for minutes
+UPSTREAM_RETRY = RetryPolicy(
+    max_attempts=int(os.getenv("PDDIKTI_RETRY_ATTEMPTS", "3")),
+    deadline=float(os.getenv("PDDIKTI_RETRY_DEADLINE", "15"))
+)
+# Hedge interactive upstream calls slower than this latency percentile
+# (0 disables), sending at most PDDIKTI_HEDGE_MAX_EXTRA extra requests per request
+HEDGE_PERCENTILE = float(os.getenv("PDDIKTI_HEDGE_PERCENTILE", "95"))
+HEDGE_MAX_EXTRA = float(os.getenv("PDDIKTI_HEDGE_MAX_EXTRA", "0.1"))
+# Learn connect/read timeouts per endpoint family from recent upstream
+# latency (0 disables), kept between a floor and a ceiling in seconds, so a
+# stalled upstream frees workers after seconds instead of 30
+ADAPTIVE_TIMEOUTS = os.getenv("PDDIKTI_ADAPTIVE_TIMEOUTS", "1") != "0"
+TIMEOUT_FLOOR = float(os.getenv("PDDIKTI_TIMEOUT_FLOOR", "2"))
+TIMEOUT_CEILING = float(os.getenv("PDDIKTI_TIMEOUT_CEILING", "30"))
+
+# Overall deadline (seconds) for composite detail routes
+COMPOSITE_TIMEOUT = float(os.getenv("PDDIKTI_COMPOSITE_TIMEOUT", "10"))
+# Time budget (seconds) for every other route; upstream timeouts and retries
+# are cut to what is left of it, so a slow upstream cannot outlive the request
+ROUTE_BUDGET = float(os.getenv("PDDIKTI_ROUTE_BUDGET", "8"))
+
+# Response cache: fresh TTL and stale-while-revalidate window (seconds) per
+# endpoint class, a short TTL for empty/fallback results, and a byte budget
+# per cached function.
+SEARCH_TTL = float(os.getenv("PDDIKTI_SEARCH_TTL", "600"))
+SEARCH_STALE_TTL = float(os.getenv("PDDIKTI_SEARCH_STALE_TTL", "3600"))
+DETAIL_TTL = float(os.getenv("PDDIKTI_DETAIL_TTL", "3600"))
+DETAIL_STALE_TTL = float(os.getenv("PDDIKTI_DETAIL_STALE_TTL", "86400"))
+NEGATIVE_TTL = float(os.getenv("PDDIKTI_NEGATIVE_TTL", "30"))
+CACHE_MAX_BYTES = int(os.getenv("PDDIKTI_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+
+# --- Metrics ---
+
+# Exposed at /metrics in the Prometheus text format. Every client of the
+# pool reports its upstream requests through UPSTREAM_EVENTS.
+METRICS = MetricsRegistry()
+ROUTE_DURATION = METRICS.histogram(
+    "pddikti_http_request_duration_seconds",
+    "Service request duration by route and HTTP status",
+    ["route", "status"]
+)
+UPSTREAM_EVENTS = EventHooks()
+UPSTREAM_METRICS = UpstreamMetrics(METRICS)
+UPSTREAM_METRICS.attach(UPSTREAM_EVENTS)
+
+_client_pool: Optional[ClientPool] = None
+_client_pool_lock = threading.Lock()
+
+def get_client_pool() -> ClientPool:
+    """Return the process-wide client pool, creating it on first use.
+
+    Startup normally creates the pool, but serverless runtimes may skip the
+    lifespan events, so route handlers fall back to lazy creation.
+    """
+    global _client_pool
+    if _client_pool is None:
+        with _client_pool_lock:
+            if _client_pool is None:
+                _client_pool = ClientPool(
+                    size=POOL_SIZE,
+                    pool_connections=POOL_CONNECTIONS,
+                    pool_maxsize=POOL_MAXSIZE,
+                    base_url=UPSTREAM_BASE_URL,
+                    cache=DiskCache(DISK_CACHE_PATH) if DISK_CACHE_PATH else None,
+                    rate_limit=RATE_LIMIT or None,
+                    retry=UPSTREAM_RETRY,
+                    hedge=HedgePolicy(percentile=HEDGE_PERCENTILE, max_extra=HEDGE_MAX_EXTRA)
+                    if HEDGE_PERCENTILE else None,
+                    events=UPSTREAM_EVENTS,
+                    adaptive_timeouts=AdaptiveTimeouts(read_floor=TIMEOUT_FLOOR,
+                                                       read_ceiling=TIMEOUT_CEILING)
+                    if ADAPTIVE_TIMEOUTS else None
+                )
+    return _client_pool
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Size the sync-route threadpool to the client pool so workers never
+    # queue for a client.
+    to_thread.current_default_thread_limiter().total_tokens = POOL_SIZE
+    pool = get_client_pool()
+    pool.warm()
+    logger.info(f"Client pool ready (size={POOL_SIZE}, pool_maxsize={POOL_MAXSIZE})")
+    try:
+        yield
+    finally:
+        pool.close()
+        logger.info("Client pool drained")
+
 app = FastAPI(
     title="PDDIKTI API Service",
     description="REST API wrapper for pddiktipy library",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # --- CORS Middleware ---
@@ -26,6 +139,37 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
+class RouteMetricsMiddleware:
+    """Times every HTTP request into ROUTE_DURATION.
+
+    Routes are labelled by their path template (e.g. ``/detail/pt/{id}``),
+    so IDs and keywords do not create new series.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        status = 500
+
+        async def send_and_record_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_record_status)
+        finally:
+            # The router stores the matched route in the shared scope
+            route = getattr(scope.get("route"), "path", "unmatched")
+            ROUTE_DURATION.observe(time.perf_counter() - started, route, str(status))
+
+app.add_middleware(RouteMetricsMiddleware)
+
 # Helper function to normalize list vs dict responses
 def normalize_response(response: Any) -> Optional[Dict[str, Any]]:
     if not response:
@@ -60,49 +204,62 @@ def normalize_list_response(response: Any) -> List[Dict[str, Any]]:
         
     return []
 
-# --- Cached & Retried Functions ---
+# --- Cached Functions ---
+# A TTL cache serves repeated keys, returning expired entries at once while a
+# background refresh runs; @singleflight makes concurrent misses for the same
+# key share one upstream fetch instead of each starting its own. Retries
+# happen once, inside the clients, according to UPSTREAM_RETRY.
 
-# Retry configuration: 3 attempts, wait 2 seconds between attempts
-retry_config = {
-    "stop": stop_after_attempt(3),
-    "wait": wait_fixed(2),
-    "retry": retry_if_exception_type(Exception),
-    "reraise": True
-}
+def result_ttl(result: Any) -> Optional[float]:
+    """Cache empty and fallback results briefly so they are retried soon."""
+    if not result:
+        return NEGATIVE_TTL
+    if isinstance(result, dict):
+        if result.get("fallback_mode"):
+            return NEGATIVE_TTL
+        if 'data' in result and not result['data']:
+            return NEGATIVE_TTL
+    return None
+
+def search_cache() -> TTLCache:
+    return TTLCache(ttl=SEARCH_TTL, stale_ttl=SEARCH_STALE_TTL, max_bytes=CACHE_MAX_BYTES)
+
+def detail_cache() -> TTLCache:
+    return TTLCache(ttl=DETAIL_TTL, stale_ttl=DETAIL_STALE_TTL, max_bytes=CACHE_MAX_BYTES)
 
-@lru_cache(maxsize=128)
-@retry(**retry_config)
+@ttl_cached(search_cache(), ttl_for=result_ttl)
+@singleflight
 def cached_search_mahasiswa(keyword: str):
-    logger.info(f"Cache miss - Searching student: {keyword}")
-    with api() as client:
+    logger.info("Cache miss - Searching student: %s", keyword)
+    with get_client_pool().client() as client:
         return client.search_mahasiswa(keyword)
 
-@lru_cache(maxsize=128)
-@retry(**retry_config)
+@ttl_cached(detail_cache(), ttl_for=result_ttl)
+@singleflight
 def cached_get_detail_mhs(id: str):
-    logger.info(f"Cache miss - Getting student detail: {id}")
-    with api() as client:
+    logger.info("Cache miss - Getting student detail: %s", id)
+    with get_client_pool().client() as client:
         return client.get_detail_mhs(id)
 
-@lru_cache(maxsize=128)
-@retry(**retry_config)
+@ttl_cached(search_cache(), ttl_for=result_ttl)
+@singleflight
 def cached_search_dosen(keyword: str):
-    logger.info(f"Cache miss - Searching lecturer: {keyword}")
-    with api() as client:
+    logger.info("Cache miss - Searching lecturer: %s", keyword)
+    with get_client_pool().client() as client:
         return client.search_dosen(keyword)
 
-@lru_cache(maxsize=128)
-@retry(**retry_config)
+@ttl_cached(detail_cache(), ttl_for=result_ttl)
+@singleflight
 def cached_get_dosen_profile(id: str):
-    logger.info(f"Cache miss - Getting lecturer profile: {id}")
-    with api() as client:
+    logger.info("Cache miss - Getting lecturer profile: %s", id)
+    with get_client_pool().client() as client:
         return client.get_dosen_profile(id)
 
-@lru_cache(maxsize=128)
-@retry(**retry_config)
+@ttl_cached(search_cache(), ttl_for=result_ttl)
+@singleflight
 def cached_search_pt(keyword: str):
-    logger.info(f"Cache miss - Searching university: {keyword}")
-    with api() as client:
+    logger.info("Cache miss - Searching university: %s", keyword)
+    with get_client_pool().client() as client:
         results = client.search_pt(keyword)
         
         # FIX: The API returns the Name in the 'id' field for some reason.
@@ -122,11 +279,11 @@ def cached_search_pt(keyword: str):
         
         return results
 
-@lru_cache(maxsize=128)
-@retry(**retry_config)
+@ttl_cached(detail_cache(), ttl_for=result_ttl)
+@singleflight
 def cached_get_detail_pt(id: str):
-    logger.info(f"Cache miss - Getting university detail: {id}")
-    with api() as client:
+    logger.info("Cache miss - Getting university detail: %s", id)
+    with get_client_pool().client() as client:
         try:
             # Try the standard endpoint first
             detail = client.get_detail_pt(id)
@@ -164,11 +321,64 @@ def cached_get_detail_pt(id: str):
 
 # --- Endpoints ---
 
+def route_budget(seconds: float):
+    """Run a route within a deadline that every upstream call inherits."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with deadline_scope(seconds):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
 @app.get("/")
 def read_root():
     return {"message": "Welcome to PDDIKTI API Service. Visit /docs for documentation."}
 
+# Cached upstream lookups, by name, for /stats
+CACHED_LOOKUPS = {
+    "search_mahasiswa": cached_search_mahasiswa,
+    "detail_mahasiswa": cached_get_detail_mhs,
+    "search_dosen": cached_search_dosen,
+    "detail_dosen": cached_get_dosen_profile,
+    "search_university": cached_search_pt,
+    "detail_university": cached_get_detail_pt,
+}
+
+@app.get("/stats")
+def read_stats():
+    """Response cache counters per lookup and learned upstream timeouts, e.g. for load tests."""
+    pool = get_client_pool()
+    return {
+        "caches": {name: func.cache.stats() for name, func in CACHED_LOOKUPS.items()},
+        "clients": pool.created,
+        "timeouts": pool.adaptive_timeouts.stats() if pool.adaptive_timeouts else None,
+    }
+
+def _cache_stat(key: str):
+    """Collect one response cache counter of every cached lookup."""
+    def collect():
+        return [((name,), func.cache.stats()[key]) for name, func in CACHED_LOOKUPS.items()]
+    return collect
+
+for _stat, _kind, _doc in (
+    ("hits", "counter", "Response cache hits"),
+    ("stale_hits", "counter", "Response cache hits served stale while refreshing"),
+    ("misses", "counter", "Response cache misses"),
+    ("evictions", "counter", "Response cache evictions"),
+    ("entries", "gauge", "Response cache entries"),
+    ("size_bytes", "gauge", "Estimated response cache size in bytes"),
+):
+    _name = f"pddikti_cache_{_stat}_total" if _kind == "counter" else f"pddikti_cache_{_stat}"
+    METRICS.callback(_name, _doc, _kind, ["cache"], _cache_stat(_stat))
+
+@app.get("/metrics")
+async def read_metrics():
+    """Service, upstream and cache metrics in the Prometheus text format."""
+    return Response(METRICS.render(), media_type=CONTENT_TYPE)
+
 @app.get("/search/mahasiswa/{keyword}")
+@route_budget(ROUTE_BUDGET)
 def search_mahasiswa(keyword: str):
     try:
         results = cached_search_mahasiswa(keyword)
@@ -179,6 +389,7 @@ def search_mahasiswa(keyword: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/detail/mahasiswa/{id}")
+@route_budget(ROUTE_BUDGET)
 def get_detail_mahasiswa(id: str):
     try:
         result = cached_get_detail_mhs(id)
@@ -192,6 +403,7 @@ def get_detail_mahasiswa(id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/search/dosen/{keyword}")
+@route_budget(ROUTE_BUDGET)
 def search_dosen(keyword: str):
     try:
         results = cached_search_dosen(keyword)
@@ -202,8 +414,13 @@ def search_dosen(keyword: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/detail/dosen/{id}")
-def get_detail_dosen(id: str):
+@route_budget(COMPOSITE_TIMEOUT)
+def get_detail_dosen(id: str, full: bool = Query(False, description="Return the complete portfolio in one response")):
     try:
+        if full:
+            with get_client_pool().client() as client:
+                portfolio = client.get_dosen_portfolio(id, timeout=COMPOSITE_TIMEOUT)
+            return portfolio.to_dict() if portfolio else {}
         profile = cached_get_dosen_profile(id)
         return profile if profile else {}
     except Exception as e:
@@ -211,6 +428,7 @@ def get_detail_dosen(id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/search/university/{keyword}")
+@route_budget(ROUTE_BUDGET)
 def search_university(keyword: str):
     try:
         results = cached_search_pt(keyword)
@@ -221,6 +439,7 @@ def search_university(keyword: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/detail/university/{id}")
+@route_budget(ROUTE_BUDGET)
 def get_detail_university(id: str):
     try:
         detail = cached_get_detail_pt(id)
@@ -229,6 +448,23 @@ def get_detail_university(id: str):
         logger.error(f"Error getting university detail: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/detail/prodi/{id}")
+@route_budget(COMPOSITE_TIMEOUT)
+def get_detail_prodi(id: str, semester: Optional[int] = Query(None, description="Academic semester in YYYYS format, e.g. 20241")):
+    try:
+        with get_client_pool().client() as client:
+            profile = client.get_prodi_full_profile(id, semester, timeout=COMPOSITE_TIMEOUT)
+        if profile is None or not any(profile.data.values()):
+            raise HTTPException(status_code=404, detail="Study program not found")
+        return profile.to_dict()
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting study program detail: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 if __name__ == "__main__":
+    # Only needed to run the file directly; serverless imports skip it
+    import uvicorn
     uvicorn.run("pddikti_service:app", host="0.0.0.0", port=8000, reload=True)
 
@@ -3,24 +3,131 @@
 # __variables__ with double-quoted values will be available in setup.py
 __version__ = "2.0.6"
 
+import importlib
+from typing import TYPE_CHECKING
+
+# ``api`` is imported eagerly: the class shares its name with the
+# ``pddiktipy.api`` submodule, and a lazy attribute would be shadowed by the
+# submodule as soon as anything imports it.
 from .api import api
-from .exceptions import (
-    PDDIKTIError,
-    APIConnectionError,
-    APITimeoutError,
-    APIRateLimitError,
-    APIResponseError,
-    ValidationError,
-    AuthenticationError
-)
+
+# Every other public name, by defining submodule. They are imported on first
+# access (PEP 562), so ``import pddiktipy`` only loads what the sync client
+# needs; the async client and httpx are loaded by code that uses them.
+_LAZY = {
+    'ClientPool': 'pool',
+    'DiskCache': 'disk_cache',
+    'RateLimiter': 'ratelimit',
+    'RetryPolicy': 'retry',
+    'CircuitBreakers': 'circuit',
+    'HedgePolicy': 'hedging',
+    'deadline_scope': 'deadline',
+    'AdaptiveTimeouts': 'timeouts',
+    'Transport': 'transport',
+    'AsyncTransport': 'transport',
+    'RequestsTransport': 'transport',
+    'HttpxTransport': 'transport',
+    'MemoryTransport': 'transport',
+    'CassetteTransport': 'transport',
+    'TransportResponse': 'transport',
+    'EventHooks': 'events',
+    'RequestEvent': 'events',
+    'CallEvent': 'events',
+    'ClientStats': 'stats',
+    'LatencySketch': 'stats',
+    'AsyncApi': 'async_api',
+    'CompositeResult': 'parallel',
+    'SectionResult': 'parallel',
+    'DosenPortfolio': 'parallel',
+    'BulkResult': 'parallel',
+    'PDDIKTIError': 'exceptions',
+    'APIConnectionError': 'exceptions',
+    'APITimeoutError': 'exceptions',
+    'DeadlineExceededError': 'exceptions',
+    'APIRateLimitError': 'exceptions',
+    'APIResponseError': 'exceptions',
+    'ValidationError': 'exceptions',
+    'AuthenticationError': 'exceptions',
+    'CircuitOpenError': 'exceptions',
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+if TYPE_CHECKING:
+    from .pool import ClientPool
+    from .disk_cache import DiskCache
+    from .ratelimit import RateLimiter
+    from .retry import RetryPolicy
+    from .circuit import CircuitBreakers
+    from .hedging import HedgePolicy
+    from .deadline import deadline_scope
+    from .timeouts import AdaptiveTimeouts
+    from .transport import (
+        Transport, AsyncTransport, RequestsTransport, HttpxTransport, MemoryTransport,
+        CassetteTransport, TransportResponse
+    )
+    from .events import EventHooks, RequestEvent, CallEvent
+    from .stats import ClientStats, LatencySketch
+    from .async_api import AsyncApi
+    from .parallel import CompositeResult, SectionResult, DosenPortfolio, BulkResult
+    from .exceptions import (
+        PDDIKTIError,
+        APIConnectionError,
+        APITimeoutError,
+        DeadlineExceededError,
+        APIRateLimitError,
+        APIResponseError,
+        ValidationError,
+        AuthenticationError,
+        CircuitOpenError
+    )
 
 __all__ = [
     'api',
+    'ClientPool',
+    'DiskCache',
+    'RateLimiter',
+    'RetryPolicy',
+    'CircuitBreakers',
+    'HedgePolicy',
+    'deadline_scope',
+    'AdaptiveTimeouts',
+    'Transport',
+    'AsyncTransport',
+    'RequestsTransport',
+    'HttpxTransport',
+    'MemoryTransport',
+    'CassetteTransport',
+    'TransportResponse',
+    'EventHooks',
+    'RequestEvent',
+    'CallEvent',
+    'ClientStats',
+    'LatencySketch',
+    'AsyncApi',
+    'CompositeResult',
+    'SectionResult',
+    'DosenPortfolio',
+    'BulkResult',
     'PDDIKTIError',
     'APIConnectionError', 
     'APITimeoutError',
+    'DeadlineExceededError',
     'APIRateLimitError',
     'APIResponseError',
     'ValidationError',
-    'AuthenticationError'
+    'AuthenticationError',
+    'CircuitOpenError'
 ]
@@ -1,10 +1,25 @@
 import logging
-from typing import Any, Dict, Optional, Callable, Union, List, Tuple, TypeVar
-from functools import wraps
+import time
+from typing import Any, Dict, Optional, Callable, Union, List, Tuple, Type, TypeVar, Iterable, Iterator
+from functools import partial, wraps
 from .helper import helper
+from .disk_cache import DiskCache
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .circuit import CircuitBreakers
+from .hedging import HedgePolicy
+from .deadline import deadline_scope
+from .endpoints import compile_endpoints
+from .events import CallEvent, EventHooks, calling_method
+from .stats import ClientStats
+from .timeouts import AdaptiveTimeouts
+from .transport import Transport
+from .parallel import (
+    BulkResult, CompositeResult, DosenPortfolio, current_semester, iter_many, run_sections
+)
 from .exceptions import (
     PDDIKTIError, APIConnectionError, APITimeoutError, 
-    APIRateLimitError, APIResponseError, ValidationError
+    APIRateLimitError, APIResponseError, ValidationError, CircuitOpenError
 )
 
 # Type variables for better type hinting
@@ -12,9 +27,89 @@ T = TypeVar('T')
 APIResponse = Optional[Union[Dict[str, Any], str]]
 APIMethod = Callable[..., APIResponse]
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _validate_call_args(args: Tuple[Any, ...]) -> None:
+    """Reject empty string positional parameters (everything after ``self``)."""
+    if len(args) > 1:  # Has parameters beyond self
+        for i, arg in enumerate(args[1:], 1):  # Skip self
+            if isinstance(arg, str) and not arg.strip():
+                raise ValidationError(f"Parameter {i} cannot be empty string")
+
+def _check_response(func_name: str, response: APIResponse) -> APIResponse:
+    """Validate a raw API response, raising on an embedded ``error`` field."""
+    if response is None:
+        logger.warning(f"{func_name}: Received None response")
+        return None
+        
+    if isinstance(response, dict) and response.get("error"):
+        error_msg = response.get("error", "Unknown API error")
+        logger.error(f"{func_name}: API returned error - {error_msg}")
+        raise APIResponseError(f"API error: {error_msg}")
+        
+    return response
+
+def _log_api_error(func_name: str, error: Exception) -> None:
+    """Log an exception swallowed by :func:`handle_errors` at the right level."""
+    if isinstance(error, ValidationError):
+        logger.error(f"{func_name}: Validation error - {error.message}")
+    elif isinstance(error, APITimeoutError):
+        logger.error(f"{func_name}: Timeout error - {error.message}")
+    elif isinstance(error, APIConnectionError):
+        logger.error(f"{func_name}: Connection error - {error.message}")
+    elif isinstance(error, APIRateLimitError):
+        logger.warning(f"{func_name}: Rate limit error - {error.message}")
+    elif isinstance(error, APIResponseError):
+        logger.error(f"{func_name}: Response error - {error.message}")
+    elif isinstance(error, CircuitOpenError):
+        logger.warning(f"{func_name}: Circuit open - {error.message}")
+    elif isinstance(error, PDDIKTIError):
+        logger.error(f"{func_name}: PDDIKTI API error - {error.message}")
+    else:
+        logger.error(f"{func_name}: Unexpected error - {str(error)}", exc_info=error)
+
+def _client_stats(stats: Union[bool, ClientStats], events: EventHooks) -> Optional[ClientStats]:
+    """The statistics a client keeps (see ``api(stats=...)``), subscribed to its events."""
+    if stats is False:
+        return None
+    if stats is True:
+        stats = ClientStats()
+    stats.attach(events)
+    return stats
+
+def _listening(args: Tuple[Any, ...]) -> Optional[EventHooks]:
+    """The calling client's event hooks, if anyone subscribed (``args[0]`` is the client)."""
+    events = getattr(args[0], "events", None) if args else None
+    return events if events is not None and events.active else None
+
+class _UnwrappedCall:
+    """Reports a call whose errors propagate (see :meth:`api._call_unwrapped`)
+    as a :class:`CallEvent`, if anyone listens."""
+    __slots__ = ("events", "method", "ok", "_started", "_token")
+
+    def __init__(self, events: Optional[EventHooks], method: str) -> None:
+        self.events = events
+        self.method = method
+        self.ok = False
+
+    def __enter__(self) -> '_UnwrappedCall':
+        if self.events is not None:
+            self._started = time.perf_counter()
+            self._token = calling_method.set(self.method)
+        return self
+
+    def done(self, response: APIResponse) -> APIResponse:
+        self.ok = response is not None
+        return response
+
+    def __exit__(self, exc_type: Optional[type], exc: Optional[BaseException],
+                 tb: Optional[Any]) -> None:
+        if self.events is not None:
+            calling_method.reset(self._token)
+            error = exc if isinstance(exc, Exception) else None
+            self.events.emit(CallEvent(self.method, time.perf_counter() - self._started,
+                                       self.ok and exc is None, error))
+
 def handle_errors(func: APIMethod) -> APIMethod:
     """Decorator to handle errors for API calls with comprehensive error categorization.
     
@@ -33,70 +128,123 @@ def handle_errors(func: APIMethod) -> APIMethod:
     Note:
         This decorator automatically validates string parameters to ensure 
         they are not empty and handles various API-specific exceptions.
+        
+        Every wrapped method also accepts ``budget`` (seconds) and
+        ``deadline`` (a ``time.monotonic()`` instant) keyword arguments;
+        request timeouts and retries are then bounded by the time left.
+        
+        When the client's :attr:`events` have subscribers, every call emits
+        a :class:`~pddiktipy.events.CallEvent`.
     """
     @wraps(func)
-    def wrapper(*args: Any, **kwargs: Any) -> APIResponse:
+    def wrapper(*args: Any, budget: Optional[float] = None, deadline: Optional[float] = None,
+                **kwargs: Any) -> APIResponse:
         func_name = getattr(func, '__name__', 'unknown_function')
+        events = _listening(args)
+        if events is not None:
+            started = time.perf_counter()
+            token = calling_method.set(func_name)
+        error: Optional[Exception] = None
         
         try:
-            # Input validation for common parameters
-            if len(args) > 1:  # Has parameters beyond self
-                for i, arg in enumerate(args[1:], 1):  # Skip self
-                    if isinstance(arg, str) and not arg.strip():
-                        raise ValidationError(f"Parameter {i} cannot be empty string")
-            
-            response = func(*args, **kwargs)
-            
-            # Additional response validation
-            if response is None:
-                logger.warning(f"{func_name}: Received None response")
-                return None
-                
-            if isinstance(response, dict) and response.get("error"):
-                error_msg = response.get("error", "Unknown API error")
-                logger.error(f"{func_name}: API returned error - {error_msg}")
-                raise APIResponseError(f"API error: {error_msg}")
-                
-            return response
-            
-        except ValidationError as e:
-            logger.error(f"{func_name}: Validation error - {e.message}")
-            return None
-            
-        except APITimeoutError as e:
-            logger.error(f"{func_name}: Timeout error - {e.message}")
-            return None
-            
-        except APIConnectionError as e:
-            logger.error(f"{func_name}: Connection error - {e.message}")
-            return None
-            
-        except APIRateLimitError as e:
-            logger.warning(f"{func_name}: Rate limit error - {e.message}")
-            return None
-            
-        except APIResponseError as e:
-            logger.error(f"{func_name}: Response error - {e.message}")
-            return None
-            
-        except PDDIKTIError as e:
-            logger.error(f"{func_name}: PDDIKTI API error - {e.message}")
-            return None
+            with deadline_scope(budget, deadline):
+                # Input validation for common parameters
+                _validate_call_args(args)
+                response = func(*args, **kwargs)
+                response = _check_response(func_name, response)
             
         except Exception as e:
-            logger.error(f"{func_name}: Unexpected error - {str(e)}", exc_info=True)
-            return None
+            _log_api_error(func_name, e)
+            response, error = None, e
+        
+        finally:
+            if events is not None:
+                calling_method.reset(token)
+        
+        if events is not None:
+            events.emit(CallEvent(func_name, time.perf_counter() - started,
+                                  response is not None, error))
+        return response
             
     return wrapper
 
 class api:
-    def __init__(self) -> None:
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10,
+                 base_url: Optional[str] = None, coalesce: bool = True,
+                 cache: Optional[DiskCache] = None,
+                 rate_limit: Optional[Union[float, RateLimiter]] = None,
+                 retry: Optional[RetryPolicy] = None,
+                 circuit_breakers: Union[bool, CircuitBreakers] = True,
+                 hedge: Optional[HedgePolicy] = None,
+                 transport: Optional[Transport] = None,
+                 events: Optional[EventHooks] = None,
+                 stats: Union[bool, ClientStats] = False,
+                 adaptive_timeouts: Optional[AdaptiveTimeouts] = None) -> None:
         """Initialize the PDDIKTI API client.
         
         Creates a new instance of the PDDIKTI API client with all necessary
         components including the helper class for HTTP operations, API endpoint
         configuration, and logging setup.
         
+        Args:
+            pool_connections: Number of host connection pools kept by the
+                underlying ``HTTPAdapter``. Defaults to 10.
+            pool_maxsize: Maximum number of keep-alive connections kept per
+                host pool. Defaults to 10.
+            base_url: Optional upstream base URL overriding the official
+                PDDIKTI host, e.g. a local stand-in server for testing.
+            coalesce: Share one upstream request between identical concurrent
+                calls in this process (singleflight). Defaults to True.
+            cache: Optional :class:`~pddiktipy.disk_cache.DiskCache` storing
+                responses on disk, so repeated runs and restarts read from
+                disk instead of the network. Defaults to None (disabled).
+            rate_limit: Maximum requests per second, or a
+                :class:`~pddiktipy.ratelimit.RateLimiter` shared with other
+                clients. The rate halves on HTTP 429 (pausing for
+                ``Retry-After``) and recovers while responses are healthy.
+                Defaults to None (unlimited).
+            retry: :class:`~pddiktipy.retry.RetryPolicy` applied to every
+                upstream request: capped attempts within a total deadline,
+                jittered backoff, and only transient errors (timeouts,
+                connection errors, 429, 5xx) retried. Defaults to
+                :data:`~pddiktipy.retry.DEFAULT_RETRY`.
+            circuit_breakers: Per endpoint family circuit breakers. After
+                repeated timeouts, connection errors or 5xx on one family
+                (e.g. ``detail/pt``), its calls fail fast with
+                :class:`CircuitOpenError` until a probe succeeds. True
+                (default) shares the process-wide registry; pass a
+                :class:`~pddiktipy.circuit.CircuitBreakers` to tune it or
+                False to disable.
+            hedge: Optional :class:`~pddiktipy.hedging.HedgePolicy`. When
+                set, a GET slower than a percentile of recent latency is
+                duplicated and the first response wins, within a cap on
+                extra load. Defaults to None (disabled).
+            transport: Optional :class:`~pddiktipy.transport.Transport`
+                sending the HTTP requests, e.g. a
+                :class:`~pddiktipy.transport.MemoryTransport` or a recording
+                :class:`~pddiktipy.transport.CassetteTransport` for offline
+                tests and benchmarks. Defaults to a pooled ``requests``
+                session, which the client closes; a supplied transport is
+                left open for its owner.
+            events: Optional :class:`~pddiktipy.events.EventHooks` to share
+                with other clients. Subscribers receive a
+                :class:`~pddiktipy.events.RequestEvent` per upstream request
+                (family, status, timings, size, attempts, cache outcome) and
+                a :class:`~pddiktipy.events.CallEvent` per method call.
+                Defaults to new hooks of this client, see :attr:`events`.
+            stats: Keep per-method latency and error statistics, see
+                :meth:`stats`. True gives the client its own
+                :class:`~pddiktipy.stats.ClientStats`; pass one to share it
+                between clients with shared ``events``. Off by default:
+                statistics subscribe to ``events``, so every call then
+                builds its events (roughly 10-20 µs).
+            adaptive_timeouts: Optional
+                :class:`~pddiktipy.timeouts.AdaptiveTimeouts` learning
+                connect and read timeouts per endpoint family from recent
+                latency, within a floor and a ceiling, so a stalled upstream
+                is cut off after seconds instead of the full ``timeout``.
+                Defaults to None (static timeouts).
+        
         Raises:
             PDDIKTIError: If the API client initialization fails due to 
                          configuration issues or network problems.
@@ -108,8 +256,24 @@ class api:
             ...     result = client.search_mahasiswa("John")
         """
         try:
-            self.H: helper = helper()
+            self.H: helper = helper(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                base_url=base_url,
+                coalesce=coalesce,
+                cache=cache,
+                rate_limit=rate_limit,
+                retry=retry,
+                circuit_breakers=circuit_breakers,
+                hedge=hedge,
+                transport=transport,
+                events=events,
+                adaptive_timeouts=adaptive_timeouts
+            )
+            self.events: EventHooks = self.H.events
+            self._stats: Optional[ClientStats] = _client_stats(stats, self.events)
             self.api_link: str = self.H.endpoint()
+            self._urls = compile_endpoints(self.api_link)
             self.logger: logging.Logger = logging.getLogger(__name__)
             self.logger.info("PDDIKTI API client initialized successfully")
             
@@ -159,6 +323,35 @@ class api:
         except Exception as e:
             self.logger.error(f"Error closing API client: {e}")
     
+    def stats(self, reset: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Latency and error statistics per endpoint method.
+        
+        Every method called so far is reported with its number of calls,
+        latency quantiles in seconds (``p50``, ``p95``, ``p99``, within 1%),
+        ``mean`` and ``max``, the upstream ``requests`` and ``retries`` it
+        issued, the response ``bytes`` it received and its swallowed
+        ``errors`` by exception type.
+        
+        Args:
+            reset: Clear the statistics after reading them.
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Statistics keyed by method name, or
+            an empty dict unless the client was created with ``stats``.
+            
+        Example:
+            >>> client = api(stats=True)
+            >>> client.search_pt("Gadjah Mada")
+            >>> client.stats()["search_pt"]
+            {'count': 1, 'p50': 0.21, 'p95': 0.21, 'p99': 0.21, ...}
+        """
+        if self._stats is None:
+            return {}
+        report = self._stats.snapshot()
+        if reset:
+            self._stats.reset()
+        return report
+    
     def _validate_keyword(self, keyword: str, max_length: int = 100) -> None:
         """Validate search keyword parameters.
         
@@ -331,12 +524,50 @@ class api:
                 full_path = path
                 
             endpoint: str = f"{self.api_link}/{full_path}"
-            self.logger.debug(f"Built endpoint: {endpoint}")
+            self.logger.debug("Built endpoint: %s", endpoint)
             return endpoint
             
         except Exception as e:
             raise ValidationError(f"Error building endpoint: {str(e)}")
 
+    def _url(self, method_name: str, *args: Union[str, int]) -> str:
+        """Build the URL of an endpoint method from :data:`~pddiktipy.endpoints.ENDPOINTS`.
+        
+        The templates are compiled once per base URL, so this only encodes
+        the arguments and fills them in.
+        
+        Args:
+            method_name: Name of the endpoint method, e.g. "get_prodi_pt".
+            *args: The method's URL arguments, in template order.
+            
+        Returns:
+            str: Complete endpoint URL.
+            
+        Example:
+            >>> self._url("get_prodi_pt", "abc123", 20241)
+            'https://api-pddikti.kemdiktisaintek.go.id/pt/prodi/abc123/20241'
+        """
+        return self._urls.url(method_name, *map(self.H.parse, args))
+
+    def _call_unwrapped(self, method_name: str, *args: Union[str, int]) -> APIResponse:
+        """Call an endpoint method without the ``handle_errors`` wrapper.
+        
+        Performs the same argument and response checks as :func:`handle_errors`
+        but lets exceptions propagate, so composite calls can report why a
+        section failed instead of receiving a bare None.
+        
+        Args:
+            method_name: Name of a public endpoint method, e.g. "get_detail_pt".
+            *args: Positional arguments for the method.
+            
+        Returns:
+            APIResponse: The raw method result.
+        """
+        func = getattr(type(self), method_name).__wrapped__
+        with _UnwrappedCall(_listening((self,)), method_name) as call:
+            _validate_call_args((self,) + args)
+            return call.done(_check_response(method_name, func(self, *args)))
+
     # Search
     @handle_errors
     def search_all(self, keyword: str) -> Optional[Dict[str, Any]]:
@@ -383,7 +614,7 @@ class api:
             responses due to a typo in the original API endpoint.
         """
         self._validate_keyword(keyword)
-        endpoint: str = self._build_endpoint("pencarian/all", keyword)
+        endpoint: str = self._url("search_all", keyword)
         return self.H.response(endpoint)
 
     @handle_errors
@@ -426,7 +657,7 @@ class api:
             - nama_prodi: Study program name
         """
         self._validate_keyword(keyword)
-        endpoint: str = self._build_endpoint("pencarian/mhs", keyword)
+        endpoint: str = self._url("search_mahasiswa", keyword)
         return self.H.response(endpoint)
 
     @handle_errors
@@ -469,7 +700,7 @@ class api:
             - nama_prodi: Study program name
         """
         self._validate_keyword(keyword)
-        endpoint: str = self._build_endpoint("pencarian/dosen", keyword)
+        endpoint: str = self._url("search_dosen", keyword)
         return self.H.response(endpoint)
 
     @handle_errors
@@ -510,7 +741,7 @@ class api:
             - nama: Full university name
         """
         self._validate_keyword(keyword)
-        endpoint: str = self._build_endpoint("pencarian/pt", keyword)
+        endpoint: str = self._url("search_pt", keyword)
         return self.H.response(endpoint)
 
     @handle_errors
@@ -552,7 +783,7 @@ class api:
             - pt_singkat: University abbreviation
         """
         self._validate_keyword(keyword)
-        endpoint: str = self._build_endpoint("pencarian/prodi", keyword)
+        endpoint: str = self._url("search_prodi", keyword)
         return self.H.response(endpoint)
 
     # Data Mahasiswa
@@ -606,7 +837,7 @@ class api:
             - tahun_masuk: Year of enrollment
         """
         self._validate_id(mahasiswa_id, "Mahasiswa ID")
-        endpoint = self._build_endpoint("detail/mhs", mahasiswa_id)
+        endpoint = self._url("get_detail_mhs", mahasiswa_id)
         return self.H.response(endpoint)
 
     # Data Dosen
@@ -659,7 +890,7 @@ class api:
             - status_aktivitas: Current activity status
         """
         self._validate_id(dosen_id, "Dosen ID")
-        endpoint: str = self._build_endpoint("dosen/profile", dosen_id)
+        endpoint: str = self._url("get_dosen_profile", dosen_id)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -683,7 +914,7 @@ class api:
             ValidationError: If dosen_id is invalid
         """
         self._validate_id(dosen_id, "Dosen ID")
-        endpoint: str = self._build_endpoint("dosen/portofolio/penelitian", dosen_id)
+        endpoint: str = self._url("get_dosen_penelitian", dosen_id)
         return self.H.response(endpoint)
 
     @handle_errors
@@ -707,7 +938,7 @@ class api:
             ValidationError: If dosen_id is invalid
         """
         self._validate_id(dosen_id, "Dosen ID")
-        endpoint: str = self._build_endpoint("dosen/portofolio/pengabdian", dosen_id)
+        endpoint: str = self._url("get_dosen_pengabdian", dosen_id)
         return self.H.response(endpoint)
 
     @handle_errors
@@ -731,7 +962,7 @@ class api:
             ValidationError: If dosen_id is invalid
         """
         self._validate_id(dosen_id, "Dosen ID")
-        endpoint: str = self._build_endpoint("dosen/portofolio/karya", dosen_id)
+        endpoint: str = self._url("get_dosen_karya", dosen_id)
         return self.H.response(endpoint)
 
     @handle_errors
@@ -755,7 +986,7 @@ class api:
             ValidationError: If dosen_id is invalid
         """
         self._validate_id(dosen_id, "Dosen ID")
-        endpoint: str = self._build_endpoint("dosen/portofolio/paten", dosen_id)
+        endpoint: str = self._url("get_dosen_paten", dosen_id)
         return self.H.response(endpoint)
 
     @handle_errors
@@ -773,7 +1004,7 @@ class api:
             ValidationError: If dosen_id is invalid
         """
         self._validate_id(dosen_id, "Dosen ID")
-        endpoint: str = self._build_endpoint("dosen/study-history", dosen_id)
+        endpoint: str = self._url("get_dosen_study_history", dosen_id)
         return self.H.response(endpoint)
 
     @handle_errors
@@ -797,7 +1028,7 @@ class api:
             ValidationError: If dosen_id is invalid
         """
         self._validate_id(dosen_id, "Dosen ID")
-        endpoint: str = self._build_endpoint("dosen/teaching-history", dosen_id)
+        endpoint: str = self._url("get_dosen_teaching_history", dosen_id)
         return self.H.response(endpoint)
 
     # Data Universities
@@ -822,7 +1053,7 @@ class api:
             ValidationError: If pt_id is invalid
         """
         self._validate_id(pt_id, "PT ID")
-        endpoint: str = self._build_endpoint("detail/pt", pt_id)
+        endpoint: str = self._url("get_detail_pt", pt_id)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -885,7 +1116,7 @@ class api:
         """
         self._validate_id(pt_id, "PT ID")
         self._validate_semester(tahun, "Academic semester")
-        endpoint: str = self._build_endpoint("pt/prodi", pt_id, tahun)
+        endpoint: str = self._url("get_prodi_pt", pt_id, tahun)
         return self.H.response(endpoint)
 
     @handle_errors
@@ -906,7 +1137,7 @@ class api:
             ValidationError: If pt_id is invalid
         """
         self._validate_id(pt_id, "PT ID")
-        url: str = f"{self.H.endpoint()}/pt/logo/{self.H.parse(pt_id)}"
+        url: str = self._url("get_logo_pt", pt_id)
         return self.H.fetch_image_as_base64(url)
 
     @handle_errors
@@ -930,7 +1161,7 @@ class api:
             ValidationError: If pt_id is invalid
         """
         self._validate_id(pt_id, "PT ID")
-        endpoint: str = self._build_endpoint("pt/rasio", pt_id)
+        endpoint: str = self._url("get_rasio_pt", pt_id)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -954,7 +1185,7 @@ class api:
             ValidationError: If pt_id is invalid
         """
         self._validate_id(pt_id, "PT ID")
-        endpoint: str = self._build_endpoint("pt/mahasiswa", pt_id)
+        endpoint: str = self._url("get_mahasiswa_pt", pt_id)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -974,7 +1205,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/pt/waktu-studi/{self.H.parse(pt_id)}"
+        endpoint = self._url("get_waktu_studi_pt", pt_id)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -995,7 +1226,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/pt/name-histories/{self.H.parse(pt_id)}"
+        endpoint = self._url("get_name_histories_pt", pt_id)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -1015,7 +1246,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/pt/cost-range/{self.H.parse(pt_id)}"
+        endpoint = self._url("get_cost_range_pt", pt_id)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -1035,7 +1266,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/pt/graduation-rate/{self.H.parse(pt_id)}"
+        endpoint = self._url("get_graduation_rate_pt", pt_id)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -1055,7 +1286,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/pt/jumlah-prodi/{self.H.parse(pt_id)}"
+        endpoint = self._url("get_jumlah_prodi_pt", pt_id)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -1075,7 +1306,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/pt/jumlah-mahasiswa/{self.H.parse(pt_id)}"
+        endpoint = self._url("get_jumlah_mahasiswa_pt", pt_id)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -1095,7 +1326,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/pt/jumlah-dosen/{self.H.parse(pt_id)}"
+        endpoint = self._url("get_jumlah_dosen_pt", pt_id)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -1115,7 +1346,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/pt/sarpras-file-name/{self.H.parse(pt_id)}"
+        endpoint = self._url("get_sarpras_file_name_pt", pt_id)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -1135,7 +1366,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/pt/sarpras-blob/{self.H.parse(pt_id)}"
+        endpoint = self._url("get_sarpras_blob_pt", pt_id)
         return self.H.response(endpoint)
     
     # Data Study Programs
@@ -1156,7 +1387,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/prodi/detail/{self.H.parse(prodi_id)}"
+        endpoint = self._url("get_detail_prodi", prodi_id)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -1176,7 +1407,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/prodi/desc/{self.H.parse(prodi_id)}"
+        endpoint = self._url("get_desc_prodi", prodi_id)
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1196,7 +1427,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/prodi/name-histories/{self.H.parse(prodi_id)}"
+        endpoint = self._url("get_name_histories_prodi", prodi_id)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -1216,7 +1447,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/prodi/num-students-lecturers/{self.H.parse(prodi_id)}"
+        endpoint = self._url("get_num_students_lecturers_prodi", prodi_id)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -1236,7 +1467,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/prodi/cost-range/{self.H.parse(prodi_id)}"
+        endpoint = self._url("get_cost_range_prodi", prodi_id)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -1256,7 +1487,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/prodi/daya-tampung/{self.H.parse(prodi_id)}"
+        endpoint = self._url("get_daya_tampung_prodi", prodi_id)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -1276,7 +1507,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/prodi/rasio-dosen-mahasiswa/{self.H.parse(prodi_id)}"
+        endpoint = self._url("get_rasio_dosen_mahasiswa_prodi", prodi_id)
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1296,7 +1527,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/prodi/graduation-rate/{self.H.parse(prodi_id)}"
+        endpoint = self._url("get_graduation_rate_prodi", prodi_id)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -1313,7 +1544,7 @@ class api:
         Returns:
             Optional[str]: Base64-encoded image or None if an error occurs.
         """
-        url = f"{self.H.endpoint()}/prodi/logo-pt/{self.H.parse(pt_id)}"
+        url = self._url("get_logo_prodi", pt_id)
         return self.H.fetch_image_as_base64(url)
 
     @handle_errors
@@ -1337,7 +1568,7 @@ class api:
         """
         self._validate_id(prodi_id, "Prodi ID")
         self._validate_semester(tahun, "Academic semester")
-        endpoint = f"{self.api_link}/dosen/homebase/{self.H.parse(prodi_id)}?semester={self.H.parse(tahun)}"
+        endpoint = self._url("get_homebase_prodi", prodi_id, tahun)
         return self.H.response(endpoint)
     
     @handle_errors
@@ -1361,7 +1592,7 @@ class api:
         """
         self._validate_id(prodi_id, "Prodi ID")
         self._validate_semester(tahun, "Academic semester")
-        endpoint = f"{self.api_link}/dosen/penghitung-ratio/{self.H.parse(prodi_id)}?semester={self.H.parse(tahun)}"
+        endpoint = self._url("get_penghitung_ratio_prodi", prodi_id, tahun)
         return self.H.response(endpoint)
 
     # Data Count
@@ -1376,7 +1607,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/dosen/count-active"
+        endpoint = self._url("get_dosen_count_active")
         return self.H.response(endpoint)
     
     @handle_errors    
@@ -1390,7 +1621,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/mahasiswa/count-active"
+        endpoint = self._url("get_mahasiswa_count_active")
         return self.H.response(endpoint)
     
     @handle_errors    
@@ -1404,7 +1635,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/prodi/count"
+        endpoint = self._url("get_prodi_count")
         return self.H.response(endpoint)
     
     @handle_errors    
@@ -1418,7 +1649,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/pt/count"
+        endpoint = self._url("get_pt_count")
         return self.H.response(endpoint)
 
     # Data Visualizations
@@ -1433,7 +1664,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/visualisasi/dosen-keaktifan"
+        endpoint = self._url("get_data_dosen_keaktifan")
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1447,7 +1678,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/visualisasi/dosen-bidang"
+        endpoint = self._url("get_data_dosen_bidang")
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1461,7 +1692,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/visualisasi/dosen-jenis-kelamin"
+        endpoint = self._url("get_data_dosen_jenis_kelamin")
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1475,7 +1706,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/visualisasi/dosen-jenjang"
+        endpoint = self._url("get_data_dosen_jenjang")
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1489,7 +1720,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/visualisasi/dosen-ikatan"
+        endpoint = self._url("get_data_dosen_ikatan")
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1503,7 +1734,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/visualisasi/mahasiswa-bidang"
+        endpoint = self._url("get_data_mahasiswa_bidang")
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1517,7 +1748,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/visualisasi/mahasiswa-jenis-kelamin"
+        endpoint = self._url("get_data_mahasiswa_jenis_kelamin")
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1531,7 +1762,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/visualisasi/mahasiswa-jenjang"
+        endpoint = self._url("get_data_mahasiswa_jenjang")
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1545,7 +1776,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/visualisasi/mahasiswa-kelompok-lembaga"
+        endpoint = self._url("get_data_mahasiswa_kelompok_lembaga")
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1559,7 +1790,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/visualisasi/mahasiswa-status"
+        endpoint = self._url("get_data_mahasiswa_status")
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1573,7 +1804,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/visualisasi/pt-bentuk"
+        endpoint = self._url("get_data_pt_bentuk")
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1587,7 +1818,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/visualisasi/pt-akreditasi"
+        endpoint = self._url("get_data_pt_akreditasi")
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1601,7 +1832,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/visualisasi/pt-kelompok-pembina"
+        endpoint = self._url("get_data_pt_kelompok_pembina")
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1615,7 +1846,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/visualisasi/pt-provinsi"
+        endpoint = self._url("get_data_pt_provinsi")
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1629,7 +1860,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/visualisasi/prodi-jenjang"
+        endpoint = self._url("get_data_prodi_jenjang")
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1643,7 +1874,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/visualisasi/prodi-akreditasi"
+        endpoint = self._url("get_data_prodi_akreditasi")
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1657,7 +1888,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/visualisasi/prodi-bidang-ilmu"
+        endpoint = self._url("get_data_prodi_bidang_ilmu")
         return self.H.response(endpoint)
 
     @handle_errors
@@ -1671,7 +1902,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/visualisasi/prodi-kelompok-pembina"
+        endpoint = self._url("get_data_prodi_kelompok_pembina")
         return self.H.response(endpoint)
 
     # Contributor Information
@@ -1686,7 +1917,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/contributor/contributor"
+        endpoint = self._url("get_contributor")
         return self.H.response(endpoint)
 
     # News
@@ -1698,7 +1929,7 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/news/list"
+        endpoint = self._url("get_news")
         return self.H.response(endpoint)
 
     # Get Data
@@ -1710,5 +1941,245 @@ class api:
         Returns:
             Optional[Dict[str, Any]]: JSON response or None if an error occurs.
         """
-        endpoint = f"{self.api_link}/prodi/bidang-ilmu"
+        endpoint = self._url("get_bidang_ilmu_prodi")
         return self.H.response(endpoint)
+
+    # Composite Profiles
+    def _composite(self,
+                   calls: Dict[str, Tuple[str, Tuple[Any, ...]]],
+                   max_workers: int,
+                   timeout: Optional[float],
+                   result_type: Type[CompositeResult] = CompositeResult,
+                   deadline: Optional[float] = None) -> CompositeResult:
+        """Run composite sections (name -> (method name, arguments)) concurrently.
+
+        ``timeout`` and ``deadline`` also bound every section's upstream
+        requests, so no worker keeps waiting after the result is returned.
+        """
+        with deadline_scope(timeout, deadline):
+            return run_sections(
+                {name: partial(self._call_unwrapped, method, *args)
+                 for name, (method, args) in calls.items()},
+                max_workers=max_workers,
+                timeout=timeout,
+                result_type=result_type
+            )
+
+    def _pt_profile_calls(self, pt_id: str,
+                          semester: Optional[Union[int, str]]) -> Dict[str, Tuple[str, Tuple[Any, ...]]]:
+        """Validate input and list the sections of a university profile."""
+        self._validate_id(pt_id, "PT ID")
+        semester = current_semester() if semester is None else semester
+        self._validate_semester(semester, "Academic semester")
+        return {
+            "detail": ("get_detail_pt", (pt_id,)),
+            "rasio": ("get_rasio_pt", (pt_id,)),
+            "mahasiswa": ("get_mahasiswa_pt", (pt_id,)),
+            "waktu_studi": ("get_waktu_studi_pt", (pt_id,)),
+            "name_histories": ("get_name_histories_pt", (pt_id,)),
+            "cost_range": ("get_cost_range_pt", (pt_id,)),
+            "graduation_rate": ("get_graduation_rate_pt", (pt_id,)),
+            "jumlah_prodi": ("get_jumlah_prodi_pt", (pt_id,)),
+            "jumlah_mahasiswa": ("get_jumlah_mahasiswa_pt", (pt_id,)),
+            "jumlah_dosen": ("get_jumlah_dosen_pt", (pt_id,)),
+            "logo": ("get_logo_pt", (pt_id,)),
+            "prodi": ("get_prodi_pt", (pt_id, semester)),
+        }
+
+    def _prodi_profile_calls(self, prodi_id: str,
+                             semester: Optional[Union[int, str]]) -> Dict[str, Tuple[str, Tuple[Any, ...]]]:
+        """Validate input and list the sections of a study program profile."""
+        self._validate_id(prodi_id, "Prodi ID")
+        semester = current_semester() if semester is None else semester
+        self._validate_semester(semester, "Academic semester")
+        return {
+            "detail": ("get_detail_prodi", (prodi_id,)),
+            "desc": ("get_desc_prodi", (prodi_id,)),
+            "name_histories": ("get_name_histories_prodi", (prodi_id,)),
+            "num_students_lecturers": ("get_num_students_lecturers_prodi", (prodi_id,)),
+            "cost_range": ("get_cost_range_prodi", (prodi_id,)),
+            "daya_tampung": ("get_daya_tampung_prodi", (prodi_id,)),
+            "rasio_dosen_mahasiswa": ("get_rasio_dosen_mahasiswa_prodi", (prodi_id,)),
+            "graduation_rate": ("get_graduation_rate_prodi", (prodi_id,)),
+            "homebase": ("get_homebase_prodi", (prodi_id, semester)),
+            "penghitung_ratio": ("get_penghitung_ratio_prodi", (prodi_id, semester)),
+        }
+
+    def _dosen_portfolio_calls(self, dosen_id: str) -> Dict[str, Tuple[str, Tuple[Any, ...]]]:
+        """Validate input and list the sections of a lecturer portfolio."""
+        self._validate_id(dosen_id, "Dosen ID")
+        return {
+            "profile": ("get_dosen_profile", (dosen_id,)),
+            "penelitian": ("get_dosen_penelitian", (dosen_id,)),
+            "pengabdian": ("get_dosen_pengabdian", (dosen_id,)),
+            "karya": ("get_dosen_karya", (dosen_id,)),
+            "paten": ("get_dosen_paten", (dosen_id,)),
+            "study_history": ("get_dosen_study_history", (dosen_id,)),
+            "teaching_history": ("get_dosen_teaching_history", (dosen_id,)),
+        }
+
+    def get_pt_full_profile(self,
+                            pt_id: str,
+                            semester: Optional[Union[int, str]] = None,
+                            max_workers: int = 8,
+                            timeout: Optional[float] = 10.0,
+                            deadline: Optional[float] = None) -> Optional[CompositeResult]:
+        """Fetch every per-university endpoint concurrently.
+        
+        Runs get_detail_pt, get_rasio_pt, get_mahasiswa_pt, get_waktu_studi_pt,
+        get_name_histories_pt, get_cost_range_pt, get_graduation_rate_pt,
+        get_jumlah_prodi_pt, get_jumlah_mahasiswa_pt, get_jumlah_dosen_pt,
+        get_logo_pt and get_prodi_pt on a bounded thread pool, so the total
+        latency is that of the slowest endpoint instead of their sum.
+        
+        Args:
+            pt_id: The university's ID.
+            semester: Academic semester in YYYYS format for the study program
+                list. Defaults to the current semester.
+            max_workers: Maximum number of concurrent upstream requests.
+            timeout: Overall deadline in seconds. Sections still running when it
+                expires are reported with status "timeout".
+            deadline: Absolute ``time.monotonic()`` instant the whole call must
+                finish by, e.g. inherited from an incoming request.
+        
+        Returns:
+            Optional[CompositeResult]: Merged result with one section per endpoint
+                ("detail", "rasio", "mahasiswa", "waktu_studi", "name_histories",
+                "cost_range", "graduation_rate", "jumlah_prodi", "jumlah_mahasiswa",
+                "jumlah_dosen", "logo", "prodi"), each carrying its own status,
+                or None if the input is invalid.
+        
+        Example:
+            >>> with api() as client:
+            ...     profile = client.get_pt_full_profile(pt_id, 20241)
+            ...     print(profile["detail"]["nama_pt"], profile.failed.keys())
+        """
+        try:
+            calls = self._pt_profile_calls(pt_id, semester)
+        except ValidationError as e:
+            _log_api_error("get_pt_full_profile", e)
+            return None
+        return self._composite(calls, max_workers, timeout, deadline=deadline)
+
+    def get_prodi_full_profile(self,
+                               prodi_id: str,
+                               semester: Optional[Union[int, str]] = None,
+                               max_workers: int = 8,
+                               timeout: Optional[float] = 10.0,
+                               deadline: Optional[float] = None) -> Optional[CompositeResult]:
+        """Fetch every per-study-program endpoint concurrently.
+        
+        Runs get_detail_prodi, get_desc_prodi, get_name_histories_prodi,
+        get_num_students_lecturers_prodi, get_cost_range_prodi,
+        get_daya_tampung_prodi, get_rasio_dosen_mahasiswa_prodi,
+        get_graduation_rate_prodi, get_homebase_prodi and
+        get_penghitung_ratio_prodi on a bounded thread pool.
+        
+        Args:
+            prodi_id: The study program's ID.
+            semester: Academic semester in YYYYS format for the homebase and
+                ratio counters. Defaults to the current semester.
+            max_workers: Maximum number of concurrent upstream requests.
+            timeout: Overall deadline in seconds.
+            deadline: Absolute ``time.monotonic()`` instant the whole call must
+                finish by.
+        
+        Returns:
+            Optional[CompositeResult]: Merged result with the sections "detail",
+                "desc", "name_histories", "num_students_lecturers", "cost_range",
+                "daya_tampung", "rasio_dosen_mahasiswa", "graduation_rate",
+                "homebase" and "penghitung_ratio", or None if the input is invalid.
+        
+        Example:
+            >>> with api() as client:
+            ...     profile = client.get_prodi_full_profile(prodi_id, 20241)
+            ...     print(profile.to_dict()["status"])
+        """
+        try:
+            calls = self._prodi_profile_calls(prodi_id, semester)
+        except ValidationError as e:
+            _log_api_error("get_prodi_full_profile", e)
+            return None
+        return self._composite(calls, max_workers, timeout, deadline=deadline)
+
+    def get_dosen_portfolio(self,
+                            dosen_id: str,
+                            max_workers: int = 7,
+                            timeout: Optional[float] = 10.0,
+                            deadline: Optional[float] = None) -> Optional[DosenPortfolio]:
+        """Fetch a lecturer's profile and complete portfolio concurrently.
+        
+        Issues get_dosen_profile, get_dosen_penelitian, get_dosen_pengabdian,
+        get_dosen_karya, get_dosen_paten, get_dosen_study_history and
+        get_dosen_teaching_history at once instead of seven sequential
+        round trips.
+        
+        Args:
+            dosen_id: The lecturer's ID.
+            max_workers: Maximum number of concurrent upstream requests.
+            timeout: Overall deadline in seconds.
+            deadline: Absolute ``time.monotonic()`` instant the whole call must
+                finish by.
+        
+        Returns:
+            Optional[DosenPortfolio]: Combined result with typed accessors
+                (``profile``, ``penelitian``, ``pengabdian``, ``karya``, ``paten``,
+                ``study_history``, ``teaching_history``) and per-section
+                ``timings``, or None if the input is invalid.
+        
+        Example:
+            >>> with api() as client:
+            ...     portfolio = client.get_dosen_portfolio(dosen_id)
+            ...     print(portfolio.profile["nama_dosen"], len(portfolio.penelitian))
+            ...     print(portfolio.timings)
+        """
+        try:
+            calls = self._dosen_portfolio_calls(dosen_id)
+        except ValidationError as e:
+            _log_api_error("get_dosen_portfolio", e)
+            return None
+        return self._composite(calls, max_workers, timeout, DosenPortfolio, deadline)
+
+    # Bulk Lookups
+    def get_detail_mhs_many(self, mahasiswa_ids: Iterable[str],
+                            concurrency: int = 8) -> Iterator[BulkResult]:
+        """Look up many students concurrently.
+        
+        Streams one :class:`BulkResult` per unique ID as soon as its lookup
+        finishes (completion order, not input order). Failed lookups are
+        reported per item with status "error" and the exception type instead
+        of a bare None.
+        
+        Args:
+            mahasiswa_ids: Student IDs; repeated IDs are fetched only once.
+            concurrency: Maximum number of requests in flight. Keep it at or
+                below ``pool_maxsize`` so every request gets a pooled connection.
+        
+        Returns:
+            Iterator[BulkResult]: Lazily evaluated results; ``result.id`` is the
+                student ID and ``result.data`` the detail payload.
+        
+        Example:
+            >>> with api() as client:
+            ...     for result in client.get_detail_mhs_many(student_ids, concurrency=8):
+            ...         if result.ok:
+            ...             print(result.id, result.data["status_saat_ini"])
+            ...         else:
+            ...             print(result.id, result.status, result.error)
+        """
+        return iter_many(partial(self._call_unwrapped, "get_detail_mhs"), mahasiswa_ids, concurrency)
+
+    def get_dosen_profile_many(self, dosen_ids: Iterable[str],
+                               concurrency: int = 8) -> Iterator[BulkResult]:
+        """Look up many lecturer profiles concurrently.
+        
+        Same semantics as :meth:`get_detail_mhs_many`, for get_dosen_profile.
+        
+        Args:
+            dosen_ids: Lecturer IDs; repeated IDs are fetched only once.
+            concurrency: Maximum number of requests in flight.
+        
+        Returns:
+            Iterator[BulkResult]: Results in completion order.
+        """
+        return iter_many(partial(self._call_unwrapped, "get_dosen_profile"), dosen_ids, concurrency)
@@ -0,0 +1,540 @@
+"""
+Native asyncio client for the PDDIKTI API.
+
+``AsyncApi`` exposes the same 63 methods as :class:`pddiktipy.api.api`, with
+identical validation and exception handling, but every call is a coroutine
+running on a pooled ``httpx.AsyncClient`` (or any other transport, see
+:mod:`pddiktipy.transport`). Install the optional dependency with
+``pip install pddiktipy[async]``.
+"""
+import asyncio
+import importlib.util
+import inspect
+import json
+import logging
+import time
+from functools import partial, wraps
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Coroutine, Dict, Iterable, Optional, Tuple, Type,
+    Union
+)
+
+from .api import api, APIResponse, _UnwrappedCall, _client_stats, _listening, _validate_call_args, _check_response, _log_api_error
+from .helper import helper
+from .disk_cache import CachedResponse, DiskCache
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .circuit import CircuitBreakers
+from .hedging import HedgePolicy
+from .deadline import deadline_scope, remaining
+from .endpoints import compile_endpoints
+from .events import CallEvent, EventHooks, RequestEvent, calling_method
+from .singleflight import AsyncSingleFlight
+from .timeouts import AdaptiveTimeouts
+from .stats import ClientStats
+from .transport import AsyncTransport, HttpxTransport, Transport, TransportResponse
+from .parallel import BulkResult, CompositeResult, DosenPortfolio, iter_many_async, run_sections_async
+from .exceptions import (
+    PDDIKTIError, APIResponseError, APITimeoutError, DeadlineExceededError, ValidationError
+)
+
+logger = logging.getLogger(__name__)
+
+AsyncAPIMethod = Callable[..., Coroutine[Any, Any, APIResponse]]
+
+# Every public endpoint method of the sync client (the ones wrapped by
+# ``handle_errors``). AsyncApi mirrors exactly this list.
+API_METHODS: Tuple[str, ...] = tuple(
+    name for name, attr in vars(api).items()
+    if not name.startswith('_') and callable(attr) and hasattr(attr, '__wrapped__')
+)
+
+
+def handle_errors_async(func: Callable[..., Any]) -> AsyncAPIMethod:
+    """Async counterpart of :func:`pddiktipy.api.handle_errors`.
+
+    The wrapped function may return either a value or an awaitable; the
+    awaitable is resolved inside the same error handling, so validation and
+    transport errors are swallowed into ``None`` exactly like the sync client.
+    """
+    @wraps(func)
+    async def wrapper(*args: Any, budget: Optional[float] = None, deadline: Optional[float] = None,
+                      **kwargs: Any) -> APIResponse:
+        func_name = getattr(func, '__name__', 'unknown_function')
+        events = _listening(args)
+        if events is not None:
+            started = time.perf_counter()
+            token = calling_method.set(func_name)
+        error: Optional[Exception] = None
+
+        try:
+            with deadline_scope(budget, deadline):
+                _validate_call_args(args)
+                response = func(*args, **kwargs)
+                if inspect.isawaitable(response):
+                    response = await response
+                response = _check_response(func_name, response)
+
+        except Exception as e:
+            _log_api_error(func_name, e)
+            response, error = None, e
+
+        finally:
+            if events is not None:
+                calling_method.reset(token)
+
+        if events is not None:
+            events.emit(CallEvent(func_name, time.perf_counter() - started,
+                                  response is not None, error))
+        return response
+
+    return wrapper
+
+
+class AsyncHelper(helper):
+    """HTTP helper backed by a pooled ``httpx.AsyncClient``.
+
+    Shares header construction, URL encoding and status handling with
+    :class:`pddiktipy.helper.helper`; only the transport is asynchronous.
+    Any :class:`AsyncTransport` or sync :class:`Transport` can replace the
+    default :class:`HttpxTransport`.
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 100,
+                 base_url: Optional[str] = None, coalesce: bool = True,
+                 cache: Optional[DiskCache] = None,
+                 rate_limit: Optional[Union[float, RateLimiter]] = None,
+                 retry: Optional[RetryPolicy] = None,
+                 circuit_breakers: Union[bool, CircuitBreakers] = True,
+                 hedge: Optional[HedgePolicy] = None,
+                 transport: Optional[Union[AsyncTransport, Transport]] = None,
+                 events: Optional[EventHooks] = None,
+                 adaptive_timeouts: Optional[AdaptiveTimeouts] = None):
+        # httpx itself is imported by HttpxTransport, on the first request
+        if transport is None and importlib.util.find_spec("httpx") is None:
+            raise ImportError(
+                "AsyncApi requires httpx. Install it with: pip install pddiktipy[async]"
+            )
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                         base_url=base_url, coalesce=False, cache=cache,
+                         rate_limit=rate_limit, retry=retry,
+                         circuit_breakers=circuit_breakers, hedge=hedge,
+                         transport=transport, events=events,
+                         adaptive_timeouts=adaptive_timeouts)
+        self.flights = AsyncSingleFlight() if coalesce else None
+
+    def _default_transport(self) -> AsyncTransport:
+        return HttpxTransport(self.pool_maxsize)
+
+    async def _send(self, url: str, timeout: int,
+                    conditional: Optional[dict] = None) -> TransportResponse:
+        self.logger.debug("Making async request to: %s", url)
+        headers = {**self.headers, **conditional} if conditional else self.headers
+        wait = self._limiter_delay(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        left = remaining()
+        timeouts = self._timeouts(url, timeout)
+        started = time.perf_counter()
+        try:
+            response = self.transport.get(url, headers, timeouts)
+            if inspect.isawaitable(response):
+                response = await response
+        except APITimeoutError as e:
+            if self._deadline_bound(timeouts, left):
+                raise DeadlineExceededError(
+                    "Deadline expired waiting for the upstream", endpoint=url
+                ) from e
+            self._learn_timeout(url, timeouts)
+            raise
+        self._learn_latency(url, started, response)
+        self._throttle_feedback(response.status_code, response.headers)
+        return response
+
+    async def _get(self, url: str, timeout: int,
+                   conditional: Optional[dict] = None) -> TransportResponse:
+        """Async GET coalesced with an identical request already in flight."""
+        if self.flights is None:
+            return await self._guarded(url, timeout, conditional)
+        breaker = self.breakers.get(url) if self.breakers is not None else None
+        if breaker is not None and not breaker.allow():
+            raise breaker.rejection(url)
+        key = (url, tuple(sorted(conditional.items()))) if conditional else url
+        return await self.flights.do(key, self._guarded, url, timeout, conditional)
+
+    async def _timed_send(self, url: str, timeout: int,
+                          conditional: Optional[dict] = None) -> TransportResponse:
+        started = time.perf_counter()
+        response = await self._send(url, timeout, conditional)
+        self.hedge.observe(url, time.perf_counter() - started)
+        return response
+
+    async def _send_hedged(self, url: str, timeout: int,
+                           conditional: Optional[dict] = None) -> TransportResponse:
+        """Async counterpart of :meth:`helper._send_hedged`; the loser is cancelled."""
+        if self.hedge is None:
+            return await self._send(url, timeout, conditional)
+
+        self.hedge.on_request()
+        primary = asyncio.ensure_future(self._timed_send(url, timeout, conditional))
+        done, _ = await asyncio.wait({primary}, timeout=self.hedge.delay(url))
+        if done or not self.hedge.try_hedge():
+            return await primary
+
+        self.logger.debug("Hedging slow async request: %s", url)
+        backup = asyncio.ensure_future(self._timed_send(url, timeout, conditional))
+        pending = {primary, backup}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup:
+                            self.hedge.on_hedge_win()
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _guarded(self, url: str, timeout: int,
+                       conditional: Optional[dict] = None) -> TransportResponse:
+        """Async counterpart of :meth:`helper._guarded`."""
+        if self.breakers is None:
+            return await self._send_hedged(url, timeout, conditional)
+        breaker = self.breakers.get(url)
+        breaker.before_call(url)
+        try:
+            response = await self._send_hedged(url, timeout, conditional)
+        except Exception as e:
+            breaker.record(e)
+            raise
+        breaker.record_status(response.status_code)
+        return response
+
+    async def _run_observed_async(self, event: Optional[RequestEvent],
+                                  run: Callable[[], Awaitable[Any]]) -> Any:
+        """Async counterpart of :meth:`helper._run_observed`."""
+        if event is None:
+            return await run()
+        try:
+            return await run()
+        except Exception as e:
+            event.error = e
+            raise
+        finally:
+            self.events.finish_request(event)
+
+    async def response(self, endpoint: str, timeout: int = 30) -> Optional[dict]:
+        """
+        Sends an async GET request and returns the JSON response.
+
+        Transient failures are retried according to ``self.retry``.
+
+        Args:
+            endpoint: The API endpoint URL
+            timeout: Request timeout in seconds, per attempt
+
+        Raises:
+            APIConnectionError: For connection issues
+            APITimeoutError: For timeout issues
+            APIRateLimitError: For rate limit issues
+            APIResponseError: For invalid responses
+        """
+        if not endpoint:
+            raise ValidationError("Endpoint cannot be empty")
+
+        cached = self._cached(endpoint)
+        event = self.events.start_request(endpoint, self.cache is not None)
+        if cached is not None and cached.fresh:
+            self._record_cache_hit(event, cached)
+            return json.loads(cached.body)
+
+        return await self._run_observed_async(event, lambda: self.retry.run_async(
+            lambda attempt_timeout: self._request_json(endpoint, attempt_timeout, cached, event),
+            timeout
+        ))
+
+    async def _request_json(self, endpoint: str, timeout: float,
+                            cached: Optional[CachedResponse],
+                            event: Optional[RequestEvent] = None) -> Optional[dict]:
+        """One attempt of :meth:`response`."""
+        if event is not None:
+            event.attempts += 1
+        try:
+            response = await self._get(endpoint, timeout, self._conditional_headers(cached))
+            if event is not None:
+                event.observe(response)
+            body = self._revalidated(endpoint, response.status_code, cached, event)
+            if body is not None:
+                return json.loads(body)
+            self._raise_for_status(response.status_code, response.headers, endpoint)
+
+            try:
+                json_data = response.json()
+                self._store(endpoint, response)
+                return json_data
+            except ValueError as e:
+                raise APIResponseError(
+                    f"Invalid JSON response: {str(e)}",
+                    status_code=response.status_code,
+                    endpoint=endpoint
+                )
+
+        except PDDIKTIError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Unexpected error in async response(): {e}")
+            raise APIResponseError(
+                f"Unexpected error: {str(e)}",
+                endpoint=endpoint
+            )
+
+    async def fetch_image_as_base64(self, url: str, timeout: int = 30) -> Optional[str]:
+        """
+        Fetches an image asynchronously and returns it as a base64-encoded string.
+
+        Raises:
+            APIConnectionError: For connection issues
+            APITimeoutError: For timeout issues
+            ValidationError: For invalid input
+        """
+        if not url:
+            raise ValidationError("Image URL cannot be empty")
+
+        cached = self._cached(url)
+        event = self.events.start_request(url, self.cache is not None)
+        if cached is not None and cached.fresh:
+            self._record_cache_hit(event, cached)
+            return self.base64_encode_image(cached.body)
+
+        return await self._run_observed_async(event, lambda: self.retry.run_async(
+            lambda attempt_timeout: self._request_image(url, attempt_timeout, cached, event),
+            timeout
+        ))
+
+    async def _request_image(self, url: str, timeout: float,
+                             cached: Optional[CachedResponse],
+                             event: Optional[RequestEvent] = None) -> Optional[str]:
+        """One attempt of :meth:`fetch_image_as_base64`."""
+        if event is not None:
+            event.attempts += 1
+        try:
+            response = await self._get(url, timeout, self._conditional_headers(cached))
+            if event is not None:
+                event.observe(response)
+            body = self._revalidated(url, response.status_code, cached, event)
+            if body is not None:
+                return self.base64_encode_image(body)
+            self._raise_for_status(response.status_code, response.headers, url)
+
+            content_type = response.headers.get('content-type', '')
+            if not content_type.startswith('image/'):
+                self.logger.warning(f"Unexpected content type: {content_type}")
+
+            self._store(url, response)
+            return self.base64_encode_image(response.content)
+
+        except PDDIKTIError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Unexpected error fetching image: {e}")
+            raise APIResponseError(
+                f"Unexpected error fetching image: {str(e)}",
+                endpoint=url
+            )
+
+    async def aclose(self) -> None:
+        """
+        Close the transport to free pooled connections, if this helper created it.
+        """
+        if self._owns_transport and self._transport is not None:
+            await self._transport.aclose()
+            self.logger.debug("Async transport closed successfully")
+
+
+class AsyncApi:
+    """Asyncio PDDIKTI API client mirroring :class:`pddiktipy.api.api`.
+
+    Every endpoint method has the same name, arguments, validation and
+    return value as the sync client, but must be awaited. One instance can
+    serve many concurrent calls on a single event loop.
+
+    Args:
+        pool_connections: Kept for signature parity with :class:`api`.
+        pool_maxsize: Maximum number of pooled connections. Defaults to 100.
+        base_url: Optional upstream base URL override.
+        coalesce: Share one request between identical concurrent calls.
+        cache: Optional :class:`DiskCache` for persistent response caching.
+        rate_limit: Requests per second, or a shared :class:`RateLimiter`.
+        retry: :class:`RetryPolicy` for transient upstream failures.
+        circuit_breakers: Per endpoint family breakers; True (default) uses
+            the process-wide registry, False disables them.
+        hedge: Optional :class:`HedgePolicy` duplicating slow GETs.
+        transport: Optional :class:`~pddiktipy.transport.AsyncTransport` (or
+            sync :class:`~pddiktipy.transport.Transport`, e.g. a
+            :class:`~pddiktipy.transport.MemoryTransport`) replacing httpx.
+        events: Optional :class:`~pddiktipy.events.EventHooks`, as for
+            :class:`api`.
+        stats: Per-method statistics, as for :class:`api`; see :meth:`stats`.
+        adaptive_timeouts: Optional :class:`~pddiktipy.timeouts.AdaptiveTimeouts`,
+            as for :class:`api`.
+
+    Example:
+        >>> async with AsyncApi() as client:
+        ...     students, lecturers = await asyncio.gather(
+        ...         client.search_mahasiswa("Ahmad"),
+        ...         client.search_dosen("Ahmad"),
+        ...     )
+    """
+
+    # Validation, URL building and statistics are shared verbatim with the sync client.
+    _validate_keyword = api._validate_keyword
+    _validate_year = api._validate_year
+    _validate_semester = api._validate_semester
+    _validate_id = api._validate_id
+    _build_endpoint = api._build_endpoint
+    _url = api._url
+    _pt_profile_calls = api._pt_profile_calls
+    _prodi_profile_calls = api._prodi_profile_calls
+    _dosen_portfolio_calls = api._dosen_portfolio_calls
+    stats = api.stats
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 100,
+                 base_url: Optional[str] = None, coalesce: bool = True,
+                 cache: Optional[DiskCache] = None,
+                 rate_limit: Optional[Union[float, RateLimiter]] = None,
+                 retry: Optional[RetryPolicy] = None,
+                 circuit_breakers: Union[bool, CircuitBreakers] = True,
+                 hedge: Optional[HedgePolicy] = None,
+                 transport: Optional[Union[AsyncTransport, Transport]] = None,
+                 events: Optional[EventHooks] = None,
+                 stats: Union[bool, ClientStats] = False,
+                 adaptive_timeouts: Optional[AdaptiveTimeouts] = None) -> None:
+        self.H: AsyncHelper = AsyncHelper(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            base_url=base_url,
+            coalesce=coalesce,
+            cache=cache,
+            rate_limit=rate_limit,
+            retry=retry,
+            circuit_breakers=circuit_breakers,
+            hedge=hedge,
+            transport=transport,
+            events=events,
+            adaptive_timeouts=adaptive_timeouts
+        )
+        self.events: EventHooks = self.H.events
+        self._stats: Optional[ClientStats] = _client_stats(stats, self.events)
+        self.api_link: str = self.H.endpoint()
+        self._urls = compile_endpoints(self.api_link)
+        self.logger: logging.Logger = logging.getLogger(__name__)
+
+    async def __aenter__(self) -> 'AsyncApi':
+        return self
+
+    async def __aexit__(self,
+                        exc_type: Optional[type],
+                        exc_val: Optional[BaseException],
+                        exc_tb: Optional[Any]) -> None:
+        await self.close()
+
+        if exc_type is not None:
+            self.logger.error(f"Exception in context: {exc_type.__name__}: {exc_val}")
+
+    async def close(self) -> None:
+        """Close the async client and release pooled connections."""
+        try:
+            await self.H.aclose()
+        except Exception as e:
+            self.logger.error(f"Error closing async API client: {e}")
+
+
+    async def _call_unwrapped(self, method_name: str, *args: Union[str, int]) -> APIResponse:
+        """Await an endpoint method without error swallowing (see api._call_unwrapped)."""
+        func = getattr(api, method_name).__wrapped__
+        with _UnwrappedCall(_listening((self,)), method_name) as call:
+            _validate_call_args((self,) + args)
+            response = func(self, *args)
+            if inspect.isawaitable(response):
+                response = await response
+            return call.done(_check_response(method_name, response))
+
+    async def _composite(self,
+                         calls: Dict[str, Tuple[str, Tuple[Any, ...]]],
+                         max_workers: int,
+                         timeout: Optional[float],
+                         result_type: Type[CompositeResult] = CompositeResult,
+                         deadline: Optional[float] = None) -> CompositeResult:
+        """Await composite sections (name -> (method name, arguments)) concurrently."""
+        with deadline_scope(timeout, deadline):
+            return await run_sections_async(
+                {name: partial(self._call_unwrapped, method, *args)
+                 for name, (method, args) in calls.items()},
+                max_workers=max_workers,
+                timeout=timeout,
+                result_type=result_type
+            )
+
+    async def get_pt_full_profile(self,
+                                  pt_id: str,
+                                  semester: Optional[Union[int, str]] = None,
+                                  max_workers: int = 8,
+                                  timeout: Optional[float] = 10.0,
+                                  deadline: Optional[float] = None) -> Optional[CompositeResult]:
+        """Async version of :meth:`pddiktipy.api.api.get_pt_full_profile`."""
+        try:
+            calls = self._pt_profile_calls(pt_id, semester)
+        except ValidationError as e:
+            _log_api_error("get_pt_full_profile", e)
+            return None
+        return await self._composite(calls, max_workers, timeout, deadline=deadline)
+
+    async def get_prodi_full_profile(self,
+                                     prodi_id: str,
+                                     semester: Optional[Union[int, str]] = None,
+                                     max_workers: int = 8,
+                                     timeout: Optional[float] = 10.0,
+                                     deadline: Optional[float] = None) -> Optional[CompositeResult]:
+        """Async version of :meth:`pddiktipy.api.api.get_prodi_full_profile`."""
+        try:
+            calls = self._prodi_profile_calls(prodi_id, semester)
+        except ValidationError as e:
+            _log_api_error("get_prodi_full_profile", e)
+            return None
+        return await self._composite(calls, max_workers, timeout, deadline=deadline)
+
+    async def get_dosen_portfolio(self,
+                                  dosen_id: str,
+                                  max_workers: int = 7,
+                                  timeout: Optional[float] = 10.0,
+                                  deadline: Optional[float] = None) -> Optional[DosenPortfolio]:
+        """Async version of :meth:`pddiktipy.api.api.get_dosen_portfolio`."""
+        try:
+            calls = self._dosen_portfolio_calls(dosen_id)
+        except ValidationError as e:
+            _log_api_error("get_dosen_portfolio", e)
+            return None
+        return await self._composite(calls, max_workers, timeout, DosenPortfolio, deadline)
+
+    def get_detail_mhs_many(self, mahasiswa_ids: Iterable[str],
+                            concurrency: int = 8) -> AsyncIterator[BulkResult]:
+        """Async version of :meth:`pddiktipy.api.api.get_detail_mhs_many`; use ``async for``."""
+        return iter_many_async(partial(self._call_unwrapped, "get_detail_mhs"), mahasiswa_ids, concurrency)
+
+    def get_dosen_profile_many(self, dosen_ids: Iterable[str],
+                               concurrency: int = 8) -> AsyncIterator[BulkResult]:
+        """Async version of :meth:`pddiktipy.api.api.get_dosen_profile_many`; use ``async for``."""
+        return iter_many_async(partial(self._call_unwrapped, "get_dosen_profile"), dosen_ids, concurrency)
+
+
+# Generate the async endpoint methods from the sync implementations. Each sync
+# method body validates its arguments, builds the URL and returns
+# ``self.H.response(...)``; with an AsyncHelper that return value is a
+# coroutine, which ``handle_errors_async`` awaits.
+for _name in API_METHODS:
+    setattr(AsyncApi, _name, handle_errors_async(getattr(api, _name).__wrapped__))
+del _name
@@ -0,0 +1,266 @@
+"""
+In-memory TTL cache with byte-size limits and stale-while-revalidate.
+
+Entries are fresh for ``ttl`` seconds. After that they stay servable as
+*stale* for ``stale_ttl`` more seconds: a stale read returns the old value
+immediately and triggers one background refresh, so callers never wait on
+the upstream when an entry expires. Memory is bounded by an estimate of the
+entries' serialized size, evicting least recently used entries first.
+"""
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Lookup outcomes
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+# Seconds a stale value stays fresh when its refresh brought nothing better
+REFRESH_RETRY = 30.0
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate memory cost of a cached value in bytes (its JSON length)."""
+    if value is None:
+        return 4
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value)
+    try:
+        return len(json.dumps(value, default=str, separators=(",", ":")))
+    except (TypeError, ValueError):
+        return 1024
+
+
+class _Entry:
+    __slots__ = ("value", "size", "expires_at", "stale_until")
+
+    def __init__(self, value: Any, size: int, expires_at: float, stale_until: float) -> None:
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+
+
+class TTLCache:
+    """Thread-safe LRU cache with per-entry TTL and a byte budget.
+
+    Args:
+        ttl: Default seconds an entry stays fresh.
+        stale_ttl: Extra seconds an expired entry may still be served while
+            it is being refreshed. 0 disables stale-while-revalidate.
+        max_bytes: Budget for the estimated size of all entries.
+        max_entries: Optional cap on the number of entries.
+        clock: Monotonic time source, injectable for tests.
+    """
+
+    def __init__(self,
+                 ttl: float = 300,
+                 stale_ttl: float = 0,
+                 max_bytes: int = 4 * 1024 * 1024,
+                 max_entries: Optional[int] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.size_bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: Hashable) -> Tuple[str, Any]:
+        """Return ``(status, value)`` where status is "fresh", "stale" or "miss"."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISS, None
+            if now < entry.expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return FRESH, entry.value
+            if now < entry.stale_until:
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                return STALE, entry.value
+            self._remove(key)
+            self.misses += 1
+            return MISS, None
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a fresh or stale value, or ``default``."""
+        status, value = self.lookup(key)
+        return default if status == MISS else value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value``; values larger than the whole budget are not cached."""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            logger.debug("Not caching %r: %d bytes exceeds cache budget", key, size)
+            return
+
+        now = self._clock()
+        entry = _Entry(value, size, now + ttl, now + ttl + self.stale_ttl)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self.size_bytes += size
+            while (self.size_bytes > self.max_bytes or
+                   (self.max_entries is not None and len(self._entries) > self.max_entries)):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def touch(self, key: Hashable, ttl: float) -> bool:
+        """Keep an entry's value fresh for ``ttl`` more seconds; False if it is gone.
+
+        The stale window is not extended beyond that, so a value that can
+        never be refreshed still expires.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            entry.expires_at = now + ttl
+            entry.stale_until = max(entry.stale_until, entry.expires_at)
+            return True
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self.size_bytes -= entry.size
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for monitoring: hits, stale hits, misses, evictions and size."""
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+        }
+
+
+# Background refreshes for stale-while-revalidate, shared by all caches.
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+_refresh_lock = threading.Lock()
+
+
+def _refresh_pool() -> ThreadPoolExecutor:
+    global _refresh_executor
+    if _refresh_executor is None:
+        with _refresh_lock:
+            if _refresh_executor is None:
+                _refresh_executor = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="pddikti-refresh"
+                )
+    return _refresh_executor
+
+
+def ttl_cached(cache: TTLCache,
+               ttl_for: Optional[Callable[[Any], Optional[float]]] = None
+               ) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorator memoising a function in a :class:`TTLCache`.
+
+    Fresh hits return immediately. Stale hits return the old value and start
+    one background refresh per key. If the refresh fails, or returns an
+    empty or short-lived result (e.g. a client method's ``None`` for an
+    upstream error), the old value is kept and served as fresh for a short
+    while (``REFRESH_RETRY`` seconds, or the result's shorter TTL) before
+    the next refresh. Misses call the function; exceptions are never cached.
+
+    Args:
+        cache: The cache instance to use (available as ``func.cache``).
+        ttl_for: Optional callable mapping a result to its TTL in seconds,
+            e.g. a short TTL for empty or fallback results. None uses the
+            cache's default TTL; 0 or less skips caching the result.
+
+    Example:
+        >>> @ttl_cached(TTLCache(ttl=600, stale_ttl=3600))
+        ... def cached_search(keyword): ...
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        refreshing: Set[Hashable] = set()
+        refreshing_lock = threading.Lock()
+
+        def store(key: Hashable, value: Any) -> None:
+            cache.set(key, value, ttl_for(value) if ttl_for else None)
+
+        def keep_stale(key: Hashable, ttl: Optional[float] = None) -> None:
+            retry = REFRESH_RETRY if ttl is None or ttl <= 0 else ttl
+            cache.touch(key, min(cache.ttl, retry))
+
+        def refresh(key: Hashable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+            try:
+                value = func(*args, **kwargs)
+                ttl = ttl_for(value) if ttl_for else None
+                if not value or (ttl is not None and ttl < cache.ttl):
+                    # Nothing better than the stale value: keep it a while
+                    keep_stale(key, ttl)
+                else:
+                    cache.set(key, value, ttl)
+            except Exception as e:
+                logger.warning(f"Background refresh of {func.__name__}{args!r} failed: {e}")
+                keep_stale(key)
+            finally:
+                with refreshing_lock:
+                    refreshing.discard(key)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            status, value = cache.lookup(key)
+            if status == FRESH:
+                return value
+            if status == STALE:
+                with refreshing_lock:
+                    start = key not in refreshing
+                    refreshing.add(key)
+                if start:
+                    _refresh_pool().submit(refresh, key, args, kwargs)
+                return value
+
+            value = func(*args, **kwargs)
+            store(key, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
@@ -0,0 +1,213 @@
+"""
+Circuit breakers per upstream endpoint family.
+
+When one upstream path degrades (e.g. ``detail/pt`` timing out), every call
+to it would otherwise pay the full timeout and retry cycle. After
+``failure_threshold`` consecutive failures the family's breaker opens and
+calls fail immediately with :class:`CircuitOpenError`, so callers' fallbacks
+run at once. After ``reset_timeout`` a limited number of half-open probes
+are let through; a success closes the breaker, a failure re-opens it.
+"""
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .endpoints import endpoint_family
+from .exceptions import (
+    PDDIKTIError, APIConnectionError, APITimeoutError, CircuitOpenError, DeadlineExceededError
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def is_failure(error: BaseException) -> bool:
+    """Return True for errors that indicate an unhealthy upstream path.
+
+    Timeouts, connection errors and 5xx count; 404s, 429s (handled by the
+    rate limiter), validation errors and the caller's own deadline running
+    out say nothing about upstream health.
+    """
+    if isinstance(error, DeadlineExceededError):
+        return False
+    if isinstance(error, (APITimeoutError, APIConnectionError)):
+        return True
+    if isinstance(error, PDDIKTIError):
+        return error.status_code is not None and error.status_code >= 500
+    return False
+
+
+class CircuitBreaker:
+    """Thread-safe three-state circuit breaker for one endpoint family.
+
+    Args:
+        name: Label used in error messages.
+        failure_threshold: Consecutive failures that open the circuit.
+        reset_timeout: Seconds to stay open before allowing probes.
+        half_open_max: Concurrent probe calls allowed while half-open.
+        clock: Monotonic time source, injectable for tests.
+    """
+
+    def __init__(self,
+                 name: str = "",
+                 failure_threshold: int = 5,
+                 reset_timeout: float = 30.0,
+                 half_open_max: int = 1,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max = half_open_max
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._probes = 0
+
+    def before_call(self, endpoint: Optional[str] = None) -> None:
+        """Admit a call or raise :class:`CircuitOpenError` without sending it."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CLOSED:
+                return
+            if self._state == HALF_OPEN and self._probes < self.half_open_max:
+                self._probes += 1
+                return
+        raise self.rejection(endpoint)
+
+    def allow(self) -> bool:
+        """True unless the breaker is open; unlike :meth:`before_call`, takes no probe slot.
+
+        For callers that share another call's request (e.g. coalesced
+        followers) and so record no outcome of their own.
+        """
+        with self._lock:
+            self._maybe_half_open()
+            return self._state != OPEN
+
+    def rejection(self, endpoint: Optional[str] = None) -> CircuitOpenError:
+        """Count a rejected call and return the error to raise for it."""
+        with self._lock:
+            self.rejected += 1
+            retry_in = max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+        return CircuitOpenError(
+            f"Circuit open for {self.name or 'endpoint'}; retry in {retry_in:.0f} seconds",
+            endpoint=endpoint
+        )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probes = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self._probes = 0
+
+    def release(self) -> None:
+        """Return a half-open probe slot taken by a call that had no outcome."""
+        with self._lock:
+            if self._state == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def record_status(self, status_code: int) -> None:
+        """Record a call the upstream answered with ``status_code`` (5xx fails)."""
+        if status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def record(self, error: BaseException) -> None:
+        """Record the outcome of a call that raised ``error``."""
+        if isinstance(error, DeadlineExceededError):
+            # The caller gave up; the upstream may still have been fine
+            self.release()
+        elif is_failure(error):
+            self.record_failure()
+        else:
+            # The upstream answered (e.g. 404): the path itself is healthy
+            self.record_success()
+
+    def call(self, func: Callable[..., object], *args: object, endpoint: Optional[str] = None) -> object:
+        """Run ``func(*args)`` through the breaker."""
+        self.before_call(endpoint)
+        try:
+            result = func(*args)
+        except Exception as e:
+            self.record(e)
+            raise
+        self.record_success()
+        return result
+
+
+class CircuitBreakers:
+    """Lazily created breakers keyed by upstream host and endpoint family.
+
+    Example:
+        >>> breakers = CircuitBreakers(failure_threshold=3, reset_timeout=10)
+        >>> client = api(circuit_breakers=breakers)
+    """
+
+    def __init__(self,
+                 failure_threshold: int = 5,
+                 reset_timeout: float = 30.0,
+                 half_open_max: int = 1,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max = half_open_max
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+
+    def get(self, url: str) -> CircuitBreaker:
+        """Return the breaker for the endpoint family of ``url``."""
+        key = (urlsplit(url).netloc, endpoint_family(url))
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(key)
+                if breaker is None:
+                    breaker = self._breakers[key] = CircuitBreaker(
+                        name=key[1],
+                        failure_threshold=self.failure_threshold,
+                        reset_timeout=self.reset_timeout,
+                        half_open_max=self.half_open_max,
+                        clock=self._clock
+                    )
+        return breaker
+
+    def states(self) -> Dict[str, str]:
+        """Current state of every known endpoint family."""
+        return {f"{host}/{family}": breaker.state
+                for (host, family), breaker in list(self._breakers.items())}
+
+
+# Process-wide registry shared by every helper, so all clients of a pool see
+# the same view of upstream health.
+_shared_breakers = CircuitBreakers()
+
+
+def shared_breakers() -> CircuitBreakers:
+    """Return the process-wide breaker registry used by ``helper``."""
+    return _shared_breakers
@@ -0,0 +1,79 @@
+"""
+Deadline propagation for upstream calls.
+
+A deadline is an absolute ``time.monotonic()`` instant stored in a context
+variable, so it follows the call through retries, composite fan-out threads
+(which copy the caller's context) and asyncio tasks. Every upstream request
+shortens its connect and read timeouts to the time that is left, and no
+request is sent once the deadline has passed.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from .exceptions import DeadlineExceededError
+
+_deadline: ContextVar[Optional[float]] = ContextVar("pddikti_deadline", default=None)
+
+
+def current_deadline() -> Optional[float]:
+    """Return the innermost active deadline (a monotonic timestamp), if any."""
+    return _deadline.get()
+
+
+def remaining() -> Optional[float]:
+    """Seconds left until the active deadline, or None without one."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def clamp_timeout(timeout: Optional[float]) -> Optional[float]:
+    """Shrink ``timeout`` to the remaining budget.
+
+    Raises:
+        DeadlineExceededError: If the deadline has already passed.
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceededError("Deadline exceeded before the request was sent")
+    return left if timeout is None else min(timeout, left)
+
+
+@contextmanager
+def deadline_scope(budget: Optional[float] = None,
+                   deadline: Optional[float] = None) -> Iterator[Optional[float]]:
+    """Run the enclosed calls within a time budget.
+
+    Nested scopes can only shorten the active deadline, never extend it.
+
+    Args:
+        budget: Seconds from now.
+        deadline: Absolute ``time.monotonic()`` instant.
+
+    Yields:
+        The effective deadline, or None if neither argument was given.
+
+    Example:
+        >>> with deadline_scope(5):
+        ...     client.search_pt("Gadjah Mada")  # never waits more than 5s
+    """
+    candidates = [d for d in (deadline, None if budget is None else time.monotonic() + budget)
+                  if d is not None]
+    outer = _deadline.get()
+    if outer is not None:
+        candidates.append(outer)
+    if not candidates:
+        yield None
+        return
+
+    effective = min(candidates)
+    token = _deadline.set(effective)
+    try:
+        yield effective
+    finally:
+        _deadline.reset(token)
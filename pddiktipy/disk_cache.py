@@ -0,0 +1,216 @@
+"""
+Persistent on-disk cache for upstream response bodies.
+
+Bodies are stored zlib-compressed in a SQLite database in WAL mode, so
+several threads and processes (crawler runs, service workers) can read and
+write the same file concurrently. Entries are keyed by the normalized
+endpoint URL and expire according to TTL rules matched on the URL path.
+Expired entries keep their ETag/Last-Modified validators so they can be
+revalidated with a conditional request instead of downloaded again.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Callable, Dict, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+# (path prefix, TTL in seconds); the first matching prefix wins.
+DEFAULT_TTL_RULES: Tuple[Tuple[str, float], ...] = (
+    ("pencarian/", 60 * 60),            # search results: 1 hour
+    ("detail/", 24 * 60 * 60),          # detail records: 1 day
+    ("visualisasi/", 24 * 60 * 60),     # national statistics: 1 day
+    ("pt/logo", 7 * 24 * 60 * 60),      # university logos: 1 week
+)
+DEFAULT_TTL = 6 * 60 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT
+)
+"""
+# Columns added after the first release, for databases created earlier
+_MIGRATIONS = (
+    "ALTER TABLE responses ADD COLUMN etag TEXT",
+    "ALTER TABLE responses ADD COLUMN last_modified TEXT",
+)
+
+
+class CachedResponse(NamedTuple):
+    """A stored body with its validators; ``fresh`` is False once expired."""
+    body: bytes
+    fresh: bool
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+def normalize_url(url: str) -> str:
+    """Return a canonical form of ``url`` for use as a cache key.
+
+    Lower-cases the scheme and host, drops a trailing slash and the fragment,
+    and sorts query parameters.
+    """
+    parts = urlsplit(url)
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+class DiskCache:
+    """SQLite-backed response cache shared between threads and processes.
+
+    Args:
+        path: Database file; created if missing.
+        rules: ``(path_prefix, ttl_seconds)`` pairs matched in order against
+            the endpoint path (without the leading slash).
+        default_ttl: TTL for paths matching no rule.
+        compress_level: zlib compression level for stored bodies.
+        clock: Wall-clock time source, injectable for tests.
+
+    Example:
+        >>> cache = DiskCache("pddikti-cache.db")
+        >>> client = api(cache=cache)  # re-runs read from disk
+    """
+
+    def __init__(self,
+                 path: str,
+                 rules: Sequence[Tuple[str, float]] = DEFAULT_TTL_RULES,
+                 default_ttl: float = DEFAULT_TTL,
+                 compress_level: int = 6,
+                 clock: Callable[[], float] = time.time) -> None:
+        self.path = os.fspath(path)
+        self.rules = tuple(rules)
+        self.default_ttl = default_ttl
+        self.compress_level = compress_level
+        self._clock = clock
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+        # Create the schema up front so concurrent first writers don't race
+        self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection (sqlite3 connections are per-thread)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            for statement in _MIGRATIONS:
+                try:
+                    conn.execute(statement)
+                except sqlite3.OperationalError:
+                    pass  # column already exists
+            self._local.conn = conn
+        return conn
+
+    def ttl_for(self, url: str) -> float:
+        """Return the TTL rule matching the path of ``url``."""
+        path = urlsplit(url).path.lstrip("/")
+        for prefix, ttl in self.rules:
+            if path.startswith(prefix):
+                return ttl
+        return self.default_ttl
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """Return the stored entry for ``url``, fresh or expired, or None."""
+        try:
+            row = self._connection().execute(
+                "SELECT body, expires_at, etag, last_modified FROM responses WHERE key = ?",
+                (normalize_url(url),)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache read failed: {e}")
+            row = None
+
+        if row is None:
+            self.misses += 1
+            return None
+        try:
+            body = zlib.decompress(row[0])
+        except zlib.error:
+            self.misses += 1
+            return None
+        fresh = row[1] > self._clock()
+        if fresh:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return CachedResponse(body, fresh, row[2], row[3])
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Return the cached body for ``url`` if present and not expired."""
+        entry = self.lookup(url)
+        return entry.body if entry is not None and entry.fresh else None
+
+    def set(self, url: str, body: bytes, ttl: Optional[float] = None,
+            etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Store ``body`` and its validators; a TTL of 0 or less stores nothing."""
+        ttl = self.ttl_for(url) if ttl is None else ttl
+        if ttl <= 0:
+            return
+        now = self._clock()
+        try:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, body, stored_at, expires_at, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (normalize_url(url), zlib.compress(body, self.compress_level),
+                 now, now + ttl, etag, last_modified)
+            )
+        except sqlite3.Error as e:
+            # A cache write must never fail the request itself
+            logger.warning(f"Disk cache write failed: {e}")
+
+    def touch(self, url: str, ttl: Optional[float] = None) -> None:
+        """Extend an entry's lifetime, e.g. after a 304 Not Modified."""
+        ttl = self.ttl_for(url) if ttl is None else ttl
+        now = self._clock()
+        try:
+            self._connection().execute(
+                "UPDATE responses SET stored_at = ?, expires_at = ? WHERE key = ?",
+                (now, now + ttl, normalize_url(url))
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache write failed: {e}")
+
+    def delete(self, url: str) -> None:
+        self._connection().execute(
+            "DELETE FROM responses WHERE key = ?", (normalize_url(url),)
+        )
+
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed."""
+        cursor = self._connection().execute(
+            "DELETE FROM responses WHERE expires_at <= ?", (self._clock(),)
+        )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters of this instance and the number of stored entries."""
+        entries = self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
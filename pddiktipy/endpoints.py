@@ -0,0 +1,119 @@
+"""
+Endpoint URL helpers shared by the client's resilience features, and the
+declarative table of every endpoint the client calls.
+"""
+from functools import lru_cache
+from typing import Dict, Union
+from urllib.parse import urlsplit
+
+# URL path of every endpoint method of the client, by method name. Each "{}"
+# takes one of the method's URL-encoded arguments, in order.
+ENDPOINTS: Dict[str, str] = {
+    "search_all": "pencarian/all/{}",
+    "search_mahasiswa": "pencarian/mhs/{}",
+    "search_dosen": "pencarian/dosen/{}",
+    "search_pt": "pencarian/pt/{}",
+    "search_prodi": "pencarian/prodi/{}",
+    "get_detail_mhs": "detail/mhs/{}",
+    "get_dosen_profile": "dosen/profile/{}",
+    "get_dosen_penelitian": "dosen/portofolio/penelitian/{}",
+    "get_dosen_pengabdian": "dosen/portofolio/pengabdian/{}",
+    "get_dosen_karya": "dosen/portofolio/karya/{}",
+    "get_dosen_paten": "dosen/portofolio/paten/{}",
+    "get_dosen_study_history": "dosen/study-history/{}",
+    "get_dosen_teaching_history": "dosen/teaching-history/{}",
+    "get_detail_pt": "detail/pt/{}",
+    "get_prodi_pt": "pt/prodi/{}/{}",
+    "get_logo_pt": "pt/logo/{}",
+    "get_rasio_pt": "pt/rasio/{}",
+    "get_mahasiswa_pt": "pt/mahasiswa/{}",
+    "get_waktu_studi_pt": "pt/waktu-studi/{}",
+    "get_name_histories_pt": "pt/name-histories/{}",
+    "get_cost_range_pt": "pt/cost-range/{}",
+    "get_graduation_rate_pt": "pt/graduation-rate/{}",
+    "get_jumlah_prodi_pt": "pt/jumlah-prodi/{}",
+    "get_jumlah_mahasiswa_pt": "pt/jumlah-mahasiswa/{}",
+    "get_jumlah_dosen_pt": "pt/jumlah-dosen/{}",
+    "get_sarpras_file_name_pt": "pt/sarpras-file-name/{}",
+    "get_sarpras_blob_pt": "pt/sarpras-blob/{}",
+    "get_detail_prodi": "prodi/detail/{}",
+    "get_desc_prodi": "prodi/desc/{}",
+    "get_name_histories_prodi": "prodi/name-histories/{}",
+    "get_num_students_lecturers_prodi": "prodi/num-students-lecturers/{}",
+    "get_cost_range_prodi": "prodi/cost-range/{}",
+    "get_daya_tampung_prodi": "prodi/daya-tampung/{}",
+    "get_rasio_dosen_mahasiswa_prodi": "prodi/rasio-dosen-mahasiswa/{}",
+    "get_graduation_rate_prodi": "prodi/graduation-rate/{}",
+    "get_logo_prodi": "prodi/logo-pt/{}",
+    "get_homebase_prodi": "dosen/homebase/{}?semester={}",
+    "get_penghitung_ratio_prodi": "dosen/penghitung-ratio/{}?semester={}",
+    "get_dosen_count_active": "dosen/count-active",
+    "get_mahasiswa_count_active": "mahasiswa/count-active",
+    "get_prodi_count": "prodi/count",
+    "get_pt_count": "pt/count",
+    "get_data_dosen_keaktifan": "visualisasi/dosen-keaktifan",
+    "get_data_dosen_bidang": "visualisasi/dosen-bidang",
+    "get_data_dosen_jenis_kelamin": "visualisasi/dosen-jenis-kelamin",
+    "get_data_dosen_jenjang": "visualisasi/dosen-jenjang",
+    "get_data_dosen_ikatan": "visualisasi/dosen-ikatan",
+    "get_data_mahasiswa_bidang": "visualisasi/mahasiswa-bidang",
+    "get_data_mahasiswa_jenis_kelamin": "visualisasi/mahasiswa-jenis-kelamin",
+    "get_data_mahasiswa_jenjang": "visualisasi/mahasiswa-jenjang",
+    "get_data_mahasiswa_kelompok_lembaga": "visualisasi/mahasiswa-kelompok-lembaga",
+    "get_data_mahasiswa_status": "visualisasi/mahasiswa-status",
+    "get_data_pt_bentuk": "visualisasi/pt-bentuk",
+    "get_data_pt_akreditasi": "visualisasi/pt-akreditasi",
+    "get_data_pt_kelompok_pembina": "visualisasi/pt-kelompok-pembina",
+    "get_data_pt_provinsi": "visualisasi/pt-provinsi",
+    "get_data_prodi_jenjang": "visualisasi/prodi-jenjang",
+    "get_data_prodi_akreditasi": "visualisasi/prodi-akreditasi",
+    "get_data_prodi_bidang_ilmu": "visualisasi/prodi-bidang-ilmu",
+    "get_data_prodi_kelompok_pembina": "visualisasi/prodi-kelompok-pembina",
+    "get_contributor": "contributor/contributor",
+    "get_news": "news/list",
+    "get_bidang_ilmu_prodi": "prodi/bidang-ilmu",
+}
+
+
+class EndpointTemplates:
+    """:data:`ENDPOINTS` compiled against one base URL.
+
+    Each template is a ready ``str.format`` pattern with the base URL already
+    in place, so building a URL is one dict lookup and one ``format`` call.
+
+    Example:
+        >>> EndpointTemplates("https://host").url("get_prodi_pt", "abc", 20241)
+        'https://host/pt/prodi/abc/20241'
+    """
+
+    __slots__ = ("base_url", "_templates")
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url
+        # Braces in the base URL must not be read as placeholders
+        prefix = base_url.replace("{", "{{").replace("}", "}}") + "/"
+        self._templates = {name: prefix + path for name, path in ENDPOINTS.items()}
+
+    def url(self, name: str, *encoded: Union[str, int]) -> str:
+        """URL of endpoint method ``name`` for already URL-encoded arguments."""
+        return self._templates[name].format(*encoded)
+
+
+@lru_cache(maxsize=16)
+def compile_endpoints(base_url: str) -> EndpointTemplates:
+    """Shared :class:`EndpointTemplates` for ``base_url`` (one per base URL)."""
+    return EndpointTemplates(base_url)
+
+
+def endpoint_family(url: str) -> str:
+    """Return the endpoint family of ``url``: its first two path segments.
+
+    IDs, keywords and years come after the family, so every call of one
+    endpoint method (e.g. all ``detail/pt/<id>`` lookups) maps to one family.
+
+    Example:
+        >>> endpoint_family("https://host/detail/pt/abc123")
+        'detail/pt'
+    """
+    segments = [part for part in urlsplit(url).path.split("/") if part]
+    return "/".join(segments[:2])
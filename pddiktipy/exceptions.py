@@ -19,9 +19,16 @@ class APITimeoutError(PDDIKTIError):
     """Raised when API request times out."""
     pass
 
+class DeadlineExceededError(APITimeoutError):
+    """Raised when the caller's deadline, not the API, cut a request short."""
+    pass
+
 class APIRateLimitError(PDDIKTIError):
     """Raised when API rate limit is exceeded."""
-    pass
+    def __init__(self, message: str, status_code: Optional[int] = None, endpoint: Optional[str] = None,
+                 retry_after: Optional[float] = None):
+        super().__init__(message, status_code, endpoint)
+        self.retry_after = retry_after
 
 class APIResponseError(PDDIKTIError):
     """Raised when API returns an invalid response."""
@@ -34,3 +41,7 @@ class ValidationError(PDDIKTIError):
 class AuthenticationError(PDDIKTIError):
     """Raised when authentication fails."""
     pass
+
+class CircuitOpenError(PDDIKTIError):
+    """Raised without contacting the API while an endpoint's circuit breaker is open."""
+    pass
@@ -0,0 +1,131 @@
+"""
+Hedged requests for idempotent GETs.
+
+Upstream latency is long-tailed: most calls answer quickly, a few take
+seconds. With hedging, if a GET has not answered within a percentile of
+recent latency for its endpoint family, a duplicate request is sent and the
+first response wins. A global budget caps the extra load to a fraction of
+all requests.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from .endpoints import endpoint_family
+from .stats import WindowedSketch
+
+
+class HedgePolicy:
+    """When to send a duplicate request, and how many may be sent.
+
+    One instance can be shared by many clients (e.g. a :class:`ClientPool`)
+    so the load cap applies to all of them together.
+
+    The delays come from the policy's own recent latencies of complete
+    (possibly hedged) requests, not from :class:`~pddiktipy.stats.ClientStats`.
+    Those are per method, cumulative and off by default.
+
+    Args:
+        percentile: Hedge once a request is slower than this percentile of
+            recent latencies for its endpoint family.
+        max_extra: Maximum extra requests as a fraction of all requests,
+            e.g. 0.1 allows at most one hedge per ten requests.
+        burst: Unused hedge allowance that may accumulate.
+        min_delay: Lower bound on the hedge delay in seconds.
+        max_delay: Upper bound on the hedge delay in seconds.
+        initial_delay: Delay used until ``min_samples`` latencies are known.
+        window: Latencies per generation of the per-family latency sketch;
+            the percentile covers the last ``window`` to ``2 * window``.
+        min_samples: Samples needed before the percentile is trusted.
+
+    Example:
+        >>> client = api(hedge=HedgePolicy(percentile=90, max_extra=0.05))
+    """
+
+    def __init__(self,
+                 percentile: float = 95.0,
+                 max_extra: float = 0.1,
+                 burst: float = 10.0,
+                 min_delay: float = 0.02,
+                 max_delay: float = 2.0,
+                 initial_delay: float = 1.0,
+                 window: int = 256,
+                 min_samples: int = 20) -> None:
+        self.percentile = percentile
+        self.max_extra = max_extra
+        self.burst = burst
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.initial_delay = initial_delay
+        self.window = window
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._samples: Dict[str, WindowedSketch] = {}
+        self._delays: Dict[str, float] = {}
+        self._credit = 0.0
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def delay(self, url: str) -> float:
+        """Seconds to wait for the primary request before hedging ``url``."""
+        return self._delays.get(endpoint_family(url), self.initial_delay)
+
+    def observe(self, url: str, seconds: float) -> None:
+        """Record the latency of a completed request."""
+        family = endpoint_family(url)
+        with self._lock:
+            samples = self._samples.get(family)
+            if samples is None:
+                samples = self._samples[family] = WindowedSketch(self.window)
+            samples.record(seconds)
+            # Reading the percentile walks the sketch; refresh periodically
+            if samples.count >= self.min_samples and samples.count % 8 == 0:
+                delay = samples.quantile(self.percentile / 100)
+                self._delays[family] = min(self.max_delay, max(self.min_delay, delay))
+
+    def on_request(self) -> None:
+        """Count a primary request, earning a fraction of a hedge."""
+        with self._lock:
+            self.requests += 1
+            self._credit = min(self.burst, self._credit + self.max_extra)
+
+    def try_hedge(self) -> bool:
+        """Spend one hedge from the budget, or return False if none is left."""
+        with self._lock:
+            if self._credit < 1 - 1e-9:  # tolerate float accumulation error
+                return False
+            self._credit -= 1
+            self.hedged += 1
+            return True
+
+    def on_hedge_win(self) -> None:
+        with self._lock:
+            self.hedge_wins += 1
+
+    def stats(self) -> Dict[str, object]:
+        """Counters and current hedge delays per endpoint family."""
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "delays": dict(self._delays),
+        }
+
+
+# Threads running hedged sync requests; both the primary and the hedge run
+# here so the caller can return as soon as either answers.
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+_hedge_executor_lock = threading.Lock()
+
+
+def hedge_pool() -> ThreadPoolExecutor:
+    """Return the process-wide executor for hedged sync requests."""
+    global _hedge_executor
+    if _hedge_executor is None:
+        with _hedge_executor_lock:
+            if _hedge_executor is None:
+                _hedge_executor = ThreadPoolExecutor(
+                    max_workers=128, thread_name_prefix="pddikti-hedge"
+                )
+    return _hedge_executor
@@ -1,27 +1,105 @@
-import urllib.request as urllib
-import requests
 import base64
+import json
 import logging
+import re
 import time
-from requests.utils import requote_uri
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-from typing import Optional, Union, Any
+import threading
+from concurrent.futures import FIRST_COMPLETED, TimeoutError as FutureTimeout, wait
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional, Union, Any, Mapping, Callable, Tuple
+from contextvars import copy_context
+from urllib.parse import urlsplit
+from .singleflight import SingleFlight, shared_group
+from .disk_cache import CachedResponse, DiskCache
+from .ratelimit import RateLimiter, parse_retry_after
+from .retry import DEFAULT_RETRY, RetryPolicy
 from .exceptions import (
-    APIConnectionError, APITimeoutError, APIRateLimitError, 
-    APIResponseError, ValidationError
+    PDDIKTIError, APIConnectionError, APITimeoutError, APIRateLimitError, 
+    APIResponseError, DeadlineExceededError, ValidationError
 )
+from .circuit import CircuitBreakers, shared_breakers
+from .hedging import HedgePolicy, hedge_pool
+from .deadline import remaining
+from .events import CACHE_HIT, CACHE_REVALIDATED, EventHooks, RequestEvent
+from .timeouts import AdaptiveTimeouts
+from .transport import RequestsTransport, Transport, TransportResponse
+
+# requests is loaded by RequestsTransport on first use, not at import time
+if TYPE_CHECKING:
+    import requests
+
+# Strings made only of these characters come out of requote_uri unchanged
+# ('%' is excluded: requote_uri normalises percent-escapes)
+_URL_SAFE = re.compile(r"[A-Za-z0-9_.~!#$&'()*+,/:;=?@\[\]-]+")
 
 class helper:
-    def __init__(self):
+    # Upper bound on the TCP/TLS connect phase; the read timeout gets the rest
+    connect_timeout: float = 10.0
+    
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10,
+                 base_url: Optional[str] = None, coalesce: bool = True,
+                 cache: Optional[DiskCache] = None,
+                 rate_limit: Optional[Union[float, RateLimiter]] = None,
+                 retry: Optional[RetryPolicy] = None,
+                 circuit_breakers: Union[bool, CircuitBreakers] = True,
+                 hedge: Optional[HedgePolicy] = None,
+                 transport: Optional[Transport] = None,
+                 events: Optional[EventHooks] = None,
+                 adaptive_timeouts: Optional[AdaptiveTimeouts] = None):
         self.url = "aHR0cHM6Ly9hcGktcGRkaWt0aS5rZW1kaWt0aXNhaW50ZWsuZ28uaWQ="
         self.host = "YXBpLXBkZGlrdGkua2VtZGlrdGlzYWludGVrLmdvLmlk"
         self.origin = "aHR0cHM6Ly9wZGRpa3RpLmtlbWRpa3Rpc2FpbnRlay5nby5pZA=="
         self.referer = "aHR0cHM6Ly9wZGRpa3RpLmtlbWRpa3Rpc2FpbnRlay5nby5pZC8="
         self.ip = "MTAzLjQ3LjEzMi4yOQ=="
         
-        # Initialize session with retry strategy
-        self._session = None
+        # Optional override of the upstream base URL (e.g. a local stand-in)
+        self.base_url = base_url.rstrip("/") if base_url else None
+        
+        # Decoded once: the base URL and one read-only header mapping that
+        # every request of this helper shares
+        self._endpoint = self.base_url or self.decodes(self.url)
+        self.headers: Mapping[str, str] = MappingProxyType(self._build_headers())
+        
+        # Identical concurrent GETs share one upstream request (process-wide,
+        # per transport; see _get)
+        self.flights: Optional[SingleFlight] = shared_group() if coalesce else None
+        
+        # Optional persistent response cache keyed by endpoint URL
+        self.cache = cache
+        
+        # Optional adaptive rate limiter; pass one instance to share it
+        if isinstance(rate_limit, (int, float)) and not isinstance(rate_limit, bool):
+            rate_limit = RateLimiter(rate_limit)
+        self.limiter: Optional[RateLimiter] = rate_limit
+        
+        # The one retry policy for every upstream request of this client
+        self.retry: RetryPolicy = retry or DEFAULT_RETRY
+        
+        # Per endpoint family fail-fast; True shares the process-wide registry
+        if circuit_breakers is True:
+            circuit_breakers = shared_breakers()
+        self.breakers: Optional[CircuitBreakers] = circuit_breakers or None
+        
+        # Optional hedging of slow GETs (opt-in; doubles some requests)
+        self.hedge: Optional[HedgePolicy] = hedge
+        
+        # Subscribers to per-request events; pass one instance to share it
+        self.events: EventHooks = events if events is not None else EventHooks()
+        
+        # Optional per endpoint family timeouts learned from latency
+        self.adaptive_timeouts: Optional[AdaptiveTimeouts] = adaptive_timeouts
+        
+        # HTTP transport; the default one is created on first use and owned
+        # (closed) by this helper, a caller-supplied one is left to the caller
+        self._transport = transport
+        self._owns_transport = transport is None
+        self._transport_lock = threading.Lock()
+        # Coalescing scope: default transports send identical requests, so
+        # their helpers coalesce together; a supplied transport only with
+        # helpers sharing it (e.g. a ClientPool's)
+        self._flight_scope: Optional[Transport] = transport
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
         self._cached_ip = None
         self._ip_cache_time = 0
         self._ip_cache_duration = 3600  # Cache IP for 1 hour
@@ -30,24 +108,21 @@ class helper:
         self.logger = logging.getLogger(__name__)
         
     @property
-    def session(self) -> requests.Session:
-        """Lazy initialization of requests session with retry strategy"""
-        if self._session is None:
-            self._session = requests.Session()
-            
-            # Retry strategy
-            retry_strategy = Retry(
-                total=3,
-                backoff_factor=1,
-                status_forcelist=[429, 500, 502, 503, 504],
-                allowed_methods=["HEAD", "GET", "OPTIONS"]
-            )
-            
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            self._session.mount("http://", adapter)
-            self._session.mount("https://", adapter)
-            
-        return self._session
+    def transport(self) -> Transport:
+        """The HTTP transport, created lazily unless one was supplied"""
+        if self._transport is None:
+            with self._transport_lock:
+                if self._transport is None:
+                    self._transport = self._default_transport()
+        return self._transport
+
+    def _default_transport(self) -> Transport:
+        return RequestsTransport(self.pool_connections, self.pool_maxsize)
+
+    @property
+    def session(self) -> Optional["requests.Session"]:
+        """The pooled requests session, when using a :class:`RequestsTransport`"""
+        return getattr(self.transport, "session", None)
         
     def get_ip(self) -> Optional[str]:
         """
@@ -70,6 +145,15 @@ class helper:
     def get_headers(self) -> dict:
         """
         Returns a single header dictionary for requests.
+        
+        A mutable copy of :attr:`headers`; the request path sends the shared
+        mapping itself.
+        """
+        return dict(self.headers)
+
+    def _build_headers(self) -> dict:
+        """
+        Builds the request headers, decoding the stored values.
         """
         return {
             "Accept": "application/json, text/plain, */*",
@@ -77,7 +161,7 @@ class helper:
             "Accept-Language": "en-US,en;q=0.9,mt;q=0.8",
             "Connection": "keep-alive",
             "DNT": "1",
-            "Host": self.decodes(self.host),
+            "Host": urlsplit(self.base_url).netloc if self.base_url else self.decodes(self.host),
             "Origin": self.decodes(self.origin),
             "Referer": self.decodes(self.referer),
             "Sec-Fetch-Dest": "empty",
@@ -90,13 +174,317 @@ class helper:
             "sec-ch-ua-platform": '"Windows"'
         }
 
+    def _raise_for_status(self, status_code: int, headers: Mapping[str, str], endpoint: str) -> None:
+        """
+        Maps an HTTP error status to the matching PDDIKTI exception.
+        
+        Args:
+            status_code: HTTP status code of the response
+            headers: Response headers
+            endpoint: The requested endpoint URL
+            
+        Raises:
+            APIRateLimitError: For HTTP 429
+            APIResponseError: For other 4xx/5xx statuses
+        """
+        if status_code == 429:
+            # Without a usable Retry-After the retry policy's backoff applies
+            retry_after = parse_retry_after(headers.get('Retry-After'), default=None)
+            wait = "" if retry_after is None else f". Retry after {retry_after:g} seconds"
+            raise APIRateLimitError(
+                f"Rate limit exceeded{wait}",
+                status_code=429,
+                endpoint=endpoint,
+                retry_after=retry_after
+            )
+        elif status_code == 401:
+            raise APIResponseError(
+                "Authentication failed",
+                status_code=401,
+                endpoint=endpoint
+            )
+        elif status_code == 403:
+            raise APIResponseError(
+                "Access forbidden",
+                status_code=403,
+                endpoint=endpoint
+            )
+        elif status_code == 404:
+            raise APIResponseError(
+                "Endpoint not found",
+                status_code=404,
+                endpoint=endpoint
+            )
+        elif 500 <= status_code < 600:
+            raise APIResponseError(
+                f"Server error: {status_code}",
+                status_code=status_code,
+                endpoint=endpoint
+            )
+        elif status_code >= 400:
+            raise APIResponseError(
+                f"HTTP error: {status_code}",
+                status_code=status_code,
+                endpoint=endpoint
+            )
+
+    def _send(self, url: str, timeout: int,
+              conditional: Optional[dict] = None) -> TransportResponse:
+        """
+        Performs the GET through the transport, which reads the whole body,
+        so the response can be shared.
+        """
+        self.logger.debug("Making request to: %s", url)
+        headers = {**self.headers, **conditional} if conditional else self.headers
+        wait = self._limiter_delay(url)
+        if wait > 0:
+            time.sleep(wait)
+        left = remaining()
+        timeouts = self._timeouts(url, timeout)
+        started = time.perf_counter()
+        try:
+            response = self.transport.get(url, headers, timeouts)
+        except APITimeoutError as e:
+            if self._deadline_bound(timeouts, left):
+                raise DeadlineExceededError(
+                    "Deadline expired waiting for the upstream", endpoint=url
+                ) from e
+            self._learn_timeout(url, timeouts)
+            raise
+        self._learn_latency(url, started, response)
+        self._throttle_feedback(response.status_code, response.headers)
+        return response
+
+    def _timeouts(self, url: str, timeout: float) -> Tuple[float, float]:
+        """
+        Splits a request timeout (already shortened to the caller's remaining
+        deadline) into (connect, read) timeouts, using the timeouts learned
+        for the URL's endpoint family when available.
+        """
+        if self.adaptive_timeouts is not None:
+            learned = self.adaptive_timeouts.timeouts(url, timeout)
+            if learned is not None:
+                return learned
+        return min(self.connect_timeout, timeout), timeout
+
+    @staticmethod
+    def _deadline_bound(timeouts: Tuple[float, float], left: Optional[float]) -> bool:
+        """
+        True if the caller's deadline (``left`` seconds away when the attempt
+        was sent), not the endpoint's own timeout, limited the attempt.
+        """
+        return left is not None and timeouts[1] >= left
+
+    def _learn_latency(self, url: str, started: float, response: TransportResponse) -> None:
+        """Feeds the duration of a completed attempt to the adaptive timeouts."""
+        if self.adaptive_timeouts is not None:
+            self.adaptive_timeouts.observe(url, time.perf_counter() - started,
+                                           response.elapsed)
+
+    def _learn_timeout(self, url: str, timeouts: Tuple[float, float]) -> None:
+        """
+        Feeds an attempt that timed out on its own (not on the caller's
+        deadline) to the adaptive timeouts.
+        """
+        if self.adaptive_timeouts is not None:
+            self.adaptive_timeouts.observe_timeout(url, timeouts[1])
+
+    def _limiter_delay(self, url: str) -> float:
+        """
+        Reserves a rate limiter slot and returns how long to wait for it.
+        
+        Raises:
+            DeadlineExceededError: If the wait would outlast the caller's deadline
+        """
+        if self.limiter is None:
+            return 0.0
+        # Checked before taking the token, so a rejected call costs others nothing
+        wait = self.limiter.reserve(max_wait=remaining())
+        if wait is None:
+            raise DeadlineExceededError(
+                "Deadline would expire waiting for the rate limiter",
+                endpoint=url
+            )
+        return wait
+
+    def _throttle_feedback(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """
+        Reports a response to the rate limiter: 429 backs off (honouring
+        Retry-After), other non-5xx responses let the rate recover.
+        """
+        if self.limiter is None:
+            return
+        if status_code == 429:
+            retry_after = parse_retry_after(headers.get('Retry-After'))
+            self.logger.warning("Rate limited; pausing %.1fs", retry_after)
+            self.limiter.on_rate_limited(retry_after)
+        elif status_code < 500:
+            self.limiter.on_success()
+
+    def _get(self, url: str, timeout: int,
+             conditional: Optional[dict] = None) -> TransportResponse:
+        """
+        Sends a GET, coalescing with an identical request already in flight.
+        
+        Followers receive the leader's response object (or exception); each
+        caller decodes the body itself, so results are never shared mutably.
+        Conditional requests only coalesce with ones sending the same
+        validators, since their 304 is meaningless without the cached body,
+        and requests only coalesce with ones sent through the same kind of
+        transport (see ``_flight_scope``).
+        """
+        if self.flights is None:
+            return self._guarded(url, timeout, conditional)
+        # Followers record no breaker outcome, the leader's request does
+        breaker = self.breakers.get(url) if self.breakers is not None else None
+        if breaker is not None and not breaker.allow():
+            raise breaker.rejection(url)
+        validators = tuple(sorted(conditional.items())) if conditional else None
+        key = (self._flight_scope, url, validators)
+        return self.flights.do(key, self._guarded, url, timeout, conditional)
+
+    def _timed_send(self, url: str, timeout: int,
+                    conditional: Optional[dict] = None) -> TransportResponse:
+        """
+        Sends the GET and feeds its latency to the hedge policy.
+        """
+        started = time.perf_counter()
+        response = self._send(url, timeout, conditional)
+        self.hedge.observe(url, time.perf_counter() - started)
+        return response
+
+    def _send_hedged(self, url: str, timeout: int,
+                     conditional: Optional[dict] = None) -> TransportResponse:
+        """
+        Sends the GET, plus a duplicate if the first one is slower than the
+        hedge policy's latency percentile; the first response wins.
+        """
+        if self.hedge is None:
+            return self._send(url, timeout, conditional)
+        
+        self.hedge.on_request()
+        pool = hedge_pool()
+        # Copy the caller's context so the deadline follows into the pool
+        primary = pool.submit(copy_context().run, self._timed_send, url, timeout, conditional)
+        try:
+            return primary.result(timeout=self.hedge.delay(url))
+        except FutureTimeout:
+            pass
+        if not self.hedge.try_hedge():
+            return primary.result()
+        
+        self.logger.debug("Hedging slow request: %s", url)
+        backup = pool.submit(copy_context().run, self._timed_send, url, timeout, conditional)
+        pending = {primary, backup}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is backup:
+                        self.hedge.on_hedge_win()
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def _guarded(self, url: str, timeout: int,
+                 conditional: Optional[dict] = None) -> TransportResponse:
+        """
+        Sends one upstream request through the circuit breaker of the URL's
+        endpoint family, failing fast with CircuitOpenError while it is open.
+        
+        Runs once per upstream request (by the leader of coalesced calls),
+        so the breaker counts each request's outcome once: transport errors
+        and 5xx responses fail, other responses succeed.
+        """
+        if self.breakers is None:
+            return self._send_hedged(url, timeout, conditional)
+        breaker = self.breakers.get(url)
+        breaker.before_call(url)
+        try:
+            response = self._send_hedged(url, timeout, conditional)
+        except Exception as e:
+            breaker.record(e)
+            raise
+        breaker.record_status(response.status_code)
+        return response
+
+    def _cached(self, url: str) -> Optional[CachedResponse]:
+        """Returns the disk cache entry for ``url`` (fresh or expired), if any."""
+        if self.cache is None:
+            return None
+        return self.cache.lookup(url)
+
+    def _conditional_headers(self, cached: Optional[CachedResponse]) -> Optional[dict]:
+        """
+        Builds If-None-Match/If-Modified-Since headers to revalidate an
+        expired cache entry, or None if there is nothing to revalidate.
+        """
+        if cached is None or not cached.revalidatable:
+            return None
+        headers = {}
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    def _revalidated(self, url: str, status_code: int,
+                     cached: Optional[CachedResponse],
+                     event: Optional[RequestEvent] = None) -> Optional[bytes]:
+        """
+        Returns the cached body if the upstream answered 304 Not Modified,
+        extending the entry's lifetime as if it had just been downloaded.
+        """
+        if status_code != 304 or cached is None:
+            return None
+        self.logger.debug("Not modified, extending cache entry: %s", url)
+        self.cache.touch(url)
+        if event is not None:
+            event.cache = CACHE_REVALIDATED
+            event.size = len(cached.body)
+        return cached.body
+
+    def _record_cache_hit(self, event: Optional[RequestEvent], cached: CachedResponse) -> None:
+        """Completes the event of a request answered by a fresh disk cache entry."""
+        if event is not None:
+            event.cache = CACHE_HIT
+            event.size = len(cached.body)
+            self.events.finish_request(event)
+
+    def _run_observed(self, event: Optional[RequestEvent], run: Callable[[], Any]) -> Any:
+        """
+        Runs every attempt of one request, then completes and emits its
+        event (if anyone is subscribed).
+        """
+        if event is None:
+            return run()
+        try:
+            return run()
+        except Exception as e:
+            event.error = e
+            raise
+        finally:
+            self.events.finish_request(event)
+
+    def _store(self, url: str, response: Any) -> None:
+        """Writes a successful response and its validators to the disk cache."""
+        if self.cache is not None:
+            self.cache.set(
+                url, response.content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified")
+            )
+
     def response(self, endpoint: str, timeout: int = 30) -> Optional[dict]:
         """
         Sends a GET request and returns the JSON response with comprehensive error handling.
         
+        Transient failures are retried according to ``self.retry``.
+        
         Args:
             endpoint: The API endpoint URL
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds, per attempt
             
         Returns:
             JSON response or None if error occurs
@@ -110,50 +498,39 @@ class helper:
         if not endpoint:
             raise ValidationError("Endpoint cannot be empty")
             
-        headers = self.get_headers()
-        
-        try:
-            self.logger.debug(f"Making request to: {endpoint}")
-            response = self.session.get(endpoint, headers=headers, timeout=timeout)
-            
-            # Handle different HTTP status codes
-            if response.status_code == 429:
-                retry_after = response.headers.get('Retry-After', '60')
-                raise APIRateLimitError(
-                    f"Rate limit exceeded. Retry after {retry_after} seconds",
-                    status_code=429,
-                    endpoint=endpoint
-                )
-            elif response.status_code == 401:
-                raise APIResponseError(
-                    "Authentication failed",
-                    status_code=401,
-                    endpoint=endpoint
-                )
-            elif response.status_code == 403:
-                raise APIResponseError(
-                    "Access forbidden",
-                    status_code=403,
-                    endpoint=endpoint
-                )
-            elif response.status_code == 404:
-                raise APIResponseError(
-                    "Endpoint not found",
-                    status_code=404,
-                    endpoint=endpoint
-                )
-            elif 500 <= response.status_code < 600:
-                raise APIResponseError(
-                    f"Server error: {response.status_code}",
-                    status_code=response.status_code,
-                    endpoint=endpoint
-                )
+        cached = self._cached(endpoint)
+        event = self.events.start_request(endpoint, self.cache is not None)
+        if cached is not None and cached.fresh:
+            self.logger.debug("Disk cache hit: %s", endpoint)
+            self._record_cache_hit(event, cached)
+            return json.loads(cached.body)
             
-            response.raise_for_status()
+        return self._run_observed(event, lambda: self.retry.run(
+            lambda attempt_timeout: self._request_json(endpoint, attempt_timeout, cached, event),
+            timeout
+        ))
+
+    def _request_json(self, endpoint: str, timeout: float,
+                      cached: Optional[CachedResponse],
+                      event: Optional[RequestEvent] = None) -> Optional[dict]:
+        """
+        One attempt of :meth:`response`, mapping every failure to a PDDIKTI exception.
+        """
+        if event is not None:
+            event.attempts += 1
+        try:
+            response = self._get(endpoint, timeout, self._conditional_headers(cached))
+            if event is not None:
+                event.observe(response)
+            body = self._revalidated(endpoint, response.status_code, cached, event)
+            if body is not None:
+                return json.loads(body)
+            self._raise_for_status(response.status_code, response.headers, endpoint)
             
             try:
                 json_data = response.json()
-                self.logger.debug(f"Successful response from: {endpoint}")
+                self.logger.debug("Successful response from: %s", endpoint)
+                self._store(endpoint, response)
                 return json_data
             except ValueError as e:
                 raise APIResponseError(
@@ -162,21 +539,8 @@ class helper:
                     endpoint=endpoint
                 )
                 
-        except requests.Timeout:
-            raise APITimeoutError(
-                f"Request timeout after {timeout} seconds",
-                endpoint=endpoint
-            )
-        except requests.ConnectionError as e:
-            raise APIConnectionError(
-                f"Connection error: {str(e)}",
-                endpoint=endpoint
-            )
-        except requests.RequestException as e:
-            raise APIResponseError(
-                f"Request failed: {str(e)}",
-                endpoint=endpoint
-            )
+        except PDDIKTIError:
+            raise
         except Exception as e:
             self.logger.error(f"Unexpected error in response(): {e}")
             raise APIResponseError(
@@ -215,34 +579,44 @@ class helper:
         if not url:
             raise ValidationError("Image URL cannot be empty")
             
-        headers = self.get_headers()
+        cached = self._cached(url)
+        event = self.events.start_request(url, self.cache is not None)
+        if cached is not None and cached.fresh:
+            self._record_cache_hit(event, cached)
+            return self.base64_encode_image(cached.body)
+            
+        return self._run_observed(event, lambda: self.retry.run(
+            lambda attempt_timeout: self._request_image(url, attempt_timeout, cached, event),
+            timeout
+        ))
+
+    def _request_image(self, url: str, timeout: float,
+                       cached: Optional[CachedResponse],
+                       event: Optional[RequestEvent] = None) -> Optional[str]:
+        """
+        One attempt of :meth:`fetch_image_as_base64`.
+        """
+        if event is not None:
+            event.attempts += 1
         try:
-            self.logger.debug(f"Fetching image from: {url}")
-            response = self.session.get(url, headers=headers, timeout=timeout)
-            response.raise_for_status()
+            response = self._get(url, timeout, self._conditional_headers(cached))
+            if event is not None:
+                event.observe(response)
+            body = self._revalidated(url, response.status_code, cached, event)
+            if body is not None:
+                return self.base64_encode_image(body)
+            self._raise_for_status(response.status_code, response.headers, url)
             
             # Validate content type
             content_type = response.headers.get('content-type', '')
             if not content_type.startswith('image/'):
                 self.logger.warning(f"Unexpected content type: {content_type}")
             
+            self._store(url, response)
             return self.base64_encode_image(response.content)
             
-        except requests.Timeout:
-            raise APITimeoutError(
-                f"Image request timeout after {timeout} seconds",
-                endpoint=url
-            )
-        except requests.ConnectionError as e:
-            raise APIConnectionError(
-                f"Connection error fetching image: {str(e)}",
-                endpoint=url
-            )
-        except requests.RequestException as e:
-            raise APIResponseError(
-                f"Error fetching image: {str(e)}",
-                endpoint=url
-            )
+        except PDDIKTIError:
+            raise
         except Exception as e:
             self.logger.error(f"Unexpected error fetching image: {e}")
             raise APIResponseError(
@@ -264,9 +638,16 @@ class helper:
         Raises:
             ValidationError: For invalid input values
         """
+        # Fast path: IDs, years and simple keywords need no encoding
+        if type(value) is str:
+            if _URL_SAFE.fullmatch(value):
+                return value
+        elif type(value) is int:
+            return str(value)
+        
         if value is None:
             raise ValidationError("Cannot parse None value")
-            
+
         # Convert to string if input is not a string
         if not isinstance(value, str):
             try:
@@ -279,18 +660,18 @@ class helper:
             raise ValidationError("Cannot parse empty string")
             
         try:
+            from requests.utils import requote_uri
             return requote_uri(value)
         except Exception as e:
             raise ValidationError(f"Error encoding URL: {e}")
     
     def close(self) -> None:
         """
-        Close the session to free resources.
+        Close the transport to free resources, if this helper created it.
         """
-        if self._session:
-            self._session.close()
-            self._session = None
-            self.logger.debug("Session closed successfully")
+        if self._owns_transport and self._transport is not None:
+            self._transport.close()
+            self.logger.debug("Transport closed successfully")
     
     def decodes(self, string: str) -> str:
         """
@@ -300,9 +681,10 @@ class helper:
 
     def endpoint(self) -> str:
         """
-        Decodes the URL stored in the class.
+        Returns the base URL: the decoded URL stored in the class, unless a
+        base URL override is set.
         """
-        return self.decodes(self.url)
+        return self._endpoint
 
     def with_version(self, version: str) -> str:
         """
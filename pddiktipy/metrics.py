@@ -0,0 +1,316 @@
+"""
+Prometheus metrics in the text exposition format, without extra dependencies.
+
+Every metric keeps its values per thread: recording is a thread-local
+lookup and an in-place add, with no lock, so metrics can stay on under
+load. A lock is only taken the first time a thread records a label set,
+when a thread ends (its values fold into a retired total, so short-lived
+threads do not pile up), and when the registry renders the exposition
+text, summing all threads.
+
+:class:`UpstreamMetrics` turns the client's request events (see
+:mod:`pddiktipy.events`) into upstream latency, status, retry and
+in-flight metrics per endpoint family.
+"""
+import bisect
+import math
+import threading
+import weakref
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from .events import Event, EventHooks
+
+# Content type of MetricsRegistry.render()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets in seconds, from cached replies to upstream timeouts
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _ShardHolder:
+    """Thread-local owner of a shard; collected when its thread ends."""
+
+    __slots__ = ("shard", "__weakref__")
+
+    def __init__(self, shard: Dict[Labels, List[float]]) -> None:
+        self.shard = shard
+
+
+class _Metric:
+    """A metric family: ``_size`` values per label set, sharded per thread."""
+
+    kind = "untyped"
+    _size = 1
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        # Shards of live threads by id (shards compare by value)
+        self._shards: Dict[int, Dict[Labels, List[float]]] = {}
+        # Values of threads that have ended
+        self._retired: Dict[Labels, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def _cells(self, labels: Labels) -> List[float]:
+        """This thread's values for ``labels``, written by no other thread."""
+        try:
+            shard = self._local.holder.shard
+        except AttributeError:
+            shard = {}
+            holder = self._local.holder = _ShardHolder(shard)
+            # The thread-local holder goes away with its thread
+            weakref.finalize(holder, self._retire, shard)
+            with self._lock:
+                self._shards[id(shard)] = shard
+        cells = shard.get(labels)
+        if cells is None:
+            if len(labels) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {labels}")
+            cells = [0.0] * self._size
+            # Readers copy the shards under this lock
+            with self._lock:
+                shard[labels] = cells
+        return cells
+
+    def _retire(self, shard: Dict[Labels, List[float]]) -> None:
+        """Fold the shard of an ended thread into the retired total."""
+        with self._lock:
+            del self._shards[id(shard)]
+            for labels, cells in shard.items():
+                total = self._retired.get(labels)
+                if total is None:
+                    self._retired[labels] = list(cells)
+                else:
+                    for i, value in enumerate(cells):
+                        total[i] += value
+
+    def totals(self) -> Dict[Labels, List[float]]:
+        """Values per label set, summed over all threads."""
+        with self._lock:
+            shards = [list(shard.items()) for shard in self._shards.values()]
+            shards.append([(labels, list(cells)) for labels, cells in self._retired.items()])
+        totals: Dict[Labels, List[float]] = {}
+        for shard in shards:
+            for labels, cells in shard:
+                total = totals.get(labels)
+                if total is None:
+                    totals[labels] = list(cells)
+                else:
+                    for i, value in enumerate(cells):
+                        total[i] += value
+        return totals
+
+    def samples(self) -> Iterable[str]:
+        for labels, cells in sorted(self.totals().items()):
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(cells[0])}"
+
+
+class Counter(_Metric):
+    """Monotonic count, e.g. requests served."""
+
+    kind = "counter"
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        self._cells(labelvalues)[0] += amount
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, e.g. requests in flight.
+
+    Increments and decrements may come from different threads; the shards
+    still add up to the right value.
+    """
+
+    kind = "gauge"
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        self._cells(labelvalues)[0] += amount
+
+    def dec(self, *labelvalues: str, amount: float = 1.0) -> None:
+        self._cells(labelvalues)[0] -= amount
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in fixed buckets, e.g. latencies.
+
+    Args:
+        buckets: Increasing upper bounds; ``+Inf`` is added automatically.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        super().__init__(name, documentation, labelnames)
+        bounds = sorted(float(b) for b in buckets if not math.isinf(b))
+        self.buckets = tuple(bounds) + (math.inf,)
+        # One count per bucket, then the sum of observed values
+        self._size = len(self.buckets) + 1
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        cells = self._cells(labelvalues)
+        cells[bisect.bisect_left(self.buckets, value)] += 1
+        cells[-1] += value
+
+    def samples(self) -> Iterable[str]:
+        for labels, cells in sorted(self.totals().items()):
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, cells):
+                cumulative += count
+                le = 'le="%s"' % _format_value(bound)
+                yield (f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} "
+                       f"{_format_value(cumulative)}")
+            suffix = _format_labels(self.labelnames, labels)
+            yield f"{self.name}_sum{suffix} {_format_value(cells[-1])}"
+            yield f"{self.name}_count{suffix} {_format_value(cumulative)}"
+
+
+class CallbackMetric(_Metric):
+    """Metric read from ``collect`` at render time, e.g. cache counters.
+
+    Args:
+        kind: ``"counter"`` or ``"gauge"``.
+        collect: Returns ``(labelvalues, value)`` pairs.
+    """
+
+    def __init__(self, name: str, documentation: str, kind: str, labelnames: Sequence[str],
+                 collect: Callable[[], Iterable[Tuple[Labels, float]]]) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.kind = kind
+        self.collect = collect
+
+    def totals(self) -> Dict[Labels, List[float]]:
+        return {tuple(labels): [float(value)] for labels, value in self.collect()}
+
+
+class MetricsRegistry:
+    """Metrics rendered together for one ``/metrics`` endpoint.
+
+    Example:
+        >>> registry = MetricsRegistry()
+        >>> hits = registry.counter("app_hits_total", "Hits", ["route"])
+        >>> hits.inc("/search")
+        >>> print(registry.render())
+        # HELP app_hits_total Hits
+        # TYPE app_hits_total counter
+        app_hits_total{route="/search"} 1
+        <BLANKLINE>
+    """
+
+    def __init__(self) -> None:
+        self._metrics: List[_Metric] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if any(m.name == metric.name for m in self._metrics):
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(self, name: str, documentation: str, kind: str, labelnames: Sequence[str],
+                 collect: Callable[[], Iterable[Tuple[Labels, float]]]) -> CallbackMetric:
+        return self.register(CallbackMetric(name, documentation, kind, labelnames, collect))
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics)
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+class UpstreamMetrics:
+    """Upstream request metrics per endpoint family, fed by client events.
+
+    Records request duration (all attempts), requests by final status
+    (``error`` when no response arrived), retries and requests in flight.
+    Requests that never reach the upstream (fresh disk cache hits, open
+    circuits) are left out.
+
+    Args:
+        registry: Registry to add the metrics to.
+        prefix: Metric name prefix.
+        buckets: Histogram buckets for the request duration, in seconds.
+
+    Example:
+        >>> registry = MetricsRegistry()
+        >>> events = EventHooks()
+        >>> unsubscribe = UpstreamMetrics(registry).attach(events)
+        >>> pool = ClientPool(events=events)
+    """
+
+    def __init__(self, registry: MetricsRegistry, prefix: str = "pddikti_upstream",
+                 buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.duration = registry.histogram(
+            f"{prefix}_request_duration_seconds",
+            "Upstream request duration including retries, by endpoint family",
+            ["family"], buckets
+        )
+        self.requests = registry.counter(
+            f"{prefix}_requests_total",
+            "Upstream requests by endpoint family and final HTTP status",
+            ["family", "status"]
+        )
+        self.retries = registry.counter(
+            f"{prefix}_retries_total", "Upstream retry attempts by endpoint family", ["family"]
+        )
+        self.in_flight = registry.gauge(
+            f"{prefix}_in_flight", "Upstream requests currently in flight"
+        )
+
+    def attach(self, events: EventHooks) -> Callable[[], None]:
+        """Subscribe to ``events`` (before any request starts); returns the unsubscribe function."""
+        return events.subscribe(self, starts=True)
+
+    def __call__(self, event: Event) -> None:
+        if event.kind != "request":
+            return
+        if not event.done:
+            self.in_flight.inc()
+            return
+        self.in_flight.dec()
+        if event.attempts == 0:
+            return
+        self.duration.observe(event.elapsed, event.family)
+        status = str(event.status) if event.status is not None else "error"
+        self.requests.inc(event.family, status)
+        if event.retries:
+            self.retries.inc(event.family, amount=event.retries)
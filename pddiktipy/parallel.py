@@ -0,0 +1,472 @@
+"""
+Concurrent fan-out helpers for composite PDDIKTI calls.
+
+A composite call (e.g. a full university profile) is a set of named
+sections, each a zero-argument callable that performs one upstream request
+and raises on failure. The runners execute the sections concurrently under
+a bounded worker pool and an overall deadline, and report the outcome of
+every section individually instead of failing the whole call. Worker
+threads run in a copy of the caller's context, so an active deadline (see
+:mod:`pddiktipy.deadline`) applies to every section.
+"""
+import logging
+import threading
+import time
+from contextvars import copy_context
+from functools import partial
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import date
+from typing import (
+    TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, Iterable, Iterator,
+    Mapping, Optional, Set, Type
+)
+
+from .deadline import remaining
+
+# The async runners import asyncio when called, so the sync client never
+# loads it
+if TYPE_CHECKING:
+    import asyncio
+
+logger = logging.getLogger(__name__)
+
+# Section outcomes
+STATUS_OK = "ok"
+STATUS_EMPTY = "empty"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+
+
+@dataclass
+class SectionResult:
+    """Outcome of one section of a composite call.
+
+    Attributes:
+        name: Section name, e.g. ``"detail"``.
+        status: One of ``"ok"``, ``"empty"`` (upstream returned nothing),
+            ``"error"`` or ``"timeout"`` (deadline passed first).
+        data: The section payload, or None.
+        error: Error message when the section failed.
+        error_type: Exception class name when the section failed.
+        elapsed: Seconds spent on the section.
+    """
+    name: str
+    status: str
+    data: Any = None
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == STATUS_OK
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the status part of the section (without its payload)."""
+        return {
+            "status": self.status,
+            "error": self.error,
+            "error_type": self.error_type,
+            "elapsed": round(self.elapsed, 4),
+        }
+
+
+@dataclass
+class CompositeResult:
+    """Merged result of a composite call.
+
+    Attributes:
+        sections: Per-section results keyed by section name.
+        elapsed: Wall-clock seconds for the whole composite call.
+    """
+    sections: Dict[str, SectionResult] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Payload of every section keyed by name (None for failed sections)."""
+        return {name: section.data for name, section in self.sections.items()}
+
+    @property
+    def ok(self) -> bool:
+        """True when no section failed or timed out."""
+        return all(s.status in (STATUS_OK, STATUS_EMPTY) for s in self.sections.values())
+
+    @property
+    def failed(self) -> Dict[str, SectionResult]:
+        """Sections that raised an error or missed the deadline."""
+        return {
+            name: section for name, section in self.sections.items()
+            if section.status in (STATUS_ERROR, STATUS_TIMEOUT)
+        }
+
+    def __getitem__(self, name: str) -> Any:
+        return self.sections[name].data
+
+    def get(self, name: str, default: Any = None) -> Any:
+        section = self.sections.get(name)
+        return default if section is None or section.data is None else section.data
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serialisable view: payloads under ``data``, outcomes under ``status``."""
+        return {
+            "data": self.data,
+            "status": {name: section.to_dict() for name, section in self.sections.items()},
+            "complete": self.ok,
+            "elapsed": round(self.elapsed, 4),
+        }
+
+
+@dataclass
+class DosenPortfolio(CompositeResult):
+    """Composite result of :meth:`api.get_dosen_portfolio` with typed accessors."""
+
+    @property
+    def profile(self) -> Optional[Dict[str, Any]]:
+        return self.get("profile")
+
+    @property
+    def penelitian(self) -> Any:
+        return self.get("penelitian", [])
+
+    @property
+    def pengabdian(self) -> Any:
+        return self.get("pengabdian", [])
+
+    @property
+    def karya(self) -> Any:
+        return self.get("karya", [])
+
+    @property
+    def paten(self) -> Any:
+        return self.get("paten", [])
+
+    @property
+    def study_history(self) -> Any:
+        return self.get("study_history", [])
+
+    @property
+    def teaching_history(self) -> Any:
+        return self.get("teaching_history", [])
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        """Seconds spent on each section, keyed by section name."""
+        return {name: section.elapsed for name, section in self.sections.items()}
+
+
+class BulkResult(SectionResult):
+    """Outcome of one item of a bulk lookup; ``name`` holds the looked-up ID."""
+
+    @property
+    def id(self) -> str:
+        return self.name
+
+
+def _section_from_value(name: str, value: Any, elapsed: float,
+                        section_type: Type[SectionResult] = SectionResult) -> SectionResult:
+    status = STATUS_EMPTY if value is None or value == [] or value == {} else STATUS_OK
+    return section_type(name=name, status=status, data=value, elapsed=elapsed)
+
+
+def _section_from_error(name: str, error: BaseException, elapsed: float,
+                        section_type: Type[SectionResult] = SectionResult) -> SectionResult:
+    message = getattr(error, "message", None) or str(error)
+    return section_type(
+        name=name,
+        status=STATUS_ERROR,
+        error=message,
+        error_type=type(error).__name__,
+        elapsed=elapsed,
+    )
+
+
+def _timeout_section(name: str, timeout: float) -> SectionResult:
+    return SectionResult(
+        name=name,
+        status=STATUS_TIMEOUT,
+        error=f"Section did not finish within {timeout} seconds",
+        error_type="APITimeoutError",
+        elapsed=timeout,
+    )
+
+
+def _run_one(name: str, call: Callable[[], Any],
+             section_type: Type[SectionResult] = SectionResult) -> SectionResult:
+    start = time.perf_counter()
+    try:
+        value = call()
+    except Exception as e:
+        return _section_from_error(name, e, time.perf_counter() - start, section_type)
+    return _section_from_value(name, value, time.perf_counter() - start, section_type)
+
+
+def _within_deadline(timeout: Optional[float]) -> Optional[float]:
+    """Shorten a composite timeout to the caller's remaining deadline."""
+    left = remaining()
+    if left is None:
+        return timeout
+    left = max(0.0, left)
+    return left if timeout is None else min(timeout, left)
+
+
+# Threads running the sections of sync composite calls, shared by all
+# clients so a composite call does not start threads of its own.
+_fanout_executor: Optional[ThreadPoolExecutor] = None
+_fanout_lock = threading.Lock()
+
+
+def _fanout_pool() -> ThreadPoolExecutor:
+    global _fanout_executor
+    if _fanout_executor is None:
+        with _fanout_lock:
+            if _fanout_executor is None:
+                _fanout_executor = ThreadPoolExecutor(
+                    max_workers=64, thread_name_prefix="pddikti-fanout"
+                )
+    return _fanout_executor
+
+
+def _on_fanout_worker() -> bool:
+    """True on a fan-out pool thread, where waiting on the pool could deadlock."""
+    return threading.current_thread().name.startswith("pddikti-fanout")
+
+
+def run_sections(sections: Mapping[str, Callable[[], Any]],
+                 max_workers: int = 8,
+                 timeout: Optional[float] = 10.0,
+                 result_type: Type[CompositeResult] = CompositeResult) -> CompositeResult:
+    """Run named sections concurrently on the shared fan-out thread pool.
+
+    Args:
+        sections: Mapping of section name to a zero-argument callable.
+        max_workers: Maximum number of sections in flight at once.
+        timeout: Overall deadline in seconds; sections still running when
+            it expires are reported as ``"timeout"``. None waits forever.
+        result_type: CompositeResult subclass to build, e.g. DosenPortfolio.
+
+    Returns:
+        CompositeResult: One SectionResult per section, in input order.
+
+    Called from a fan-out thread (e.g. inside a bulk lookup), the sections
+    run one after another on that thread instead, so nested calls never
+    wait on a pool their own threads fill.
+    """
+    start = time.perf_counter()
+    results: Dict[str, SectionResult] = {}
+    if not sections:
+        return result_type(results, 0.0)
+    timeout = _within_deadline(timeout)
+    expires = None if timeout is None else time.perf_counter() + timeout
+
+    if _on_fanout_worker():
+        for name, call in sections.items():
+            if expires is not None and time.perf_counter() >= expires:
+                results[name] = _timeout_section(name, timeout)
+            else:
+                results[name] = _run_one(name, call)
+        return result_type(results, time.perf_counter() - start)
+
+    pool = _fanout_pool()
+    pending = iter(sections.items())
+    futures: Dict[str, Future] = {}
+    running: Set[Future] = set()
+
+    def submit_next() -> bool:
+        for name, call in pending:
+            future = pool.submit(copy_context().run, _run_one, name, call)
+            futures[name] = future
+            running.add(future)
+            return True
+        return False
+
+    # The pool is shared, so bound this call's sections in flight here.
+    for _ in range(max(1, max_workers)):
+        if not submit_next():
+            break
+    while running:
+        left = None if expires is None else expires - time.perf_counter()
+        if left is not None and left <= 0:
+            break
+        done, running = wait(running, timeout=left, return_when=FIRST_COMPLETED)
+        for _ in done:
+            submit_next()
+
+    for name in sections:
+        future = futures.get(name)
+        if future is not None and future.done() and not future.cancelled():
+            results[name] = future.result()
+        else:
+            # Never block the caller on stragglers past the deadline.
+            if future is not None:
+                future.cancel()
+            results[name] = _timeout_section(name, timeout)
+
+    elapsed = time.perf_counter() - start
+    failed = [name for name, s in results.items() if s.status in (STATUS_ERROR, STATUS_TIMEOUT)]
+    if failed:
+        logger.warning(f"Composite call finished in {elapsed:.2f}s with failed sections: {failed}")
+    return result_type(results, elapsed)
+
+
+async def run_sections_async(sections: Mapping[str, Callable[[], Awaitable[Any]]],
+                             max_workers: int = 8,
+                             timeout: Optional[float] = 10.0,
+                             result_type: Type[CompositeResult] = CompositeResult) -> CompositeResult:
+    """Asyncio counterpart of :func:`run_sections`.
+
+    ``max_workers`` bounds the number of sections awaiting the upstream at
+    once; the callables must return awaitables.
+    """
+    import asyncio
+
+    start = time.perf_counter()
+    results: Dict[str, SectionResult] = {}
+    if not sections:
+        return result_type(results, 0.0)
+
+    timeout = _within_deadline(timeout)
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+
+    async def run(name: str, call: Callable[[], Awaitable[Any]]) -> SectionResult:
+        async with semaphore:
+            section_start = time.perf_counter()
+            try:
+                value = await call()
+            except Exception as e:
+                return _section_from_error(name, e, time.perf_counter() - section_start)
+            return _section_from_value(name, value, time.perf_counter() - section_start)
+
+    tasks = {name: asyncio.ensure_future(run(name, call)) for name, call in sections.items()}
+    await asyncio.wait(tasks.values(), timeout=timeout)
+
+    for name, task in tasks.items():
+        if task.done() and not task.cancelled():
+            results[name] = task.result()
+        else:
+            task.cancel()
+            results[name] = _timeout_section(name, timeout)
+
+    return result_type(results, time.perf_counter() - start)
+
+
+def _unique(items: Iterable[Hashable]) -> Iterator[Any]:
+    """Yield items lazily, skipping repeats."""
+    seen: Set[Hashable] = set()
+    for item in items:
+        if item in seen:
+            continue
+        seen.add(item)
+        yield item
+
+
+def iter_many(fetch: Callable[[Any], Any],
+              ids: Iterable[Any],
+              concurrency: int = 8) -> Iterator[BulkResult]:
+    """Look up many IDs concurrently, yielding results in completion order.
+
+    The input iterable is consumed lazily and repeated IDs are fetched only
+    once, so arbitrarily large ID streams run in bounded memory (apart from
+    the set of IDs already seen). Lookups run on the shared fan-out pool,
+    at most ``concurrency`` of them in flight at any time.
+
+    Args:
+        fetch: Callable taking one ID and raising on failure.
+        ids: IDs to look up; duplicates are skipped.
+        concurrency: Maximum number of lookups in flight.
+
+    Yields:
+        BulkResult: One result per unique ID with status ``"ok"``,
+            ``"empty"`` or ``"error"``.
+    """
+    pending_ids = _unique(ids)
+    if _on_fanout_worker():
+        # Nested in a fan-out thread: look up one by one (see run_sections)
+        for item in pending_ids:
+            yield _run_one(item, partial(fetch, item), BulkResult)
+        return
+    # Shared pool; the window of futures below bounds this call's lookups
+    pool = _fanout_pool()
+    in_flight: Set[Future] = set()
+
+    def submit_next() -> bool:
+        for item in pending_ids:
+            in_flight.add(pool.submit(
+                copy_context().run, _run_one, item, partial(fetch, item), BulkResult
+            ))
+            return True
+        return False
+
+    try:
+        for _ in range(max(1, concurrency)):
+            if not submit_next():
+                break
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                in_flight.discard(future)
+                submit_next()
+                yield future.result()
+    finally:
+        # Consumer stopped early: drop queued work, let running calls finish.
+        for future in in_flight:
+            future.cancel()
+
+
+async def iter_many_async(fetch: Callable[[Any], Awaitable[Any]],
+                          ids: Iterable[Any],
+                          concurrency: int = 8) -> AsyncIterator[BulkResult]:
+    """Asyncio counterpart of :func:`iter_many` (an async generator)."""
+    import asyncio
+
+    pending_ids = _unique(ids)
+    in_flight: Set["asyncio.Task[BulkResult]"] = set()
+
+    async def run(item: Any) -> BulkResult:
+        start = time.perf_counter()
+        try:
+            value = await fetch(item)
+        except Exception as e:
+            return _section_from_error(item, e, time.perf_counter() - start, BulkResult)
+        return _section_from_value(item, value, time.perf_counter() - start, BulkResult)
+
+    def submit_next() -> bool:
+        for item in pending_ids:
+            in_flight.add(asyncio.ensure_future(run(item)))
+            return True
+        return False
+
+    try:
+        for _ in range(max(1, concurrency)):
+            if not submit_next():
+                break
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                in_flight.discard(task)
+                submit_next()
+                yield task.result()
+    finally:
+        for task in in_flight:
+            task.cancel()
+
+
+def current_semester(today: Optional[date] = None) -> int:
+    """Return the current academic semester in YYYYS format.
+
+    The odd semester (1) runs August-January and the even semester (2)
+    February-July; YYYY is the year the academic year started.
+
+    Example:
+        >>> current_semester(date(2024, 9, 1))
+        20241
+        >>> current_semester(date(2025, 3, 1))
+        20242
+    """
+    today = today or date.today()
+    if today.month >= 8:
+        return today.year * 10 + 1
+    if today.month == 1:
+        return (today.year - 1) * 10 + 1
+    return (today.year - 1) * 10 + 2
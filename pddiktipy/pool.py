@@ -0,0 +1,216 @@
+"""
+Thread-safe pool of long-lived PDDIKTI API clients.
+"""
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from .api import api, _client_stats
+from .disk_cache import DiskCache
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .circuit import CircuitBreakers
+from .hedging import HedgePolicy
+from .events import EventHooks
+from .stats import ClientStats
+from .timeouts import AdaptiveTimeouts
+from .transport import Transport
+from .exceptions import PDDIKTIError, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+class ClientPool:
+    """Process-wide pool of reusable :class:`api` clients.
+
+    Each client keeps its own ``requests.Session`` so keep-alive connections
+    and the ``HTTPAdapter`` connection pool survive between calls. Clients
+    are created lazily up to ``size`` and handed out LIFO, so the most
+    recently used (and therefore warmest) connection is reused first.
+
+    Args:
+        size: Maximum number of clients, usually the worker threadpool size.
+        pool_connections: Forwarded to every client's ``HTTPAdapter``.
+        pool_maxsize: Forwarded to every client's ``HTTPAdapter``.
+        acquire_timeout: Seconds to wait for a free client before failing.
+        base_url: Optional upstream base URL override for every client.
+        factory: Optional callable building a client, mainly for tests.
+        cache: Optional :class:`DiskCache` shared by every client.
+        rate_limit: Requests per second for the whole pool, or a
+            :class:`RateLimiter`; one limiter is shared by every client.
+        retry: :class:`RetryPolicy` for every client.
+        circuit_breakers: Circuit breaker registry for every client; the
+            default process-wide registry is shared by the whole pool.
+        hedge: Optional :class:`HedgePolicy` shared by every client, so its
+            cap on extra requests applies to the whole pool.
+        transport: Optional :class:`Transport` shared by every client, e.g.
+            a :class:`MemoryTransport` for offline load tests. The pool does
+            not close it.
+        events: :class:`EventHooks` shared by every client, so one
+            subscriber sees the requests of the whole pool. Defaults to new
+            hooks, see :attr:`events`.
+        adaptive_timeouts: Optional :class:`AdaptiveTimeouts` shared by every
+            client, so the whole pool learns the timeouts together.
+        stats: Keep per-method statistics, as for :class:`api`. Every client
+            of the pool then records into one
+            :class:`~pddiktipy.stats.ClientStats`, read with :meth:`stats`.
+
+    Example:
+        >>> pool = ClientPool(size=8)
+        >>> with pool.client() as client:
+        ...     client.search_pt("Gadjah Mada")
+        >>> pool.close()
+    """
+
+    def __init__(self,
+                 size: int = 10,
+                 pool_connections: int = 10,
+                 pool_maxsize: int = 10,
+                 acquire_timeout: Optional[float] = 30,
+                 base_url: Optional[str] = None,
+                 factory: Optional[Callable[[], api]] = None,
+                 cache: Optional[DiskCache] = None,
+                 rate_limit: Optional[Union[float, RateLimiter]] = None,
+                 retry: Optional[RetryPolicy] = None,
+                 circuit_breakers: Union[bool, CircuitBreakers] = True,
+                 hedge: Optional[HedgePolicy] = None,
+                 transport: Optional[Transport] = None,
+                 events: Optional[EventHooks] = None,
+                 adaptive_timeouts: Optional[AdaptiveTimeouts] = None,
+                 stats: Union[bool, ClientStats] = False) -> None:
+        if size < 1:
+            raise ValidationError("Pool size must be at least 1")
+
+        self.size = size
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.acquire_timeout = acquire_timeout
+        self.base_url = base_url
+        self.cache = cache
+        # One limiter for the whole pool, so the rate applies to all clients
+        if isinstance(rate_limit, (int, float)) and not isinstance(rate_limit, bool):
+            rate_limit = RateLimiter(rate_limit)
+        self.limiter = rate_limit
+        self.retry = retry
+        self.circuit_breakers = circuit_breakers
+        self.hedge = hedge
+        self.transport = transport
+        self.events = events if events is not None else EventHooks()
+        self.adaptive_timeouts = adaptive_timeouts
+        self._stats: Optional[ClientStats] = _client_stats(stats, self.events)
+        self._factory = factory or self._default_factory
+        self._idle: "queue.LifoQueue[api]" = queue.LifoQueue(maxsize=size)
+        self._clients: List[api] = []
+        self._lock = threading.Lock()
+
+    def _default_factory(self) -> api:
+        return api(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            base_url=self.base_url,
+            cache=self.cache,
+            rate_limit=self.limiter,
+            retry=self.retry,
+            circuit_breakers=self.circuit_breakers,
+            hedge=self.hedge,
+            transport=self.transport,
+            events=self.events,
+            stats=self._stats if self._stats is not None else False,
+            adaptive_timeouts=self.adaptive_timeouts
+        )
+
+    def stats(self, reset: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Per-method statistics of all clients of the pool, as :meth:`api.stats`."""
+        if self._stats is None:
+            return {}
+        report = self._stats.snapshot()
+        if reset:
+            self._stats.reset()
+        return report
+
+    @property
+    def created(self) -> int:
+        """Number of clients currently owned by the pool."""
+        return len(self._clients)
+
+    def warm(self, count: int = 1) -> None:
+        """Create up to ``count`` idle clients ahead of the first request."""
+        for _ in range(count):
+            client = self._create()
+            if client is None:
+                break
+            self._idle.put_nowait(client)
+
+    def _create(self) -> Optional[api]:
+        with self._lock:
+            if len(self._clients) >= self.size:
+                return None
+            client = self._factory()
+            self._clients.append(client)
+            return client
+
+    def acquire(self) -> api:
+        """Take a client out of the pool, creating one if there is room.
+
+        Raises:
+            PDDIKTIError: If no client becomes free within ``acquire_timeout``.
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        client = self._create()
+        if client is not None:
+            return client
+
+        try:
+            return self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            raise PDDIKTIError(
+                f"No API client available after {self.acquire_timeout} seconds"
+            )
+
+    def release(self, client: api) -> None:
+        """Return a client previously obtained from :meth:`acquire`."""
+        if client not in self._clients:
+            # Pool was drained while the client was checked out.
+            client.close()
+            return
+        self._idle.put_nowait(client)
+
+    @contextmanager
+    def client(self) -> Iterator[api]:
+        """Context manager that acquires a client and always releases it."""
+        client = self.acquire()
+        try:
+            yield client
+        finally:
+            self.release(client)
+
+    def close(self) -> None:
+        """Close every client owned by the pool.
+
+        The pool stays usable afterwards; new clients are created on demand.
+        Clients that are checked out while the pool is drained are closed when
+        they are released.
+        """
+        with self._lock:
+            clients, self._clients = self._clients, []
+            while True:
+                try:
+                    self._idle.get_nowait()
+                except queue.Empty:
+                    break
+
+        for client in clients:
+            client.close()
+        logger.debug(f"Client pool drained ({len(clients)} clients closed)")
+
+    def __enter__(self) -> 'ClientPool':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
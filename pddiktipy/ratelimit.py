@@ -0,0 +1,134 @@
+"""
+Client-side adaptive rate limiting for upstream requests.
+
+A token bucket spaces requests out to a target rate shared by every thread
+(or coroutine) using the limiter. The rate adapts AIMD-style: a 429 halves
+it and pauses all callers for the server's ``Retry-After``, and each second
+of healthy responses adds a little back, up to the configured ceiling.
+"""
+import email.utils
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+def parse_retry_after(value: Optional[str], default: Optional[float] = 1.0) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delta seconds or HTTP date) into seconds.
+
+    Returns ``default`` when the header is missing or unparseable.
+    """
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        moment = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    return max(0.0, moment.timestamp() - time.time())
+
+
+class RateLimiter:
+    """Thread-safe token bucket with additive-increase/multiplicative-decrease.
+
+    Callers reserve a token with :meth:`reserve` and sleep for the returned
+    delay (so the same limiter works for threads and asyncio), or use the
+    blocking :meth:`acquire`.
+
+    Args:
+        rate: Target (and maximum) requests per second.
+        burst: Bucket size, i.e. requests allowed back to back. Defaults to
+            ``rate`` (one second's worth).
+        min_rate: Floor the rate never drops below after repeated 429s.
+        decrease: Factor applied to the rate on each 429.
+        increase: Requests per second added back per healthy second.
+        max_pause: Upper bound on a single ``Retry-After`` pause.
+        clock: Monotonic time source, injectable for tests.
+
+    Example:
+        >>> limiter = RateLimiter(rate=10)
+        >>> client = api(rate_limit=limiter)
+    """
+
+    def __init__(self,
+                 rate: float,
+                 burst: Optional[float] = None,
+                 min_rate: float = 0.5,
+                 decrease: float = 0.5,
+                 increase: float = 1.0,
+                 max_pause: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.min_rate = min(min_rate, rate)
+        self.decrease = decrease
+        self.increase = increase
+        self.max_pause = max_pause
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        # Tokens accrue from this moment; it lies in the future during a pause
+        self._updated = clock()
+        self._last_increase = self._updated
+        self.throttled = 0
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """Take one token and return how many seconds to wait before sending.
+
+        Args:
+            max_wait: If the wait would be at least this long, take no token
+                and return None instead (e.g. the caller's deadline is
+                nearer than the slot).
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            wait = max(0.0, self._updated - now)
+            if self._tokens < 1:
+                wait += (1 - self._tokens) / self.rate
+            if max_wait is not None and wait >= max_wait:
+                return None
+            self._tokens -= 1
+            return wait
+
+    def acquire(self) -> None:
+        """Block until the caller may send a request."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """Back off after a 429: cut the rate and pause for ``retry_after``."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self._tokens = min(self._tokens, 0.0)
+            pause = min(self.max_pause, retry_after if retry_after is not None else 1.0)
+            self._updated = max(self._updated, now + pause)
+            self._last_increase = self._updated
+
+    def on_success(self) -> None:
+        """Record a healthy response, raising the rate at most once a second."""
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            now = self._clock()
+            if now - self._last_increase >= 1.0:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+                self._last_increase = now
+
+    def stats(self) -> Dict[str, float]:
+        """Current rate, its ceiling and the number of 429 back-offs."""
+        return {"rate": self.rate, "max_rate": self.max_rate, "throttled": self.throttled}
@@ -0,0 +1,123 @@
+"""
+Single retry policy for upstream requests.
+
+Every GET made by :class:`pddiktipy.helper.helper` goes through one
+:class:`RetryPolicy`: a capped number of attempts within a total deadline,
+with full-jitter exponential backoff. Only transient failures are retried
+(timeouts, connection errors, 429 and 5xx); validation errors, 404s and
+other client errors fail immediately. All endpoints are idempotent GETs.
+Attempts and backoff also stay within the caller's deadline, if one is set.
+"""
+import random
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, FrozenSet, Optional, TypeVar
+
+from .deadline import clamp_timeout, remaining
+from .exceptions import (
+    PDDIKTIError, APIConnectionError, APITimeoutError, APIRateLimitError, DeadlineExceededError,
+    ValidationError
+)
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how long to retry one logical upstream request.
+
+    Attributes:
+        max_attempts: Total attempts including the first one.
+        deadline: Seconds for all attempts and backoff together, or None.
+            Per-attempt timeouts are shortened to what remains of it.
+        backoff: Base delay; attempt ``n`` waits up to ``backoff * 2**(n-1)``.
+        max_backoff: Upper bound on a single backoff delay.
+        retry_statuses: HTTP statuses worth retrying.
+
+    Example:
+        >>> client = api(retry=RetryPolicy(max_attempts=2, deadline=10))
+    """
+    max_attempts: int = 3
+    deadline: Optional[float] = 60.0
+    backoff: float = 0.5
+    max_backoff: float = 8.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Return True for transient failures of an idempotent request."""
+        if isinstance(error, (ValidationError, DeadlineExceededError)):
+            return False
+        if isinstance(error, (APITimeoutError, APIConnectionError, APIRateLimitError)):
+            return True
+        if isinstance(error, PDDIKTIError):
+            return error.status_code in self.retry_statuses
+        return False
+
+    def delay(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        """Full-jitter backoff after ``attempt``, at least the server's Retry-After."""
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def _next_delay(self, attempt: int, error: BaseException, started: float) -> Optional[float]:
+        """Seconds to wait before another attempt, or None to give up."""
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return None
+        delay = self.delay(attempt, error)
+        if self.deadline is not None and time.monotonic() - started + delay >= self.deadline:
+            return None
+        # The caller's own deadline (see pddiktipy.deadline) bounds retries too
+        left = remaining()
+        if left is not None and delay >= left:
+            return None
+        return delay
+
+    def _attempt_timeout(self, timeout: Optional[float], started: float) -> Optional[float]:
+        if self.deadline is not None:
+            left = max(0.01, self.deadline - (time.monotonic() - started))
+            timeout = left if timeout is None else min(timeout, left)
+        return clamp_timeout(timeout)
+
+    def run(self, attempt: Callable[[Optional[float]], T], timeout: Optional[float] = None) -> T:
+        """Call ``attempt(per_attempt_timeout)`` until it succeeds or the policy gives up.
+
+        Raises:
+            The last error once attempts, deadline or retryability run out.
+        """
+        started = time.monotonic()
+        number = 0
+        while True:
+            number += 1
+            try:
+                return attempt(self._attempt_timeout(timeout, started))
+            except Exception as e:
+                delay = self._next_delay(number, e, started)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+
+    async def run_async(self, attempt: Callable[[Optional[float]], Awaitable[T]],
+                        timeout: Optional[float] = None) -> T:
+        """Asyncio counterpart of :meth:`run`."""
+        import asyncio  # only async callers pay for the import
+
+        started = time.monotonic()
+        number = 0
+        while True:
+            number += 1
+            try:
+                return await attempt(self._attempt_timeout(timeout, started))
+            except Exception as e:
+                delay = self._next_delay(number, e, started)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+
+
+# Policy used when a client is created without one
+DEFAULT_RETRY = RetryPolicy()
+
+# Single attempt, for callers that handle failures themselves
+NO_RETRY = RetryPolicy(max_attempts=1, deadline=None)
@@ -0,0 +1,177 @@
+"""
+Request coalescing ("singleflight") for identical in-flight calls.
+
+When several callers ask for the same key while a call for it is already
+running, only the first caller (the leader) does the work; the others wait
+and receive the leader's result or exception. Nothing is cached once the
+call completes, so this complements rather than replaces a cache.
+
+Followers keep their own deadline (see :mod:`pddiktipy.deadline`): they
+stop waiting when it expires, and when the leader fails only because its
+deadline expired, followers with time left try again themselves.
+"""
+import threading
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+from .deadline import remaining
+from .exceptions import DeadlineExceededError
+
+# AsyncSingleFlight imports asyncio when used, so the sync client never loads it
+if TYPE_CHECKING:
+    import asyncio
+
+T = TypeVar('T')
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Thread-safe group of coalesced calls keyed by a hashable key.
+
+    Attributes:
+        coalesced: Number of calls that were served by another caller's
+            in-flight request instead of running themselves.
+
+    Example:
+        >>> flights = SingleFlight()
+        >>> flights.do(url, session.get, url)  # concurrent callers share one GET
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct keys currently being fetched."""
+        return len(self._calls)
+
+    def do(self, key: Hashable, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``func(*args, **kwargs)`` unless a call for ``key`` is already running.
+
+        Returns:
+            The result of the (possibly shared) call.
+
+        Raises:
+            DeadlineExceededError: If the caller's deadline expires while
+                it waits for another caller's call.
+            Whatever the leader's call raised.
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                if call is None:
+                    call = self._calls[key] = _Call()
+                    break
+                call.waiters += 1
+                self.coalesced += 1
+
+            if not call.done.wait(remaining()):
+                raise DeadlineExceededError("Deadline expired waiting for a coalesced request")
+            if isinstance(call.error, DeadlineExceededError):
+                # Only the leader's deadline ran out; try again with ours
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """Asyncio counterpart of :class:`SingleFlight` (one per event loop)."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        import asyncio
+
+        while True:
+            future = self._calls.get(key)
+            if future is None or future.done():
+                break
+            self.coalesced += 1
+            try:
+                # shield: a follower giving up must not cancel the leader's call
+                return await asyncio.wait_for(asyncio.shield(future), remaining())
+            except asyncio.TimeoutError:
+                if future.done():
+                    raise  # the leader's own error
+                raise DeadlineExceededError(
+                    "Deadline expired waiting for a coalesced request"
+                ) from None
+            except DeadlineExceededError:
+                # Only the leader's deadline ran out; try again with ours
+                continue
+
+        future = asyncio.ensure_future(func(*args, **kwargs))
+        self._calls[key] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if future.done():
+                self._forget(key, future)
+            else:
+                future.add_done_callback(lambda f: self._forget(key, f))
+
+    def _forget(self, key: Hashable, future: "asyncio.Future[Any]") -> None:
+        # A follower may already lead a new call for the key
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            future.exception()  # mark retrieved; every waiter already saw it
+
+
+# Process-wide group shared by every helper, so calls coalesce across clients
+# (e.g. the service's client pool); helpers key it by transport and URL.
+_shared_group = SingleFlight()
+
+
+def shared_group() -> SingleFlight:
+    """Return the process-wide SingleFlight group used by ``helper``."""
+    return _shared_group
+
+
+def singleflight(func: Callable[..., T]) -> Callable[..., T]:
+    """Decorator coalescing concurrent calls made with identical arguments.
+
+    Arguments must be hashable. The group is available as ``func.flights``.
+
+    Example:
+        >>> @singleflight
+        ... def fetch(keyword): ...
+    """
+    flights = SingleFlight()
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        key: Tuple[Any, ...] = (args, tuple(sorted(kwargs.items())))
+        return flights.do(key, func, *args, **kwargs)
+
+    wrapper.flights = flights
+    return wrapper
@@ -0,0 +1,532 @@
+"""
+Local stand-in for the PDDIKTI upstream, for offline benchmarks and load tests.
+
+:class:`StandInServer` answers every path used by :class:`pddiktipy.api.api`
+(``pencarian/*``, ``detail/*``, ``pt/*``, ``prodi/*``, ``dosen/*``,
+``mahasiswa/*``, ``visualisasi/*``, ``contributor/*`` and ``news/*``) with
+deterministic synthetic payloads shaped like the real ones. You can tune:
+
+* latency, drawn from a :class:`Latency` distribution, optionally per
+  endpoint family;
+* injected errors, as a probability per status (e.g. 429 with
+  ``Retry-After``, 503);
+* result set sizes, so search and ``pt/prodi`` responses can be made as
+  large as needed.
+
+Paths containing ``status-<code>`` or ``delay-<ms>`` always get that status
+or extra delay, for deterministic tests. JSON responses carry an ETag and a
+Last-Modified header, and ``If-None-Match`` is answered with 304.
+
+Run it from the command line and point a client or the service at it::
+
+    python -m pddiktipy.standin --port 8765 --latency lognormal:40:0.6 \\
+        --error 429:0.02 --error 503:0.01 --rows 500
+    PDDIKTI_BASE_URL=http://127.0.0.1:8765 uvicorn pddikti_service:app
+
+or embed it::
+
+    >>> with StandInServer(latency=Latency.constant(0.02), rows=1000) as server:
+    ...     with api(base_url=server.url) as client:
+    ...         client.get_prodi_pt(pt_id, 20241)
+"""
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+LAST_MODIFIED = "Mon, 01 Jan 2024 00:00:00 GMT"
+PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+
+PROVINCES = (
+    "Aceh", "Sumatera Utara", "Sumatera Barat", "Riau", "Jambi", "Sumatera Selatan",
+    "Bengkulu", "Lampung", "Bangka Belitung", "Kepulauan Riau", "DKI Jakarta",
+    "Jawa Barat", "Jawa Tengah", "DI Yogyakarta", "Jawa Timur", "Banten", "Bali",
+    "Nusa Tenggara Barat", "Nusa Tenggara Timur", "Kalimantan Barat",
+    "Kalimantan Tengah", "Kalimantan Selatan", "Kalimantan Timur", "Kalimantan Utara",
+    "Sulawesi Utara", "Sulawesi Tengah", "Sulawesi Selatan", "Sulawesi Tenggara",
+    "Gorontalo", "Sulawesi Barat", "Maluku", "Maluku Utara", "Papua", "Papua Barat",
+)
+NAMES = ("Ahmad", "Budi", "Citra", "Dewi", "Eko", "Fitri", "Gita", "Hadi", "Indah",
+         "Joko", "Kartika", "Lestari", "Made", "Nur", "Putri", "Rizky", "Sari", "Wahyu")
+PRODI = ("Teknik Informatika", "Sistem Informasi", "Manajemen", "Akuntansi", "Hukum",
+         "Kedokteran", "Psikologi", "Arsitektur", "Teknik Sipil", "Pendidikan Matematika")
+JENJANG = ("D3", "D4", "S1", "S2", "S3", "Profesi")
+AKREDITASI = ("Unggul", "Baik Sekali", "Baik", "A", "B", "C")
+
+
+class Latency:
+    """A response latency distribution, in seconds.
+
+    Example:
+        >>> Latency.lognormal(0.04, sigma=0.6).sample(random.Random(1))
+    """
+
+    def __init__(self, sampler: Callable[[random.Random], float], description: str) -> None:
+        self._sampler = sampler
+        self.description = description
+
+    def sample(self, rng: random.Random) -> float:
+        return max(0.0, self._sampler(rng))
+
+    def __repr__(self) -> str:
+        return f"Latency({self.description})"
+
+    @classmethod
+    def constant(cls, seconds: float) -> "Latency":
+        return cls(lambda rng: seconds, f"constant {seconds}s")
+
+    @classmethod
+    def uniform(cls, low: float, high: float) -> "Latency":
+        return cls(lambda rng: rng.uniform(low, high), f"uniform {low}-{high}s")
+
+    @classmethod
+    def lognormal(cls, median: float, sigma: float = 0.5,
+                  cap: Optional[float] = None) -> "Latency":
+        """Long-tailed latency around ``median``; ``sigma`` widens the tail."""
+        mu = math.log(median) if median > 0 else -math.inf
+
+        def sample(rng: random.Random) -> float:
+            value = rng.lognormvariate(mu, sigma) if median > 0 else 0.0
+            return min(value, cap) if cap is not None else value
+        return cls(sample, f"lognormal median {median}s sigma {sigma}")
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        """Parse a command line spec in milliseconds.
+
+        ``constant:MS``, ``uniform:LOW:HIGH`` or ``lognormal:MEDIAN:SIGMA[:CAP]``.
+        """
+        kind, _, rest = spec.partition(":")
+        args = [float(part) for part in rest.split(":") if part]
+        if kind == "constant" and len(args) == 1:
+            return cls.constant(args[0] / 1000)
+        if kind == "uniform" and len(args) == 2:
+            return cls.uniform(args[0] / 1000, args[1] / 1000)
+        if kind == "lognormal" and len(args) in (2, 3):
+            cap = args[2] / 1000 if len(args) == 3 else None
+            return cls.lognormal(args[0] / 1000, args[1], cap)
+        raise ValueError(f"Invalid latency spec: {spec}")
+
+
+# --- Synthetic payloads ---------------------------------------------------
+
+def _ident(rng: random.Random) -> str:
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-"
+    return "".join(rng.choice(alphabet) for _ in range(32))
+
+
+def _person(rng: random.Random) -> str:
+    return f"{rng.choice(NAMES)} {rng.choice(NAMES)}"
+
+
+def _pt_name(rng: random.Random) -> Tuple[str, str]:
+    city = rng.choice(PROVINCES)
+    return f"Universitas {city}", "U" + "".join(w[0] for w in city.split()).upper()
+
+
+def _mahasiswa_row(rng: random.Random, term: str) -> Dict[str, Any]:
+    pt, short = _pt_name(rng)
+    return {"id": _ident(rng), "nama": f"{term.upper()} {_person(rng)}",
+            "nim": str(rng.randrange(10 ** 9, 10 ** 10)), "nama_pt": pt,
+            "singkatan_pt": short, "nama_prodi": rng.choice(PRODI)}
+
+
+def _dosen_row(rng: random.Random, term: str) -> Dict[str, Any]:
+    pt, short = _pt_name(rng)
+    return {"id": _ident(rng), "nama": f"{term.upper()} {_person(rng)}",
+            "nidn": str(rng.randrange(10 ** 9, 10 ** 10)), "nama_pt": pt,
+            "singkatan_pt": short, "nama_prodi": rng.choice(PRODI)}
+
+
+def _pt_row(rng: random.Random, term: str) -> Dict[str, Any]:
+    pt, short = _pt_name(rng)
+    ident = _ident(rng)
+    return {"id": ident, "kode": str(rng.randrange(1000, 999999)).zfill(6),
+            "nama_singkat": short, "nama": f"{pt} {term.title()}",
+            "website_link": f"/data_pt/{ident}"}
+
+
+def _prodi_row(rng: random.Random, term: str) -> Dict[str, Any]:
+    pt, short = _pt_name(rng)
+    return {"id": _ident(rng), "nama": f"{rng.choice(PRODI)} {term.title()}",
+            "jenjang": rng.choice(JENJANG), "pt": pt, "pt_singkat": short}
+
+
+def _search(row: Callable[[random.Random, str], Dict[str, Any]]):
+    def build(rng: random.Random, args: List[str], rows: int) -> Any:
+        term = args[0] if args else ""
+        return [row(rng, term) for _ in range(rows)]
+    return build
+
+
+def _search_all(rng: random.Random, args: List[str], rows: int) -> Any:
+    term = args[0] if args else ""
+    return {
+        "mahasiswa": [_mahasiswa_row(rng, term) for _ in range(rows)],
+        "dosen": [_dosen_row(rng, term) for _ in range(rows)],
+        "pt": [_pt_row(rng, term) for _ in range(rows)],
+        "prodi": [_prodi_row(rng, term) for _ in range(rows)],
+    }
+
+
+def _detail_mhs(rng: random.Random, args: List[str], rows: int) -> Any:
+    pt, _ = _pt_name(rng)
+    return {"id": args[0] if args else _ident(rng), "nama": _person(rng),
+            "nim": str(rng.randrange(10 ** 9, 10 ** 10)), "nama_pt": pt,
+            "kode_pt": str(rng.randrange(1000, 999999)).zfill(6),
+            "prodi": rng.choice(PRODI), "kode_prodi": str(rng.randrange(10000, 99999)),
+            "jenis_kelamin": rng.choice("LP"), "jenjang": rng.choice(JENJANG),
+            "status_saat_ini": rng.choice(("Aktif", "Lulus", "Cuti")),
+            "tahun_masuk": str(rng.randrange(2010, 2025))}
+
+
+def _detail_pt(rng: random.Random, args: List[str], rows: int) -> Any:
+    pt, short = _pt_name(rng)
+    return {"id": args[0] if args else _ident(rng), "nama_pt": pt, "kode_pt": short,
+            "alamat": f"Jl. {rng.choice(NAMES)} No. {rng.randrange(1, 300)}",
+            "provinsi_pt": rng.choice(PROVINCES), "website": "https://example.ac.id",
+            "email": "info@example.ac.id", "telepon": "021-" + str(rng.randrange(10 ** 6, 10 ** 7)),
+            "akreditasi_pt": rng.choice(AKREDITASI), "bentuk_pt": "Universitas",
+            "status_pt": "Aktif"}
+
+
+def _dosen_profile(rng: random.Random, args: List[str], rows: int) -> Any:
+    pt, _ = _pt_name(rng)
+    return {"id_sdm": args[0] if args else _ident(rng), "nama_dosen": _person(rng),
+            "nidn": str(rng.randrange(10 ** 9, 10 ** 10)), "nama_pt": pt,
+            "nama_prodi": rng.choice(PRODI),
+            "jabatan_akademik": rng.choice(("Asisten Ahli", "Lektor", "Lektor Kepala", "Profesor")),
+            "pendidikan_tertinggi": rng.choice(("S2", "S3")),
+            "status_ikatan_kerja": "Dosen Tetap", "status_aktivitas": "Aktif"}
+
+
+def _activities(rng: random.Random, args: List[str], rows: int) -> Any:
+    return [{"id_sdm": args[-1] if args else "", "judul_kegiatan": f"Kajian {rng.choice(PRODI)} {i}",
+             "tahun_kegiatan": str(rng.randrange(2005, 2025)),
+             "jenis_kegiatan": rng.choice(("Penelitian", "Pengabdian", "Karya", "Paten")),
+             "sumber_dana": rng.choice(("Mandiri", "Hibah", "Kemdikbud"))}
+            for i in range(min(rows, 25))]
+
+
+def _history(rng: random.Random, args: List[str], rows: int) -> Any:
+    return [{"nama_pt": _pt_name(rng)[0], "nama_prodi": rng.choice(PRODI),
+             "jenjang": rng.choice(JENJANG), "tahun": str(rng.randrange(1990, 2025))}
+            for _ in range(min(rows, 10))]
+
+
+def _prodi_pt(rng: random.Random, args: List[str], rows: int) -> Any:
+    return [{"id_sms": _ident(rng), "kode_prodi": str(rng.randrange(10000, 99999)),
+             "nama_prodi": f"{rng.choice(PRODI)} {i}", "jenjang_prodi": rng.choice(JENJANG),
+             "akreditasi": rng.choice(AKREDITASI), "status": "Aktif",
+             "jumlah_dosen": rng.randrange(5, 80), "jumlah_mahasiswa": rng.randrange(50, 5000),
+             "rasio": f"1:{rng.randrange(5, 60)}"}
+            for i in range(rows)]
+
+
+def _stats(rng: random.Random, args: List[str], rows: int) -> Any:
+    return {"id": args[-1] if args else "", "jumlah": rng.randrange(1, 100000),
+            "mean_jumlah_baru": rng.randrange(100, 5000), "rata_rata": round(rng.uniform(3, 6), 2),
+            "min": rng.randrange(1_000_000, 5_000_000), "max": rng.randrange(5_000_000, 50_000_000)}
+
+
+def _series(rng: random.Random, args: List[str], rows: int) -> Any:
+    return [{"tahun": str(2015 + i), "jumlah": rng.randrange(1, 10000)} for i in range(10)]
+
+
+def _detail_prodi(rng: random.Random, args: List[str], rows: int) -> Any:
+    pt, _ = _pt_name(rng)
+    return {"id_sms": args[0] if args else _ident(rng), "nama_prodi": rng.choice(PRODI),
+            "jenjang_didik": rng.choice(JENJANG), "nama_pt": pt,
+            "akreditasi": rng.choice(AKREDITASI), "status": "Aktif",
+            "deskripsi_singkat": "Program studi sintetis untuk pengujian lokal."}
+
+
+def _count(rng: random.Random, args: List[str], rows: int) -> Any:
+    return {"jumlah": rng.randrange(1000, 10_000_000)}
+
+
+def _chart(rng: random.Random, args: List[str], rows: int) -> Any:
+    return [{"label": label, "value": rng.randrange(1, 100000)} for label in PROVINCES]
+
+
+def _files(rng: random.Random, args: List[str], rows: int) -> Any:
+    return [{"nama_file": f"sarpras_{i}.pdf", "jenis": rng.choice(("Gedung", "Lab", "Perpustakaan"))}
+            for i in range(min(rows, 10))]
+
+
+def _news(rng: random.Random, args: List[str], rows: int) -> Any:
+    return [{"id": i, "judul": f"Berita {i}", "tanggal": f"2024-01-{i % 28 + 1:02d}"}
+            for i in range(min(rows, 20))]
+
+
+# Payload builders keyed by path prefix; the longest matching prefix wins
+SHAPES: Dict[str, Callable[[random.Random, List[str], int], Any]] = {
+    "pencarian/all": _search_all,
+    "pencarian/mhs": _search(_mahasiswa_row),
+    "pencarian/dosen": _search(_dosen_row),
+    "pencarian/pt": _search(_pt_row),
+    "pencarian/prodi": _search(_prodi_row),
+    "detail/mhs": _detail_mhs,
+    "detail/pt": _detail_pt,
+    "dosen/profile": _dosen_profile,
+    "dosen/portofolio": _activities,
+    "dosen/study-history": _history,
+    "dosen/teaching-history": _history,
+    "dosen/homebase": _history,
+    "dosen/penghitung-ratio": _stats,
+    "dosen/count-active": _count,
+    "mahasiswa/count-active": _count,
+    "pt/prodi": _prodi_pt,
+    "pt/name-histories": _history,
+    "pt/sarpras-file-name": _files,
+    "pt/count": _count,
+    "pt": _stats,
+    "prodi/detail": _detail_prodi,
+    "prodi/desc": _detail_prodi,
+    "prodi/name-histories": _history,
+    "prodi/count": _count,
+    "prodi/bidang-ilmu": _chart,
+    "prodi/daya-tampung": _series,
+    "prodi/graduation-rate": _series,
+    "prodi": _stats,
+    "visualisasi": _chart,
+    "contributor/contributor": _news,
+    "news/list": _news,
+}
+IMAGE_PREFIXES = ("pt/logo", "prodi/logo-pt")
+
+
+def _shape_for(segments: List[str]) -> Tuple[Optional[str], List[str]]:
+    """Return the SHAPES key matching ``segments`` and the remaining arguments."""
+    for length in range(min(len(segments), 3), 0, -1):
+        prefix = "/".join(segments[:length])
+        if prefix in SHAPES or prefix in IMAGE_PREFIXES:
+            return prefix, segments[length:]
+    return None, segments
+
+
+def _family(segments: List[str]) -> str:
+    return "/".join(segments[:2])
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; with Nagle's algorithm the body
+    # waits for the client's delayed ACK (~40 ms per keep-alive request)
+    disable_nagle_algorithm = True
+    server: "StandInServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json",
+              headers: Optional[Mapping[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        parts = urlsplit(self.path)
+        segments = [unquote(part) for part in parts.path.split("/") if part]
+        family = _family(segments)
+        delay, status = self.server.plan(family, self.path)
+        if delay > 0:
+            time.sleep(delay)
+
+        if status is not None:
+            headers = {"Retry-After": str(self.server.retry_after)} if status == 429 else None
+            body = json.dumps({"message": f"stand-in error {status}"}).encode()
+            self._send(status, body, headers=headers)
+            return
+
+        prefix, args = _shape_for(segments)
+        if prefix is None:
+            self.server.count("not_found")
+            self._send(404, json.dumps({"message": "Not Found"}).encode())
+        elif prefix in IMAGE_PREFIXES:
+            self._send(200, self.server.image(parts.path), content_type="image/png")
+        else:
+            body, etag = self.server.body(prefix, tuple(args), parts.path + "?" + parts.query)
+            validators = {"ETag": etag, "Last-Modified": LAST_MODIFIED}
+            if self.headers.get("If-None-Match") == etag:
+                self.server.count("not_modified")
+                self._send(304, b"", headers=validators)
+            else:
+                self._send(200, body, headers=validators)
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded local PDDIKTI stand-in.
+
+    Args:
+        host: Interface to bind.
+        port: Port to bind; 0 picks a free one (see :attr:`url`).
+        latency: Default response latency distribution. Defaults to none.
+        family_latency: Latency per endpoint family (e.g. ``"detail/pt"``),
+            overriding ``latency``.
+        errors: Probability of answering with each status, e.g.
+            ``{429: 0.02, 503: 0.01}``.
+        retry_after: ``Retry-After`` seconds sent with injected 429s.
+        rows: Rows in search results and ``pt/prodi`` lists.
+        logo_bytes: Size of the synthetic logo images.
+        seed: Seed for latency and error sampling.
+
+    Attributes:
+        counters: Requests per endpoint family plus ``errors_<status>``,
+            ``not_found`` and ``not_modified`` counts.
+    """
+
+    daemon_threads = True
+
+    def __init__(self,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 latency: Optional[Latency] = None,
+                 family_latency: Optional[Mapping[str, Latency]] = None,
+                 errors: Optional[Mapping[int, float]] = None,
+                 retry_after: float = 1.0,
+                 rows: int = 20,
+                 logo_bytes: int = 8192,
+                 seed: Optional[int] = None) -> None:
+        super().__init__((host, port), _Handler)
+        self.latency = latency
+        self.family_latency = dict(family_latency or {})
+        self.errors = dict(errors or {})
+        self.retry_after = retry_after
+        self.rows = rows
+        self.logo_bytes = logo_bytes
+        self.counters: Counter = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        # Payloads are deterministic per path, so render each one only once
+        self.body = lru_cache(maxsize=4096)(self._render)
+        self.image = lru_cache(maxsize=256)(self._image)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.counters[key] += 1
+
+    def plan(self, family: str, path: str) -> Tuple[float, Optional[int]]:
+        """Draw the latency and (injected) error status for one request."""
+        latency = self.family_latency.get(family, self.latency)
+        with self._lock:
+            self.counters[family] += 1
+            delay = latency.sample(self._rng) if latency is not None else 0.0
+            status = None
+            roll = self._rng.random()
+            for code, probability in self.errors.items():
+                if roll < probability:
+                    status = code
+                    break
+                roll -= probability
+
+        forced_delay = re.search(r"delay-(\d+)", path)
+        if forced_delay:
+            delay += int(forced_delay.group(1)) / 1000
+        forced_status = re.search(r"status-(\d{3})", path)
+        if forced_status:
+            status = int(forced_status.group(1))
+        if status is not None:
+            self.count(f"errors_{status}")
+        return delay, status
+
+    def _render(self, prefix: str, args: Tuple[str, ...], key: str) -> Tuple[bytes, str]:
+        rng = random.Random(zlib.crc32(key.encode("utf-8")))
+        body = json.dumps(SHAPES[prefix](rng, list(args), self.rows)).encode("utf-8")
+        return body, '"%s"' % hashlib.md5(body).hexdigest()
+
+    def _image(self, path: str) -> bytes:
+        rng = random.Random(zlib.crc32(path.encode("utf-8")))
+        size = max(0, self.logo_bytes - len(PNG_HEADER))
+        return PNG_HEADER + bytes(rng.getrandbits(8) for _ in range(size))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counters)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.counters.clear()
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients abandoning a request (timeouts, hedged losers) are expected
+        pass
+
+    def start(self) -> "StandInServer":
+        """Serve on a background daemon thread."""
+        self._thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+def _parse_error(spec: str) -> Tuple[int, float]:
+    status, _, probability = spec.partition(":")
+    return int(status), float(probability)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Local PDDIKTI stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=Latency.parse, default=None,
+                        help="constant:MS, uniform:LOW:HIGH or lognormal:MEDIAN:SIGMA[:CAP] (ms)")
+    parser.add_argument("--family-latency", action="append", default=[], metavar="FAMILY=SPEC",
+                        help="latency for one endpoint family, e.g. detail/pt=constant:200")
+    parser.add_argument("--error", action="append", type=_parse_error, default=[],
+                        metavar="STATUS:PROBABILITY", help="inject errors, e.g. 429:0.02")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--rows", type=int, default=20, help="rows in search and list results")
+    parser.add_argument("--logo-bytes", type=int, default=8192)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    family_latency = {}
+    for item in args.family_latency:
+        family, _, spec = item.partition("=")
+        family_latency[family] = Latency.parse(spec)
+
+    server = StandInServer(args.host, args.port, latency=args.latency,
+                           family_latency=family_latency, errors=dict(args.error),
+                           retry_after=args.retry_after, rows=args.rows,
+                           logo_bytes=args.logo_bytes, seed=args.seed)
+    print(f"PDDIKTI stand-in listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
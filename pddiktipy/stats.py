@@ -0,0 +1,250 @@
+"""
+Streaming latency statistics for the client.
+
+:class:`LatencySketch` is an HDR-style histogram with logarithmic buckets:
+every quantile it reports is within a fixed relative error of the true
+value, and its size depends on the range of latencies seen, not on how many
+were recorded. :class:`WindowedSketch` keeps only recent latencies (for
+hedge delays and timeouts), and :class:`ClientStats` builds per-method
+statistics from the client's events.
+
+The hedge policy, the adaptive timeouts and the statistics each keep their
+own sketches on purpose. They measure different things: statistics time
+whole method calls (retries and cache hits included) since the last reset,
+hedging times complete requests, and the timeouts time single attempts,
+counting a timed-out attempt at its timeout. Statistics are also opt-in,
+while hedging and the timeouts must learn whether or not anyone reads
+them.
+"""
+import math
+import threading
+import weakref
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from .events import CallEvent, Event, EventHooks, RequestEvent
+
+# Quantiles reported by ClientStats.snapshot()
+REPORTED_QUANTILES = (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+
+
+class LatencySketch:
+    """Histogram of latencies in buckets growing by a constant factor.
+
+    A value ``v`` goes to the bucket ``(g**(i-1), g**i]`` with
+    ``g = (1 + a) / (1 - a)`` for the relative accuracy ``a``; a quantile is
+    reported as its bucket's midpoint, so it is at most ``a`` away from
+    the true value relative to it. At 1% accuracy, latencies from 1 µs to
+    10 minutes take at most about 1,000 buckets.
+
+    Args:
+        relative_accuracy: Maximum relative error of reported quantiles.
+
+    Example:
+        >>> sketch = LatencySketch()
+        >>> for ms in range(1, 101):
+        ...     sketch.record(ms / 1000)
+        >>> round(sketch.quantile(0.95), 3)
+        0.095
+    """
+
+    __slots__ = ("relative_accuracy", "_gamma", "_log_gamma", "_buckets",
+                 "count", "total", "min", "max")
+
+    # Smaller values (e.g. 0 from a coarse clock) are counted as this
+    MIN_VALUE = 1e-6
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        index = math.ceil(math.log(max(seconds, self.MIN_VALUE)) / self._log_gamma)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> Optional[float]:
+        """The ``q`` quantile (0..1) by nearest rank, or None while empty."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                break
+        value = 2 * self._gamma ** index / (self._gamma + 1)
+        return min(max(value, self.min), self.max)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def merge(self, other: "LatencySketch") -> None:
+        """Add the values of ``other`` (same accuracy) to this sketch."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches of different accuracy")
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def reset(self) -> None:
+        self._buckets.clear()
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+
+class WindowedSketch:
+    """Sketch of recent latencies only.
+
+    Values go to a current sketch that replaces the previous one after
+    ``window`` values, so quantiles cover the last ``window`` to
+    ``2 * window`` values and follow changes in upstream latency.
+
+    Not thread-safe; callers hold their own lock.
+
+    Args:
+        window: Values per sketch generation.
+        relative_accuracy: As for :class:`LatencySketch`.
+    """
+
+    __slots__ = ("window", "_current", "_previous")
+
+    def __init__(self, window: int = 256, relative_accuracy: float = 0.01) -> None:
+        self.window = window
+        self._current = LatencySketch(relative_accuracy)
+        self._previous = LatencySketch(relative_accuracy)
+
+    @property
+    def count(self) -> int:
+        """Number of values the quantiles are based on."""
+        return self._current.count + self._previous.count
+
+    def record(self, seconds: float) -> None:
+        if self._current.count >= self.window:
+            self._previous, self._current = self._current, self._previous
+            self._current.reset()
+        self._current.record(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self._previous.count:
+            return self._current.quantile(q)
+        merged = LatencySketch(self._current.relative_accuracy)
+        merged.merge(self._previous)
+        merged.merge(self._current)
+        return merged.quantile(q)
+
+
+class _MethodStats:
+    __slots__ = ("latency", "errors", "requests", "retries", "bytes")
+
+    def __init__(self, relative_accuracy: float) -> None:
+        self.latency = LatencySketch(relative_accuracy)
+        self.errors: Dict[str, int] = {}
+        self.requests = 0
+        self.retries = 0
+        self.bytes = 0
+
+
+class ClientStats:
+    """Per-method call statistics, fed by the client's events.
+
+    For every endpoint method: calls, latency quantiles (p50/p95/p99),
+    upstream requests and retries, response bytes and errors by exception
+    type. The sections of composite calls (e.g. ``get_pt_full_profile``)
+    and bulk iterators count as calls of their endpoint methods.
+
+    One instance can collect for many clients sharing their
+    :class:`~pddiktipy.events.EventHooks`, e.g. a whole
+    :class:`~pddiktipy.pool.ClientPool`.
+
+    Args:
+        relative_accuracy: Accuracy of the latency quantiles.
+
+    Example:
+        >>> client = api(stats=True)
+        >>> client.search_pt("Gadjah Mada")
+        >>> client.stats()["search_pt"]["p95"]
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.relative_accuracy = relative_accuracy
+        self._methods: Dict[str, _MethodStats] = {}
+        self._attached: "weakref.WeakSet[EventHooks]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def attach(self, events: EventHooks) -> Optional[Callable[[], None]]:
+        """Subscribe to ``events`` once; returns the unsubscribe function, or None if attached already."""
+        with self._lock:
+            if events in self._attached:
+                return None
+            self._attached.add(events)
+        return events.subscribe(self)
+
+    def _method(self, name: str) -> _MethodStats:
+        stats = self._methods.get(name)
+        if stats is None:
+            stats = self._methods[name] = _MethodStats(self.relative_accuracy)
+        return stats
+
+    def __call__(self, event: Event) -> None:
+        if isinstance(event, CallEvent):
+            with self._lock:
+                stats = self._method(event.method)
+                stats.latency.record(event.elapsed)
+                if event.error is not None:
+                    kind = type(event.error).__name__
+                    stats.errors[kind] = stats.errors.get(kind, 0) + 1
+        elif isinstance(event, RequestEvent) and event.method is not None:
+            with self._lock:
+                stats = self._method(event.method)
+                stats.requests += event.attempts
+                stats.retries += event.retries
+                stats.bytes += event.size
+
+    def snapshot(self, methods: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Statistics per method (all methods called so far by default).
+
+        Latencies are in seconds; quantiles are None for methods that were
+        never called.
+        """
+        with self._lock:
+            names = sorted(self._methods) if methods is None else list(methods)
+            report = {}
+            for name in names:
+                stats = self._methods.get(name) or _MethodStats(self.relative_accuracy)
+                latency = stats.latency
+                entry: Dict[str, Any] = {"count": latency.count}
+                for label, q in REPORTED_QUANTILES:
+                    entry[label] = latency.quantile(q)
+                entry.update({
+                    "mean": latency.mean,
+                    "max": latency.max if latency.count else None,
+                    "requests": stats.requests,
+                    "retries": stats.retries,
+                    "bytes": stats.bytes,
+                    "errors": dict(stats.errors),
+                })
+                report[name] = entry
+            return report
+
+    def reset(self) -> None:
+        with self._lock:
+            self._methods.clear()
@@ -0,0 +1,142 @@
+"""
+Adaptive connect and read timeouts per endpoint family.
+
+One fixed timeout fits no endpoint well: ``pt/count`` answers in
+milliseconds, yet a hung connection to it holds a worker for the full 30
+seconds. :class:`AdaptiveTimeouts` learns the latency of each endpoint
+family from a rolling sketch and sets
+
+* the read timeout to a multiple of a high percentile of its latency, and
+* the connect timeout to a multiple of its median time to first byte
+  (which includes connection setup),
+
+each kept between a floor and a ceiling. An attempt that times out after
+its full timeout is recorded at that timeout, so a family that slows down
+widens its own timeout instead of timing out over and over. Attempts cut
+short by a caller's deadline say nothing about the upstream and are not
+recorded.
+"""
+import threading
+from typing import Dict, Optional, Tuple
+
+from .endpoints import endpoint_family
+from .stats import WindowedSketch
+
+
+class AdaptiveTimeouts:
+    """Learned (connect, read) timeouts per endpoint family.
+
+    Until ``min_samples`` latencies of a family are known, its requests use
+    the client's static timeouts. One instance can be shared by many
+    clients (e.g. a :class:`ClientPool`) so they learn together.
+
+    The sketches are separate from the hedge policy's: they hold single
+    attempts and timeouts recorded at their timeout value, which would
+    inflate hedge delays if the two shared samples.
+
+    Args:
+        percentile: Latency percentile the read timeout is based on.
+        read_multiplier: Read timeout as a multiple of that percentile.
+        read_floor: Lower bound on the read timeout in seconds.
+        read_ceiling: Upper bound on the read timeout in seconds.
+        connect_multiplier: Connect timeout as a multiple of the median
+            time to first byte.
+        connect_floor: Lower bound on the connect timeout in seconds.
+        connect_ceiling: Upper bound on the connect timeout in seconds.
+        window: Latencies per generation of the per-family sketch; the
+            percentiles cover the last ``window`` to ``2 * window``.
+        min_samples: Samples needed before a family's timeouts are learned.
+
+    Example:
+        >>> client = api(adaptive_timeouts=AdaptiveTimeouts(read_floor=1.0, read_ceiling=20.0))
+    """
+
+    def __init__(self,
+                 percentile: float = 99.0,
+                 read_multiplier: float = 3.0,
+                 read_floor: float = 2.0,
+                 read_ceiling: float = 30.0,
+                 connect_multiplier: float = 3.0,
+                 connect_floor: float = 1.0,
+                 connect_ceiling: float = 10.0,
+                 window: int = 256,
+                 min_samples: int = 20) -> None:
+        if not 0 < read_floor <= read_ceiling:
+            raise ValueError("read_floor must be positive and at most read_ceiling")
+        if not 0 < connect_floor <= connect_ceiling:
+            raise ValueError("connect_floor must be positive and at most connect_ceiling")
+        self.percentile = percentile
+        self.read_multiplier = read_multiplier
+        self.read_floor = read_floor
+        self.read_ceiling = read_ceiling
+        self.connect_multiplier = connect_multiplier
+        self.connect_floor = connect_floor
+        self.connect_ceiling = connect_ceiling
+        self.window = window
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._latency: Dict[str, WindowedSketch] = {}
+        self._ttfb: Dict[str, WindowedSketch] = {}
+        self._learned: Dict[str, Tuple[float, float]] = {}
+        self.timeouts_observed = 0
+
+    def timeouts(self, url: str, timeout: float) -> Optional[Tuple[float, float]]:
+        """(connect, read) timeouts for one attempt at ``url``, or None if not learned yet.
+
+        Args:
+            url: Requested URL.
+            timeout: The caller's timeout for the attempt (already shortened
+                to its deadline); learned timeouts never exceed it.
+        """
+        learned = self._learned.get(endpoint_family(url))
+        if learned is None:
+            return None
+        connect, read = learned
+        return min(connect, timeout), min(read, timeout)
+
+    def observe(self, url: str, seconds: float, ttfb: Optional[float] = None) -> None:
+        """Record a completed attempt: its duration and, if known, time to first byte."""
+        self._record(endpoint_family(url), seconds, seconds if ttfb is None else ttfb)
+
+    def observe_timeout(self, url: str, read_timeout: float) -> None:
+        """Record an attempt that timed out, at the read timeout it was given.
+
+        Timeouts shorter than the family's learned read timeout (shortened
+        by the caller, e.g. a retry deadline) are ignored, so they cannot
+        pull the learned timeout down.
+        """
+        family = endpoint_family(url)
+        learned = self._learned.get(family)
+        if learned is not None and read_timeout < learned[1]:
+            return
+        with self._lock:
+            self.timeouts_observed += 1
+        self._record(family, read_timeout, None)
+
+    def _record(self, family: str, seconds: float, ttfb: Optional[float]) -> None:
+        with self._lock:
+            latency = self._latency.get(family)
+            if latency is None:
+                latency = self._latency[family] = WindowedSketch(self.window)
+                self._ttfb[family] = WindowedSketch(self.window)
+            latency.record(seconds)
+            first_byte = self._ttfb[family]
+            if ttfb is not None:
+                first_byte.record(ttfb)
+            # Reading percentiles walks the sketch; refresh periodically
+            if latency.count >= self.min_samples and latency.count % 8 == 0:
+                read = self.read_multiplier * latency.quantile(self.percentile / 100)
+                median = first_byte.quantile(0.5) if first_byte.count else None
+                connect = self.connect_ceiling if median is None else self.connect_multiplier * median
+                self._learned[family] = (
+                    min(self.connect_ceiling, max(self.connect_floor, connect)),
+                    min(self.read_ceiling, max(self.read_floor, read)),
+                )
+
+    def stats(self) -> Dict[str, object]:
+        """Learned (connect, read) timeouts per endpoint family, and timeouts recorded."""
+        return {
+            "timeouts_observed": self.timeouts_observed,
+            "families": {family: {"connect": connect, "read": read}
+                         for family, (connect, read) in dict(self._learned).items()},
+        }
@@ -0,0 +1,444 @@
+"""
+Pluggable HTTP transports for upstream GETs.
+
+:class:`pddiktipy.helper.helper` sends every request through a transport,
+so the HTTP library can be swapped without touching caching, retries or
+error mapping. A transport sends one GET and returns a fully read
+:class:`TransportResponse`. Timeouts and network failures are raised as
+:class:`APITimeoutError` / :class:`APIConnectionError`. HTTP error statuses
+are returned, because mapping them is the helper's job.
+
+Shipped implementations:
+
+* :class:`RequestsTransport` - pooled ``requests.Session`` (sync default).
+* :class:`HttpxTransport` - pooled ``httpx.AsyncClient`` (async default).
+* :class:`MemoryTransport` - canned responses, no network.
+* :class:`CassetteTransport` - records real responses to a JSON file and
+  replays them offline.
+
+Sync transports also work with :class:`pddiktipy.async_api.AsyncApi`,
+because the async helper awaits a result only when it is awaitable.
+"""
+import base64
+import inspect
+import json
+import os
+import tempfile
+import threading
+from typing import (
+    TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+)
+from urllib.parse import urlsplit
+
+from .exceptions import APIConnectionError, APIResponseError, APITimeoutError
+
+# requests (and urllib3 under it) is imported when the first
+# RequestsTransport is created, so importing the package stays cheap
+if TYPE_CHECKING:
+    import requests
+
+# (connect, read) timeouts in seconds
+Timeouts = Tuple[float, float]
+
+
+def _import_httpx() -> Any:
+    """Imports the optional httpx dependency on first use.
+
+    httpx is only needed by the async client and is slow to import, so
+    sync users never pay for it.
+
+    Raises:
+        ImportError: If httpx is not installed.
+    """
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError(
+            "HttpxTransport requires httpx. Install it with: pip install pddiktipy[async]"
+        ) from None
+    return httpx
+
+
+class Headers(Mapping[str, str]):
+    """Read-only, case-insensitive view of response headers."""
+    __slots__ = ("_items",)
+
+    def __init__(self, headers: Mapping[str, str]) -> None:
+        self._items = {name.lower(): (name, value) for name, value in headers.items()}
+
+    def __getitem__(self, name: str) -> str:
+        return self._items[name.lower()][1]
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name, _ in self._items.values())
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+class TransportResponse:
+    """A fully read HTTP response, independent of the HTTP library.
+
+    Attributes:
+        status_code: HTTP status code.
+        headers: Case-insensitive response headers.
+        content: Raw body bytes.
+        elapsed: Seconds from sending the request to its response headers
+            (requests) or full body (httpx), when the transport measures
+            it (None otherwise).
+    """
+    __slots__ = ("status_code", "headers", "content", "elapsed")
+
+    def __init__(self, status_code: int, headers: Optional[Mapping[str, str]] = None,
+                 content: bytes = b"", elapsed: Optional[float] = None) -> None:
+        self.status_code = status_code
+        self.headers = Headers(headers or {})
+        self.content = content
+        self.elapsed = elapsed
+
+    def json(self) -> Any:
+        """Decode the body as JSON (raises ValueError if it is not)."""
+        return json.loads(self.content)
+
+    def __repr__(self) -> str:
+        return f"<TransportResponse [{self.status_code}] {len(self.content)} bytes>"
+
+
+class Transport:
+    """Interface of a sync transport."""
+
+    def get(self, url: str, headers: Mapping[str, str], timeout: Timeouts) -> TransportResponse:
+        """Send a GET and return the fully read response.
+
+        Raises:
+            APITimeoutError: If connecting or reading timed out.
+            APIConnectionError: If the request could not be sent.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release pooled connections; the transport stays usable."""
+
+
+class AsyncTransport:
+    """Interface of an asyncio transport."""
+
+    async def get(self, url: str, headers: Mapping[str, str],
+                  timeout: Timeouts) -> TransportResponse:
+        """Async counterpart of :meth:`Transport.get`."""
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        """Release pooled connections; the transport stays usable."""
+
+
+class RequestsTransport(Transport):
+    """Transport backed by a lazily created, pooled ``requests.Session``.
+
+    Args:
+        pool_connections: Number of host connection pools kept by the
+            ``HTTPAdapter``.
+        pool_maxsize: Maximum keep-alive connections per host pool.
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._session: Optional["requests.Session"] = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> "requests.Session":
+        """Lazy initialization of the pooled requests session"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    session = requests.Session()
+                    # No transport-level retries: every request goes through
+                    # the client's RetryPolicy instead
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize
+                    )
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
+
+    def get(self, url: str, headers: Mapping[str, str], timeout: Timeouts) -> TransportResponse:
+        session = self.session
+        import requests
+        try:
+            response = session.get(url, headers=headers, timeout=timeout)
+            # Read the body here so the response can be shared and cached
+            return TransportResponse(response.status_code, response.headers, response.content,
+                                     response.elapsed.total_seconds())
+        except requests.Timeout:
+            raise APITimeoutError(
+                f"Request timeout after {timeout[1]} seconds",
+                endpoint=url
+            )
+        except requests.ConnectionError as e:
+            raise APIConnectionError(
+                f"Connection error: {str(e)}",
+                endpoint=url
+            )
+        except requests.RequestException as e:
+            raise APIResponseError(
+                f"Request failed: {str(e)}",
+                endpoint=url
+            )
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+class HttpxTransport(AsyncTransport):
+    """Transport backed by a lazily created, pooled ``httpx.AsyncClient``.
+
+    Args:
+        max_connections: Maximum pooled (and keep-alive) connections.
+
+    Raises:
+        ImportError: If httpx is not installed.
+    """
+
+    def __init__(self, max_connections: int = 100) -> None:
+        self._httpx = _import_httpx()
+        self.max_connections = max_connections
+        self._client = None
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """Lazy initialization of the pooled async HTTP client"""
+        if self._client is None:
+            httpx = self._httpx
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections
+            )
+            # Retries are handled by the client's RetryPolicy, not the transport
+            self._client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(limits=limits),
+                limits=limits
+            )
+        return self._client
+
+    async def get(self, url: str, headers: Mapping[str, str],
+                  timeout: Timeouts) -> TransportResponse:
+        connect, read = timeout
+        httpx = self._httpx
+        try:
+            response = await self.client.get(
+                url, headers=headers, timeout=httpx.Timeout(read, connect=connect)
+            )
+        except httpx.TimeoutException:
+            raise APITimeoutError(
+                f"Request timeout after {read} seconds",
+                endpoint=url
+            )
+        except httpx.TransportError as e:
+            raise APIConnectionError(
+                f"Connection error: {str(e)}",
+                endpoint=url
+            )
+        return TransportResponse(response.status_code, response.headers, response.content,
+                                 response.elapsed.total_seconds())
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def _request_key(url: str) -> str:
+    """Path and query of ``url``, so recordings replay against any host."""
+    parts = urlsplit(url)
+    return parts.path + ("?" + parts.query if parts.query else "")
+
+
+# A canned reply: a response, a JSON-serialisable payload, raw bytes/text,
+# an exception to raise, or a callable (url, headers) returning one of these.
+Reply = Union[TransportResponse, dict, list, bytes, str, BaseException,
+              Callable[[str, Mapping[str, str]], Any]]
+
+
+class MemoryTransport(Transport):
+    """In-memory fake serving canned replies, for offline tests and benchmarks.
+
+    Replies are looked up by full URL, then by path and query. Unknown URLs
+    get a 404 (or whatever ``default`` gives).
+
+    Args:
+        routes: Replies keyed by URL or by path (e.g. ``"/pencarian/pt/ugm"``).
+        default: Reply for unknown URLs.
+
+    Attributes:
+        requests: URLs requested so far, in order.
+
+    Example:
+        >>> fake = MemoryTransport({"/pencarian/pt/ugm": [{"nama": "UGM"}]})
+        >>> client = api(transport=fake)
+        >>> client.search_pt("ugm")
+        [{'nama': 'UGM'}]
+    """
+
+    def __init__(self, routes: Optional[Mapping[str, Reply]] = None,
+                 default: Optional[Reply] = None) -> None:
+        self.routes: Dict[str, Reply] = dict(routes or {})
+        self.default = default
+        self.requests: List[str] = []
+        self._lock = threading.Lock()
+
+    def add(self, url: str, reply: Reply) -> None:
+        """Serve ``reply`` for ``url`` (a full URL or a path)."""
+        self.routes[url] = reply
+
+    def get(self, url: str, headers: Mapping[str, str], timeout: Timeouts) -> TransportResponse:
+        with self._lock:
+            self.requests.append(url)
+        reply = self.routes.get(url, self.routes.get(_request_key(url), self.default))
+        if callable(reply) and not isinstance(reply, BaseException):
+            reply = reply(url, headers)
+        return self._to_response(reply, url)
+
+    @staticmethod
+    def _to_response(reply: Any, url: str) -> TransportResponse:
+        if reply is None:
+            return TransportResponse(404, {"Content-Type": "application/json"}, b'{"message": "Not Found"}')
+        if isinstance(reply, BaseException):
+            raise reply
+        if isinstance(reply, TransportResponse):
+            return reply
+        if isinstance(reply, bytes):
+            return TransportResponse(200, {"Content-Type": "application/octet-stream"}, reply)
+        if isinstance(reply, str):
+            return TransportResponse(200, {"Content-Type": "text/plain"}, reply.encode("utf-8"))
+        return TransportResponse(200, {"Content-Type": "application/json"},
+                                 json.dumps(reply).encode("utf-8"))
+
+
+# Response headers not worth replaying: the body is stored decoded, and
+# connection management belongs to the live transport
+_UNRECORDED_HEADERS = frozenset({
+    "connection", "content-encoding", "content-length", "keep-alive",
+    "set-cookie", "transfer-encoding"
+})
+
+
+class CassetteTransport(Transport):
+    """Record real responses to a JSON cassette and replay them offline.
+
+    Interactions are keyed by path and query, so a cassette recorded against
+    the live API replays against any ``base_url``. Bodies are stored as text
+    when they are UTF-8 and base64 otherwise (e.g. logos).
+
+    Args:
+        path: Cassette file.
+        mode: ``"replay"`` serves only recorded responses and raises
+            :class:`APIConnectionError` for anything else; ``"record"``
+            always forwards and (re)records; ``"auto"`` replays what is
+            recorded and records the rest.
+        transport: Transport used for recording. Defaults to a
+            :class:`RequestsTransport`; an :class:`AsyncTransport` works
+            with :class:`AsyncApi`.
+
+    Call :meth:`save` (or :meth:`close`) to write new recordings.
+
+    Example:
+        >>> cassette = CassetteTransport("pddikti.json", mode="auto")
+        >>> with api(transport=cassette) as client:
+        ...     client.search_pt("Gadjah Mada")  # network only the first time
+        >>> cassette.save()
+    """
+
+    MODES = ("replay", "record", "auto")
+
+    def __init__(self, path: str, mode: str = "replay",
+                 transport: Optional[Union[Transport, AsyncTransport]] = None) -> None:
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {', '.join(self.MODES)}")
+        self.path = path
+        self.mode = mode
+        self.transport = transport
+        self.interactions: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.interactions = json.load(f).get("interactions", {})
+        elif mode == "replay":
+            raise FileNotFoundError(f"Cassette not found: {path}")
+
+    def get(self, url: str, headers: Mapping[str, str],
+            timeout: Timeouts) -> Union[TransportResponse, Awaitable[TransportResponse]]:
+        key = _request_key(url)
+        recorded = self.interactions.get(key)
+        if recorded is not None and self.mode != "record":
+            return self._decode(recorded)
+        if self.mode == "replay":
+            raise APIConnectionError(f"No recorded response for {key}", endpoint=url)
+
+        if self.transport is None:
+            self.transport = RequestsTransport()
+        response = self.transport.get(url, headers, timeout)
+        if inspect.isawaitable(response):
+            return self._record_async(key, response)
+        self._record(key, response)
+        return response
+
+    async def _record_async(self, key: str,
+                            pending: Awaitable[TransportResponse]) -> TransportResponse:
+        response = await pending
+        self._record(key, response)
+        return response
+
+    def _record(self, key: str, response: TransportResponse) -> None:
+        try:
+            body, encoding = response.content.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(response.content).decode("ascii"), "base64"
+        with self._lock:
+            self.interactions[key] = {
+                "status": response.status_code,
+                "headers": {name: value for name, value in response.headers.items()
+                            if name.lower() not in _UNRECORDED_HEADERS},
+                "body": body,
+                "encoding": encoding,
+            }
+            self._dirty = True
+
+    @staticmethod
+    def _decode(recorded: Mapping[str, Any]) -> TransportResponse:
+        body = recorded["body"]
+        if recorded.get("encoding") == "base64":
+            content = base64.b64decode(body)
+        else:
+            content = body.encode("utf-8")
+        return TransportResponse(recorded["status"], recorded.get("headers"), content)
+
+    def save(self) -> None:
+        """Write the cassette atomically if anything new was recorded."""
+        with self._lock:
+            if not self._dirty:
+                return
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "interactions": self.interactions},
+                          f, ensure_ascii=False, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+            self._dirty = False
+
+    def close(self) -> None:
+        """Save new recordings and close the recording transport."""
+        self.save()
+        if isinstance(self.transport, Transport):
+            self.transport.close()
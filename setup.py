@@ -31,7 +31,7 @@ setup(
         "Issues": "https://github.com/IlhamriSKY/PDDIKTI-kemdikbud-API/issues",
         "Documentation": "https://github.com/IlhamriSKY/PDDIKTI-kemdikbud-API#readme",
     },
-    packages=find_packages(exclude=['tests', 'tests.*']),
+    packages=find_packages(exclude=['tests', 'tests.*', 'benchmarks', 'benchmarks.*']),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Science/Research",
@@ -54,6 +54,9 @@ setup(
     install_requires=[
         "requests>=2.25.0",
     ],
+    extras_require={
+        "async": ["httpx>=0.23.0"],
+    },
     keywords=[
         "pddikti", 
         "api", 
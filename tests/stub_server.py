@@ -0,0 +1,98 @@
+"""
+Minimal local stand-in for the PDDIKTI upstream used by offline tests.
+
+Every GET returns a small JSON list echoing the request path. Paths that
+contain ``status-<code>`` answer with that HTTP status instead, paths that
+contain ``delay-<ms>`` are answered after that many milliseconds (or only
+the first request for the path with ``slowfirst-<ms>``), and logo
+paths return a tiny PNG. JSON responses carry an ETag and Last-Modified
+header and honour ``If-None-Match`` with a 304.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+LAST_MODIFIED = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, content_type="application/json", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        first = self.server.record(self.path)
+        delay = re.search(r"delay-(\d+)", self.path)
+        if delay:
+            time.sleep(int(delay.group(1)) / 1000)
+        slow_first = re.search(r"slowfirst-(\d+)", self.path)
+        if slow_first and first:
+            time.sleep(int(slow_first.group(1)) / 1000)
+        match = re.search(r"status-(\d{3})", self.path)
+        if match:
+            status = int(match.group(1))
+            headers = {"Retry-After": "1"} if status == 429 else None
+            self._send(status, json.dumps({"message": "stub error"}).encode(), headers=headers)
+        elif "/logo" in self.path:
+            self._send(200, PNG_BYTES, content_type="image/png")
+        else:
+            body = json.dumps([{"path": self.path}]).encode()
+            etag = '"%s"' % hashlib.md5(body).hexdigest()
+            validators = {"ETag": etag, "Last-Modified": LAST_MODIFIED}
+            if self.headers.get("If-None-Match") == etag:
+                self.server.not_modified += 1
+                self._send(304, b"", headers=validators)
+            else:
+                self._send(200, body, headers=validators)
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded HTTP server recording every requested path."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.paths = []
+        self.not_modified = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def record(self, path):
+        """Record a request; return True if the path was not seen before."""
+        with self._lock:
+            first = path not in self.paths
+            self.paths.append(path)
+            return first
+
+    def handle_error(self, request, client_address):
+        # Clients abandoning a request (e.g. a hedged loser) are expected
+        pass
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,98 @@
+"""
+PDDIKTI AsyncApi Test Suite
+
+Runs the asyncio client against a local stand-in server, so no network
+access to the real PDDIKTI API is needed.
+
+Test Framework: Python unittest
+"""
+
+import asyncio
+import inspect
+import unittest
+import os
+import sys
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pddiktipy import api, AsyncApi
+from pddiktipy.async_api import API_METHODS
+from tests.stub_server import StubServer
+
+SAMPLE_ID = "lCOatIX_hCe2RQSG1Rghn5kO81hHLJdY"
+
+
+class TestAsyncApiSurface(unittest.TestCase):
+    """Verify AsyncApi mirrors the sync client method for method."""
+
+    def test_mirrors_all_methods(self):
+        """Test every sync endpoint method exists as a coroutine function."""
+        self.assertEqual(len(API_METHODS), 63)
+        for name in API_METHODS:
+            method = getattr(AsyncApi, name)
+            self.assertTrue(inspect.iscoroutinefunction(method), name)
+            self.assertEqual(
+                inspect.signature(method),
+                inspect.signature(getattr(api, name)),
+                name
+            )
+            self.assertEqual(method.__doc__, getattr(api, name).__doc__)
+
+
+class TestAsyncApiStandIn(unittest.IsolatedAsyncioTestCase):
+    """Exercise AsyncApi calls against the local stand-in server."""
+
+    def setUp(self):
+        self.server = StubServer().__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    async def test_search_builds_same_url_as_sync(self):
+        """Test the async client hits the same path as the sync client."""
+        async with AsyncApi(base_url=self.server.url) as client:
+            result = await client.search_mahasiswa("Ilham Riski")
+        self.assertEqual(result, [{"path": "/pencarian/mhs/Ilham%20Riski"}])
+
+        with api(base_url=self.server.url) as client:
+            self.assertEqual(client.search_mahasiswa("Ilham Riski"), result)
+
+    async def test_semester_query_parameter(self):
+        """Test endpoints with query strings are built identically."""
+        async with AsyncApi(base_url=self.server.url) as client:
+            result = await client.get_homebase_prodi(SAMPLE_ID, 20241)
+        self.assertEqual(result[0]["path"], f"/dosen/homebase/{SAMPLE_ID}?semester=20241")
+
+    async def test_logo_is_base64(self):
+        """Test image endpoints return base64 text."""
+        async with AsyncApi(base_url=self.server.url) as client:
+            logo = await client.get_logo_pt(SAMPLE_ID)
+        self.assertTrue(logo.startswith("iVBORw0KGgo"))
+
+    async def test_validation_errors_return_none(self):
+        """Test invalid input is rejected before any request is sent."""
+        async with AsyncApi(base_url=self.server.url) as client:
+            self.assertIsNone(await client.search_mahasiswa(""))
+            self.assertIsNone(await client.get_detail_mhs("short"))
+            self.assertIsNone(await client.get_prodi_pt(SAMPLE_ID, 20243))
+        self.assertEqual(self.server.paths, [])
+
+    async def test_http_errors_return_none(self):
+        """Test upstream error statuses are swallowed like the sync client."""
+        async with AsyncApi(base_url=self.server.url) as client:
+            self.assertIsNone(await client.get_detail_pt("status-404-abcdef"))
+            self.assertIsNone(await client.get_detail_pt("status-429-abcdef"))
+
+    async def test_concurrent_calls_share_one_client(self):
+        """Test many concurrent calls on one event loop."""
+        async with AsyncApi(base_url=self.server.url) as client:
+            results = await asyncio.gather(*[
+                client.search_pt(f"kampus {i}") for i in range(100)
+            ])
+        self.assertEqual(len(results), 100)
+        self.assertTrue(all(r and r[0]["path"].startswith("/pencarian/pt/") for r in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+PDDIKTI Benchmark Runner Test Suite
+
+Verifies the benchmark timing loop, the JSON report and the baseline
+comparison used to catch regressions.
+
+Test Framework: Python unittest
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks import bench_client  # noqa: F401
+from benchmarks.__main__ import main
+from benchmarks.runner import Result, compare, load_baseline, measure, registered, to_json
+
+
+def _result(name, us):
+    return Result(name=name, group="micro", number=1, repeat=1,
+                  min_us=us, median_us=us, stdev_us=0.0)
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+    """Verify measurement, reports and regression detection."""
+
+    def test_measure_runs_setup_and_teardown(self):
+        """Test the callable is timed and the teardown runs."""
+        calls = []
+        result = measure("noop", lambda: ((lambda: calls.append(1)), lambda: calls.append("done")),
+                         repeat=3, min_time=0.001)
+        self.assertEqual(calls[-1], "done")
+        self.assertEqual(result.repeat, 3)
+        self.assertGreater(result.min_us, 0)
+        self.assertLessEqual(result.min_us, result.median_us)
+
+    def test_compare_flags_regressions(self):
+        """Test only benchmarks slower than the threshold are reported."""
+        baseline = to_json([_result("a", 10.0), _result("b", 10.0)])["results"]
+        current = [_result("a", 11.0), _result("b", 20.0), _result("new", 5.0)]
+        comparisons, regressions = compare(current, baseline, threshold=1.25)
+        self.assertEqual([c.name for c in comparisons], ["a", "b"])
+        self.assertEqual([c.name for c in regressions], ["b"])
+        self.assertAlmostEqual(regressions[0].ratio, 2.0)
+
+    def test_all_benchmarks_registered(self):
+        """Test the client hot paths and end-to-end cases are covered."""
+        names = {name for name, _, _ in registered()}
+        for expected in ("helper.get_headers", "helper.parse", "api._build_endpoint",
+                         "api.handle_errors", "json.decode_prodi_pt",
+                         "helper.base64_encode_image", "e2e.standin.search_pt"):
+            self.assertIn(expected, names)
+
+    def test_cli_writes_and_compares_baseline(self):
+        """Test --update-baseline then a comparison run on one benchmark."""
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline = os.path.join(tmp, "baseline.json")
+            report = os.path.join(tmp, "report.json")
+            args = ["--filter", "helper.parse", "--repeat", "2", "--min-time", "0.001",
+                    "--baseline", baseline]
+            self.assertEqual(main(args + ["--update-baseline"]), 0)
+            self.assertIn("helper.parse", load_baseline(baseline))
+            main(args + ["--json", report, "--threshold", "1000"])
+            with open(report, encoding="utf-8") as f:
+                self.assertIn("helper.parse", json.load(f)["results"])
+
+
+if __name__ == '__main__':
+    unittest.main()
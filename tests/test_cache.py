@@ -0,0 +1,189 @@
+"""
+PDDIKTI Response Cache Test Suite
+
+Verifies TTL expiry, byte-size eviction and stale-while-revalidate.
+
+Test Framework: Python unittest
+"""
+
+import threading
+import time
+import unittest
+import os
+import sys
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pddiktipy.cache import TTLCache, ttl_cached, estimate_size, FRESH, STALE, MISS
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache(unittest.TestCase):
+    """Verify expiry windows and the byte budget."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_fresh_stale_and_expired(self):
+        """Test an entry moves from fresh to stale to missing."""
+        cache = TTLCache(ttl=10, stale_ttl=20, clock=self.clock)
+        cache.set("k", [1])
+        self.assertEqual(cache.lookup("k"), (FRESH, [1]))
+        self.clock.now += 15
+        self.assertEqual(cache.lookup("k"), (STALE, [1]))
+        self.clock.now += 20
+        self.assertEqual(cache.lookup("k"), (MISS, None))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()["stale_hits"], 1)
+
+    def test_per_entry_ttl(self):
+        """Test a short TTL overrides the default and 0 skips caching."""
+        cache = TTLCache(ttl=100, clock=self.clock)
+        cache.set("short", [], ttl=5)
+        cache.set("never", [], ttl=0)
+        self.clock.now += 6
+        self.assertEqual(cache.lookup("short")[0], MISS)
+        self.assertEqual(cache.lookup("never")[0], MISS)
+
+    def test_byte_budget_evicts_least_recently_used(self):
+        """Test eviction is driven by estimated size, not entry count."""
+        value = "x" * 400
+        cache = TTLCache(ttl=100, max_bytes=1000, clock=self.clock)
+        cache.set("a", value)
+        cache.set("b", value)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", value)
+        self.assertEqual(cache.lookup("b")[0], MISS)
+        self.assertEqual(cache.lookup("a")[0], FRESH)
+        self.assertLessEqual(cache.size_bytes, 1000)
+        self.assertEqual(cache.evictions, 1)
+
+        cache.set("huge", "x" * 2000)
+        self.assertEqual(cache.lookup("huge")[0], MISS)
+
+    def test_estimate_size(self):
+        """Test sizes track the serialized payload."""
+        self.assertGreater(estimate_size([{"nama": "x" * 100}]), 100)
+        self.assertEqual(estimate_size(b"abc"), 3)
+
+
+class TestTTLCached(unittest.TestCase):
+    """Verify the decorator's stale-while-revalidate behaviour."""
+
+    def test_stale_value_served_while_refreshing(self):
+        """Test an expired entry returns at once and refreshes once."""
+        clock = FakeClock()
+        calls = []
+        release = threading.Event()
+
+        @ttl_cached(TTLCache(ttl=10, stale_ttl=100, clock=clock))
+        def fetch(key):
+            calls.append(key)
+            if len(calls) > 1:
+                release.wait(5)
+            return len(calls)
+
+        self.assertEqual(fetch("k"), 1)
+        clock.now += 11
+        start = time.perf_counter()
+        self.assertEqual([fetch("k") for _ in range(5)], [1] * 5)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        release.set()
+
+        deadline = time.time() + 2
+        while fetch.cache.lookup(("k",))[0] != FRESH and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(fetch("k"), 2)
+        self.assertEqual(len(calls), 2)
+
+    def test_failed_refresh_keeps_stale_value(self):
+        """Test a failing refresh does not drop the stale entry."""
+        clock = FakeClock()
+        state = {"fail": False, "calls": 0}
+
+        @ttl_cached(TTLCache(ttl=10, stale_ttl=100, clock=clock))
+        def fetch():
+            state["calls"] += 1
+            if state["fail"]:
+                raise RuntimeError("upstream down")
+            return "v1"
+
+        fetch()
+        state["fail"] = True
+        clock.now += 11
+        self.assertEqual(fetch(), "v1")
+        deadline = time.time() + 2
+        while state["calls"] < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        self.assertEqual(fetch(), "v1")
+
+    def test_empty_refresh_keeps_stale_value(self):
+        """Test a refresh returning None (an upstream error) keeps the stale value."""
+        clock = FakeClock()
+        state = {"value": "v1", "calls": 0}
+
+        @ttl_cached(TTLCache(ttl=100, stale_ttl=1000, clock=clock),
+                    ttl_for=lambda result: 30 if not result else None)
+        def fetch():
+            state["calls"] += 1
+            return state["value"]
+
+        fetch()
+        state["value"] = None
+        clock.now += 101
+        self.assertEqual(fetch(), "v1")
+        deadline = time.time() + 2
+        while fetch.cache.lookup(())[0] != FRESH and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(fetch.cache.lookup(()), (FRESH, "v1"))
+        # Kept only briefly, then refreshed again
+        clock.now += 31
+        state["value"] = "v2"
+        self.assertEqual(fetch(), "v1")
+        deadline = time.time() + 2
+        while fetch.cache.lookup(())[1] != "v2" and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(fetch(), "v2")
+        self.assertEqual(state["calls"], 3)
+
+    def test_ttl_for_and_errors(self):
+        """Test result-dependent TTLs and that exceptions are not cached."""
+        clock = FakeClock()
+        calls = []
+
+        @ttl_cached(TTLCache(ttl=100, clock=clock),
+                    ttl_for=lambda result: 5 if not result else None)
+        def search(keyword):
+            calls.append(keyword)
+            if keyword == "boom":
+                raise RuntimeError("boom")
+            return [] if keyword == "none" else [keyword]
+
+        search("none")
+        search("hit")
+        clock.now += 6
+        search("none")
+        search("hit")
+        self.assertEqual(calls, ["none", "hit", "none"])
+
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                search("boom")
+        self.assertEqual(calls.count("boom"), 2)
+
+        search.cache_clear()
+        search("hit")
+        self.assertEqual(calls.count("hit"), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+"""
+PDDIKTI Circuit Breaker Test Suite
+
+Verifies per endpoint family fail-fast and half-open recovery.
+
+Test Framework: Python unittest
+"""
+
+import time
+import unittest
+import os
+import sys
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pddiktipy import (
+    api, AsyncApi, CircuitBreakers, MemoryTransport, RateLimiter, RetryPolicy, TransportResponse,
+    APIResponseError, APITimeoutError, CircuitOpenError, DeadlineExceededError
+)
+from pddiktipy.circuit import CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+from pddiktipy.endpoints import endpoint_family
+from tests.stub_server import StubServer
+
+SINGLE = RetryPolicy(max_attempts=1)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Verify state transitions with a fake clock."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker("detail/pt", failure_threshold=3,
+                                      reset_timeout=10, clock=self.clock)
+
+    def _fail(self):
+        with self.assertRaises(APITimeoutError):
+            self.breaker.call(self._raise, APITimeoutError("slow"))
+
+    @staticmethod
+    def _raise(error):
+        raise error
+
+    def test_opens_after_consecutive_failures(self):
+        """Test the breaker opens at the threshold and then fails fast."""
+        for _ in range(3):
+            self._fail()
+        self.assertEqual(self.breaker.state, OPEN)
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.call(lambda: "never")
+        self.assertEqual(self.breaker.rejected, 1)
+
+    def test_non_failures_reset_the_count(self):
+        """Test 404s count as healthy answers, not failures."""
+        self._fail()
+        self._fail()
+        with self.assertRaises(APIResponseError):
+            self.breaker.call(self._raise, APIResponseError("not found", status_code=404))
+        self._fail()
+        self.assertEqual(self.breaker.state, CLOSED)
+
+    def test_deadline_errors_are_neutral(self):
+        """Test the caller's deadline running out neither opens nor closes the breaker."""
+        self._fail()
+        self._fail()
+        for _ in range(5):
+            with self.assertRaises(DeadlineExceededError):
+                self.breaker.call(self._raise, DeadlineExceededError("budget spent"))
+        self.assertEqual(self.breaker.state, CLOSED)
+        self._fail()
+        self.assertEqual(self.breaker.state, OPEN)
+
+    def test_half_open_probe(self):
+        """Test one probe is admitted after the reset timeout."""
+        for _ in range(3):
+            self._fail()
+        self.clock.now += 10
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.breaker.before_call()
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.before_call()  # only one concurrent probe
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CLOSED)
+
+    def test_failed_probe_reopens(self):
+        """Test a failing probe re-opens the breaker immediately."""
+        for _ in range(3):
+            self._fail()
+        self.clock.now += 10
+        self._fail()
+        self.assertEqual(self.breaker.state, OPEN)
+
+    def test_endpoint_family(self):
+        """Test IDs and keywords are not part of the family."""
+        self.assertEqual(endpoint_family("https://h/detail/pt/abc"), "detail/pt")
+        self.assertEqual(endpoint_family("https://h/pt/logo/abc"), "pt/logo")
+        self.assertEqual(endpoint_family("https://h/prodi/count"), "prodi/count")
+
+
+class TestClientCircuitBreaker(unittest.IsolatedAsyncioTestCase):
+    """Verify clients stop calling a failing endpoint family."""
+
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.breakers = CircuitBreakers(failure_threshold=2, reset_timeout=0.3)
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def test_fail_fast_per_family(self):
+        """Test an open detail/pt circuit skips upstream but not other families."""
+        with api(base_url=self.server.url, retry=SINGLE,
+                 circuit_breakers=self.breakers) as client:
+            for _ in range(2):
+                self.assertIsNone(client.get_detail_pt("status-500-abcdef"))
+            self.assertEqual(len(self.server.paths), 2)
+
+            start = time.perf_counter()
+            self.assertIsNone(client.get_detail_pt("lCOatIX_hCe2RQSG1Rghn5kO81hHLJdY"))
+            self.assertLess(time.perf_counter() - start, 0.1)
+            self.assertEqual(len(self.server.paths), 2)
+
+            self.assertIsNotNone(client.get_mahasiswa_pt("lCOatIX_hCe2RQSG1Rghn5kO81hHLJdY"))
+
+            time.sleep(0.35)
+            self.assertIsNotNone(client.get_detail_pt("lCOatIX_hCe2RQSG1Rghn5kO81hHLJdY"))
+        self.assertIn(f"{self.server.url[7:]}/detail/pt", self.breakers.states())
+
+    def test_exhausted_budgets_leave_breaker_closed(self):
+        """Test budget-limited calls do not open the breaker for everyone else."""
+        fake = MemoryTransport({"/pt/count": {"jumlah": 1}})
+        with api(transport=fake, retry=SINGLE, circuit_breakers=self.breakers,
+                 rate_limit=RateLimiter(rate=1, burst=1)) as client:
+            self.assertIsNotNone(client.get_pt_count())
+            for _ in range(8):
+                self.assertIsNone(client.get_pt_count(budget=0.3))
+        self.assertEqual(len(fake.requests), 1)
+        with api(base_url=self.server.url, retry=SINGLE,
+                 circuit_breakers=self.breakers) as client:
+            for _ in range(3):
+                self.assertIsNone(client.search_pt("delay-1000", budget=0.2))
+            self.assertIsNotNone(client.search_pt("kampus"))
+        self.assertEqual(set(self.breakers.states().values()), {CLOSED})
+
+    def test_coalesced_callers_count_one_failure(self):
+        """Test callers sharing one failed upstream request record one failure."""
+        import threading
+        breakers = CircuitBreakers(failure_threshold=5)
+        fake = MemoryTransport()
+        fake.add("/pt/count", lambda url, headers: time.sleep(0.2) or TransportResponse(500))
+        client = api(transport=fake, retry=SINGLE, circuit_breakers=breakers)
+        self.addCleanup(client.close)
+        barrier = threading.Barrier(6)
+
+        def call():
+            barrier.wait()
+            client.get_pt_count()
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(fake.requests), 1)
+        [breaker] = breakers._breakers.values()
+        self.assertEqual(breaker._failures, 1)
+        self.assertEqual(breaker.state, CLOSED)
+
+    def test_open_circuit_is_not_retried(self):
+        """Test CircuitOpenError does not consume retry attempts."""
+        with api(base_url=self.server.url, circuit_breakers=self.breakers,
+                 retry=RetryPolicy(max_attempts=5, backoff=0.01)) as client:
+            client.search_pt("status-503")
+        # Two failures open the circuit; the remaining attempts fail fast
+        self.assertEqual(len(self.server.paths), 2)
+
+    async def test_async_fail_fast(self):
+        """Test the asyncio client uses the same breakers."""
+        async with AsyncApi(base_url=self.server.url, retry=SINGLE,
+                            circuit_breakers=self.breakers) as client:
+            for _ in range(3):
+                await client.search_dosen("status-502")
+        self.assertEqual(len(self.server.paths), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+PDDIKTI Cold Start Test Suite
+
+Verifies the package loads lazily, leaves logging configuration to the
+application, and that the cold-start benchmark runs.
+
+Test Framework: Python unittest
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pddiktipy
+from benchmarks.coldstart import main
+
+REPO_ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+def _fresh(code):
+    """Run ``code`` in a new interpreter and return its last output line."""
+    output = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    return output.strip().splitlines()[-1]
+
+
+class TestColdStart(unittest.TestCase):
+    """Verify import-time behaviour of the package and the service."""
+
+    def test_import_skips_optional_and_async_modules(self):
+        """Test importing the package loads neither httpx nor asyncio."""
+        loaded = json.loads(_fresh(
+            "import json, sys, pddiktipy; from pddiktipy import api, ClientPool; "
+            "print(json.dumps([m for m in ('httpx', 'asyncio', 'pddiktipy.async_api') "
+            "if m in sys.modules]))"
+        ))
+        self.assertEqual(loaded, [])
+
+    def test_import_skips_requests(self):
+        """Test requests and urllib3 load with the first session, not on import."""
+        loaded = json.loads(_fresh(
+            "import json, sys, pddiktipy; client = pddiktipy.api(); "
+            "before = [m for m in ('requests', 'urllib3') if m in sys.modules]; "
+            "client.H.session; print(json.dumps([before, 'requests' in sys.modules]))"
+        ))
+        self.assertEqual(loaded, [[], True])
+
+    def test_service_import_skips_uvicorn(self):
+        """Test the service module does not import uvicorn unless run directly."""
+        self.assertEqual(_fresh("import sys, pddikti_service; print('uvicorn' in sys.modules)"),
+                         "False")
+
+    def test_import_leaves_logging_unconfigured(self):
+        """Test importing the client adds no handlers to the root logger."""
+        self.assertEqual(_fresh("import logging, pddiktipy; pddiktipy.api; "
+                                "print(len(logging.getLogger().handlers))"), "0")
+
+    def test_every_public_name_resolves(self):
+        """Test lazily loaded names resolve and are listed by dir()."""
+        for name in pddiktipy.__all__:
+            self.assertIsNotNone(getattr(pddiktipy, name))
+            self.assertIn(name, dir(pddiktipy))
+        self.assertIsInstance(pddiktipy.api, type)
+        with self.assertRaises(AttributeError):
+            pddiktipy.not_a_name
+
+    def test_benchmark_reports_every_metric(self):
+        """Test one cold-start run reports import and first-response times."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "coldstart.json")
+            self.assertEqual(main(["--runs", "1", "--json", path]), 0)
+            with open(path, encoding="utf-8") as f:
+                report = json.load(f)
+        self.assertEqual(set(report), {"interpreter", "import.pddiktipy", "import.service",
+                                       "first_response.client", "first_response.service"})
+        self.assertEqual(report["first_response.service"]["failed"], 0)
+        self.assertEqual(report["first_response.client"]["failed"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+PDDIKTI Deadline Propagation Test Suite
+
+Verifies time budgets bound upstream timeouts, retries and composite
+fan-out, for both the sync and the asyncio client.
+
+Test Framework: Python unittest
+"""
+
+import time
+import unittest
+import os
+import sys
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pddiktipy import api, AsyncApi, APITimeoutError, RetryPolicy, deadline_scope
+from pddiktipy.deadline import clamp_timeout, current_deadline, remaining
+from pddiktipy.parallel import run_sections
+from tests.stub_server import StubServer
+
+
+class TestDeadlineScope(unittest.TestCase):
+    """Verify scopes, nesting and timeout clamping."""
+
+    def test_no_scope(self):
+        """Test timeouts pass through without an active deadline."""
+        self.assertIsNone(current_deadline())
+        self.assertIsNone(remaining())
+        self.assertEqual(clamp_timeout(10.0), 10.0)
+
+    def test_clamps_to_budget(self):
+        """Test timeouts shrink to the remaining budget."""
+        with deadline_scope(0.5):
+            self.assertLessEqual(clamp_timeout(10.0), 0.5)
+            self.assertLessEqual(clamp_timeout(None), 0.5)
+            self.assertEqual(clamp_timeout(0.1), 0.1)
+        self.assertIsNone(current_deadline())
+
+    def test_nested_scope_cannot_extend(self):
+        """Test an inner scope only ever shortens the deadline."""
+        with deadline_scope(0.5) as outer:
+            with deadline_scope(60) as inner:
+                self.assertEqual(inner, outer)
+            with deadline_scope(0.1) as inner:
+                self.assertLess(inner, outer)
+            self.assertEqual(current_deadline(), outer)
+
+    def test_expired_deadline_raises(self):
+        """Test nothing is sent once the deadline has passed."""
+        with deadline_scope(deadline=time.monotonic() - 1):
+            with self.assertRaises(APITimeoutError):
+                clamp_timeout(5.0)
+
+    def test_sections_inherit_deadline(self):
+        """Test composite worker threads see the caller's deadline."""
+        with deadline_scope(5) as deadline:
+            result = run_sections({"a": current_deadline, "b": current_deadline})
+        self.assertEqual(result["a"], deadline)
+        self.assertEqual(result["b"], deadline)
+
+
+class TestClientDeadlines(unittest.IsolatedAsyncioTestCase):
+    """Verify budgets bound real requests against the local stand-in."""
+
+    def setUp(self):
+        self.server = StubServer().__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def test_budget_cuts_read_timeout(self):
+        """Test a slow response is abandoned when the budget runs out."""
+        with api(base_url=self.server.url) as client:
+            start = time.perf_counter()
+            result = client.search_pt("delay-1500 kampus", budget=0.3)
+            elapsed = time.perf_counter() - start
+        self.assertIsNone(result)
+        self.assertLess(elapsed, 1.0)
+
+    def test_budget_bounds_retries(self):
+        """Test retries stop once the budget is spent."""
+        retry = RetryPolicy(max_attempts=10, deadline=None, backoff=0.05)
+        with api(base_url=self.server.url, retry=retry) as client:
+            start = time.perf_counter()
+            result = client.search_pt("delay-200 status-503", budget=0.5)
+            elapsed = time.perf_counter() - start
+        self.assertIsNone(result)
+        self.assertLess(elapsed, 1.0)
+        self.assertLessEqual(len(self.server.paths), 3)
+
+    def test_budget_is_not_needed(self):
+        """Test fast calls succeed within a generous budget."""
+        with api(base_url=self.server.url) as client:
+            result = client.search_pt("kampus", budget=5)
+        self.assertEqual(result[0]["path"], "/pencarian/pt/kampus")
+
+    def test_composite_timeout_bounds_sections(self):
+        """Test a composite returns by its timeout and sections time out."""
+        with api(base_url=self.server.url) as client:
+            start = time.perf_counter()
+            portfolio = client.get_dosen_portfolio("delay-1500", timeout=0.3)
+            elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, 1.0)
+        self.assertFalse(portfolio.ok)
+        self.assertFalse(any(portfolio.data.values()))
+
+    async def test_async_budget(self):
+        """Test the asyncio client honours per-call budgets."""
+        async with AsyncApi(base_url=self.server.url) as client:
+            start = time.perf_counter()
+            result = await client.search_dosen("delay-1500 budi", budget=0.3)
+            self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertIsNone(result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+PDDIKTI Persistent Cache Test Suite
+
+Verifies the SQLite response cache and its use by the clients.
+
+Test Framework: Python unittest
+"""
+
+import multiprocessing
+import tempfile
+import unittest
+import os
+import sys
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pddiktipy import api, AsyncApi, DiskCache
+from pddiktipy.disk_cache import normalize_url
+from tests.stub_server import StubServer
+
+SAMPLE_ID = "lCOatIX_hCe2RQSG1Rghn5kO81hHLJdY"
+
+
+def _write_entries(path, worker):
+    cache = DiskCache(path)
+    for i in range(50):
+        cache.set(f"http://host/detail/mhs/{worker}-{i}", b'{"n": %d}' % i)
+    cache.close()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDiskCache(unittest.TestCase):
+    """Verify storage, TTL rules and concurrent access."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "cache.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_normalize_url(self):
+        """Test equivalent URLs share one key."""
+        self.assertEqual(
+            normalize_url("HTTPS://Host/pt/prodi/x/?b=2&a=1"),
+            normalize_url("https://host/pt/prodi/x?a=1&b=2")
+        )
+
+    def test_ttl_rules_by_path_prefix(self):
+        """Test the first matching prefix decides the TTL."""
+        cache = DiskCache(self.path, rules=[("pencarian/", 10), ("pt/logo", 99)],
+                          default_ttl=50)
+        self.assertEqual(cache.ttl_for("http://h/pencarian/mhs/budi"), 10)
+        self.assertEqual(cache.ttl_for("http://h/pt/logo/abc"), 99)
+        self.assertEqual(cache.ttl_for("http://h/prodi/count"), 50)
+
+    def test_expiry_and_compression(self):
+        """Test entries expire and bodies round-trip through compression."""
+        clock = FakeClock()
+        cache = DiskCache(self.path, rules=[("pencarian/", 10)], clock=clock)
+        body = b'[{"nama": "' + b"x" * 10000 + b'"}]'
+        cache.set("http://h/pencarian/mhs/budi", body)
+        self.assertEqual(cache.get("http://h/pencarian/mhs/budi"), body)
+        self.assertLess(os.path.getsize(self.path), 64 * 1024)
+        clock.now += 11
+        self.assertIsNone(cache.get("http://h/pencarian/mhs/budi"))
+        self.assertEqual(cache.purge_expired(), 1)
+
+    def test_concurrent_processes(self):
+        """Test several processes can write to one cache file."""
+        DiskCache(self.path).close()
+        procs = [multiprocessing.Process(target=_write_entries, args=(self.path, w))
+                 for w in range(4)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join(30)
+            self.assertEqual(p.exitcode, 0)
+        self.assertEqual(DiskCache(self.path).stats()["entries"], 200)
+
+
+class TestClientDiskCache(unittest.IsolatedAsyncioTestCase):
+    """Verify a second client run is served from disk."""
+
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "cache.db")
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+        self.tmp.cleanup()
+
+    def test_rerun_hits_disk(self):
+        """Test JSON and logo responses survive a new client and cache instance."""
+        for _ in range(2):
+            with api(base_url=self.server.url, cache=DiskCache(self.path)) as client:
+                detail = client.get_detail_mhs(SAMPLE_ID)
+                logo = client.get_logo_pt(SAMPLE_ID)
+        self.assertEqual(detail, [{"path": f"/detail/mhs/{SAMPLE_ID}"}])
+        self.assertTrue(logo.startswith("iVBOR"))
+        self.assertEqual(len(self.server.paths), 2)
+
+    def test_errors_are_not_cached(self):
+        """Test failed responses always go upstream."""
+        with api(base_url=self.server.url, cache=DiskCache(self.path)) as client:
+            self.assertIsNone(client.search_pt("status-404"))
+            self.assertIsNone(client.search_pt("status-404"))
+        self.assertEqual(len(self.server.paths), 2)
+
+    async def test_async_client_shares_cache(self):
+        """Test the asyncio client reads entries written by the sync client."""
+        cache = DiskCache(self.path)
+        with api(base_url=self.server.url, cache=cache) as client:
+            client.search_dosen("budi")
+        async with AsyncApi(base_url=self.server.url, cache=cache) as client:
+            result = await client.search_dosen("budi")
+        self.assertEqual(result, [{"path": "/pencarian/dosen/budi"}])
+        self.assertEqual(len(self.server.paths), 1)
+
+
+class TestConditionalRevalidation(unittest.IsolatedAsyncioTestCase):
+    """Verify expired entries are revalidated with ETag/Last-Modified."""
+
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.clock = FakeClock()
+        self.cache = DiskCache(os.path.join(self.tmp.name, "cache.db"), clock=self.clock)
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+        self.tmp.cleanup()
+
+    def test_validators_are_stored(self):
+        """Test ETag and Last-Modified are kept with the body."""
+        with api(base_url=self.server.url, cache=self.cache) as client:
+            client.get_data_pt_provinsi()
+        entry = self.cache.lookup(f"{self.server.url}/visualisasi/pt-provinsi")
+        self.assertTrue(entry.etag.startswith('"'))
+        self.assertEqual(entry.last_modified, "Mon, 01 Jan 2024 00:00:00 GMT")
+
+    def test_not_modified_extends_entry(self):
+        """Test a 304 returns the cached body and refreshes its TTL."""
+        with api(base_url=self.server.url, cache=self.cache) as client:
+            first = client.get_data_pt_provinsi()
+            self.clock.now += 2 * 24 * 60 * 60
+            second = client.get_data_pt_provinsi()
+            third = client.get_data_pt_provinsi()
+        self.assertEqual(first, second)
+        self.assertEqual(second, third)
+        self.assertEqual(len(self.server.paths), 2)
+        self.assertEqual(self.server.not_modified, 1)
+
+    async def test_async_not_modified(self):
+        """Test the asyncio client revalidates the same way."""
+        with api(base_url=self.server.url, cache=self.cache) as client:
+            first = client.get_prodi_count()
+        self.clock.now += 7 * 60 * 60
+        async with AsyncApi(base_url=self.server.url, cache=self.cache) as client:
+            second = await client.get_prodi_count()
+        self.assertEqual(first, second)
+        self.assertEqual(self.server.not_modified, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+PDDIKTI Endpoint Template Test Suite
+
+Verifies the declarative endpoint table, the compiled URL templates and the
+shared request headers.
+
+Test Framework: Python unittest
+"""
+
+import inspect
+import os
+import sys
+import unittest
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pddiktipy import api, MemoryTransport
+from pddiktipy.async_api import API_METHODS
+from pddiktipy.endpoints import ENDPOINTS, EndpointTemplates, compile_endpoints
+from pddiktipy.helper import helper
+
+SAMPLE_ID = "lCOatIX_hCe2RQSG1Rghn5kO81hHLJdY=="
+
+
+class TestEndpointTemplates(unittest.TestCase):
+    """Verify URL generation from the endpoint table."""
+
+    def test_table_covers_every_method(self):
+        """Test each endpoint method has a template with one slot per argument."""
+        self.assertEqual(set(ENDPOINTS), set(API_METHODS))
+        for name in API_METHODS:
+            params = list(inspect.signature(getattr(api, name).__wrapped__).parameters)
+            self.assertEqual(ENDPOINTS[name].count("{}"), len(params) - 1, name)
+
+    def test_templates_fill_encoded_arguments(self):
+        """Test URLs are built from the base URL and the encoded arguments."""
+        client = api(base_url="http://127.0.0.1:9/")
+        self.assertEqual(client._url("get_prodi_pt", SAMPLE_ID, 20241),
+                         f"http://127.0.0.1:9/pt/prodi/{SAMPLE_ID}/20241")
+        self.assertEqual(client._url("search_pt", "Gadjah Mada"),
+                         "http://127.0.0.1:9/pencarian/pt/Gadjah%20Mada")
+        self.assertEqual(client._url("get_homebase_prodi", SAMPLE_ID, "20241"),
+                         f"http://127.0.0.1:9/dosen/homebase/{SAMPLE_ID}?semester=20241")
+        self.assertEqual(client._url("get_pt_count"), "http://127.0.0.1:9/pt/count")
+
+    def test_compiled_once_per_base_url(self):
+        """Test clients with the same base URL share the compiled templates."""
+        self.assertIs(compile_endpoints("http://a"), compile_endpoints("http://a"))
+        self.assertIs(api(base_url="http://a")._urls, api(base_url="http://a")._urls)
+
+    def test_braces_in_base_url(self):
+        """Test a base URL containing braces is not read as placeholders."""
+        self.assertEqual(EndpointTemplates("http://h/{x}").url("get_detail_pt", "id"),
+                         "http://h/{x}/detail/pt/id")
+
+    def test_methods_request_table_urls(self):
+        """Test an endpoint method sends its request to the table URL."""
+        fake = MemoryTransport(default={"ok": True})
+        client = api(base_url="http://stand-in", transport=fake, circuit_breakers=False)
+        client.get_waktu_studi_pt(SAMPLE_ID)
+        self.assertEqual(fake.requests[-1], f"http://stand-in/pt/waktu-studi/{SAMPLE_ID}")
+
+
+class TestSharedHeaders(unittest.TestCase):
+    """Verify the request headers are decoded once and shared."""
+
+    def test_headers_are_read_only_and_shared(self):
+        """Test requests send the helper's one read-only header mapping."""
+        h = helper()
+        with self.assertRaises(TypeError):
+            h.headers["Host"] = "example.com"
+        sent = []
+        fake = MemoryTransport(default=lambda url, headers: sent.append(headers) or {})
+        h = helper(transport=fake, circuit_breakers=False)
+        h.response("http://stand-in/pt/count")
+        h.response("http://stand-in/prodi/count")
+        self.assertEqual(len(sent), 2)
+        self.assertIs(sent[0], h.headers)
+        self.assertIs(sent[1], h.headers)
+
+    def test_get_headers_returns_a_copy(self):
+        """Test get_headers still returns a mutable dict with the decoded values."""
+        h = helper(base_url="http://127.0.0.1:8765")
+        headers = h.get_headers()
+        headers["X-Extra"] = "1"
+        self.assertNotIn("X-Extra", h.headers)
+        self.assertEqual(headers["Host"], "127.0.0.1:8765")
+        self.assertTrue(headers["Origin"].startswith("https://"))
+
+    def test_parse_fast_path_matches_requote(self):
+        """Test values needing no encoding are returned unchanged, others encoded."""
+        h = helper()
+        self.assertEqual(h.parse(SAMPLE_ID), SAMPLE_ID)
+        self.assertEqual(h.parse(20241), "20241")
+        self.assertEqual(h.parse("Gadjah Mada"), "Gadjah%20Mada")
+        self.assertEqual(h.parse("50%25"), "50%25")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,192 @@
+"""
+PDDIKTI Events Test Suite
+
+Verifies request and call events reach subscribers with the right family,
+status, size, attempts and cache outcome, and that subscribers never
+affect the calls they observe.
+
+Test Framework: Python unittest
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pddiktipy import (
+    api, AsyncApi, CallEvent, ClientPool, DiskCache, EventHooks, MemoryTransport,
+    RequestEvent, RetryPolicy, TransportResponse
+)
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def _flaky(*replies):
+    """A MemoryTransport reply giving ``replies`` in turn, then the last one."""
+    remaining = list(replies)
+
+    def reply(url, headers):
+        return remaining.pop(0) if len(remaining) > 1 else remaining[0]
+    return reply
+
+
+class TestEventHooks(unittest.TestCase):
+    """Verify subscription handling."""
+
+    def test_inactive_without_subscribers(self):
+        """Test no event is created while nobody listens."""
+        hooks = EventHooks()
+        self.assertFalse(hooks.active)
+        self.assertIsNone(hooks.start_request("https://host/detail/pt/1"))
+
+    def test_unsubscribe(self):
+        """Test the returned function removes the subscriber."""
+        hooks = EventHooks()
+        seen = []
+        unsubscribe = hooks.subscribe(seen.append)
+        hooks.emit(CallEvent("search_pt", 0.1, True))
+        unsubscribe()
+        hooks.emit(CallEvent("search_pt", 0.1, True))
+        self.assertEqual(len(seen), 1)
+        self.assertFalse(hooks.active)
+
+    def test_start_notifications(self):
+        """Test subscribers of starts see each request begin and finish."""
+        hooks = EventHooks()
+        seen = []
+        hooks.subscribe(lambda event: seen.append(event.done), starts=True)
+        event = hooks.start_request("https://host/detail/pt/1")
+        hooks.finish_request(event)
+        self.assertEqual(seen, [False, True])
+
+    def test_failing_subscriber_is_isolated(self):
+        """Test an exception in one subscriber does not reach the others."""
+        hooks = EventHooks()
+        seen = []
+        hooks.subscribe(lambda event: 1 / 0)
+        hooks.subscribe(seen.append)
+        with self.assertLogs("pddiktipy.events", level="ERROR"):
+            hooks.emit(CallEvent("search_pt", 0.1, True))
+        self.assertEqual(len(seen), 1)
+
+
+class TestClientEvents(unittest.TestCase):
+    """Verify the sync client emits request and call events."""
+
+    def setUp(self):
+        self.fake = MemoryTransport({"/pencarian/pt/ugm": [{"nama": "UGM"}]})
+        self.events = []
+
+    def _client(self, **kwargs):
+        kwargs.setdefault("retry", NO_RETRY)
+        client = api(transport=self.fake, circuit_breakers=False, **kwargs)
+        client.events.subscribe(self.events.append)
+        return client
+
+    def _of(self, cls):
+        return [event for event in self.events if isinstance(event, cls)]
+
+    def test_request_and_call_event(self):
+        """Test a successful call emits one request and one call event."""
+        with self._client() as client:
+            self.assertEqual(client.search_pt("ugm"), [{"nama": "UGM"}])
+        [request] = self._of(RequestEvent)
+        self.assertEqual(request.family, "pencarian/pt")
+        self.assertEqual(request.status, 200)
+        self.assertEqual(request.size, len(b'[{"nama": "UGM"}]'))
+        self.assertEqual((request.attempts, request.retries), (1, 0))
+        self.assertIsNone(request.cache)
+        self.assertTrue(request.ok)
+        self.assertGreaterEqual(request.elapsed, 0)
+        [call] = self._of(CallEvent)
+        self.assertEqual(call.method, "search_pt")
+        self.assertTrue(call.ok)
+        self.assertFalse(call.swallowed)
+
+    def test_retries_are_counted(self):
+        """Test one request event covers every attempt."""
+        self.fake.add("/pencarian/pt/busy", _flaky(TransportResponse(503), [{"nama": "UGM"}]))
+        with self._client(retry=RetryPolicy(max_attempts=3, backoff=0)) as client:
+            self.assertIsNotNone(client.search_pt("busy"))
+        [request] = self._of(RequestEvent)
+        self.assertEqual((request.attempts, request.retries), (2, 1))
+        self.assertEqual(request.status, 200)
+
+    def test_failed_request_is_swallowed(self):
+        """Test an upstream error is reported on both events."""
+        with self._client() as client:
+            self.assertIsNone(client.search_pt("missing"))
+        [request] = self._of(RequestEvent)
+        self.assertEqual(request.status, 404)
+        self.assertFalse(request.ok)
+        [call] = self._of(CallEvent)
+        self.assertFalse(call.ok)
+        self.assertTrue(call.swallowed)
+
+    def test_validation_error_emits_call_only(self):
+        """Test rejected input never reaches the transport but is reported."""
+        with self._client() as client:
+            self.assertIsNone(client.search_pt(""))
+        self.assertEqual(self._of(RequestEvent), [])
+        [call] = self._of(CallEvent)
+        self.assertTrue(call.swallowed)
+
+    def test_disk_cache_outcome(self):
+        """Test the first request misses the disk cache and the second hits it."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+        cache = DiskCache(os.path.join(directory, "cache.sqlite"))
+        self.addCleanup(cache.close)
+        with self._client(cache=cache) as client:
+            client.search_pt("ugm")
+            client.search_pt("ugm")
+        miss, hit = self._of(RequestEvent)
+        self.assertEqual((miss.cache, miss.attempts), ("miss", 1))
+        self.assertEqual((hit.cache, hit.attempts), ("hit", 0))
+        self.assertEqual(hit.size, miss.size)
+        self.assertEqual(len(self.fake.requests), 1)
+
+    def test_subscriber_error_does_not_break_call(self):
+        """Test a failing subscriber leaves the result untouched."""
+        with self._client() as client:
+            client.events.subscribe(lambda event: 1 / 0)
+            with self.assertLogs("pddiktipy.events", level="ERROR"):
+                self.assertEqual(client.search_pt("ugm"), [{"nama": "UGM"}])
+
+    def test_pool_shares_hooks(self):
+        """Test one subscriber on a pool sees the requests of every client."""
+        pool = ClientPool(size=2, transport=self.fake, retry=NO_RETRY, circuit_breakers=False)
+        self.addCleanup(pool.close)
+        pool.events.subscribe(self.events.append)
+        with pool.client() as first, pool.client() as second:
+            self.assertIs(first.events, second.events)
+            first.search_pt("ugm")
+            second.search_pt("ugm")
+        self.assertEqual(len(self._of(RequestEvent)), 2)
+
+
+class TestAsyncClientEvents(unittest.IsolatedAsyncioTestCase):
+    """Verify the async client emits the same events."""
+
+    async def test_request_and_call_event(self):
+        """Test an async call emits one request and one call event."""
+        fake = MemoryTransport({"/pencarian/pt/ugm": [{"nama": "UGM"}]})
+        events = []
+        async with AsyncApi(transport=fake, retry=NO_RETRY, circuit_breakers=False) as client:
+            client.events.subscribe(events.append)
+            self.assertEqual(await client.search_pt("ugm"), [{"nama": "UGM"}])
+            self.assertIsNone(await client.search_pt("missing"))
+        requests = [e for e in events if e.kind == "request"]
+        calls = [e for e in events if e.kind == "call"]
+        self.assertEqual([(r.family, r.status, r.attempts) for r in requests],
+                         [("pencarian/pt", 200, 1), ("pencarian/pt", 404, 1)])
+        self.assertEqual([(c.method, c.ok) for c in calls],
+                         [("search_pt", True), ("search_pt", False)])
+
+
+if __name__ == '__main__':
+    unittest.main()
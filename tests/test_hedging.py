@@ -0,0 +1,106 @@
+"""
+PDDIKTI Hedged Request Test Suite
+
+Verifies slow GETs are duplicated within the extra-load budget.
+
+Test Framework: Python unittest
+"""
+
+import time
+import unittest
+import os
+import sys
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pddiktipy import api, AsyncApi, HedgePolicy
+from tests.stub_server import StubServer
+
+
+class TestHedgePolicy(unittest.TestCase):
+    """Verify the hedge delay and the extra-load budget."""
+
+    def test_delay_tracks_percentile(self):
+        """Test the delay follows recent latency per endpoint family."""
+        policy = HedgePolicy(percentile=90, initial_delay=1.0, min_samples=20)
+        url = "https://h/detail/pt/abc"
+        self.assertEqual(policy.delay(url), 1.0)
+        for i in range(100):
+            policy.observe(url, (i + 1) / 1000)
+        self.assertAlmostEqual(policy.delay(url), 0.09, delta=0.005)
+        self.assertEqual(policy.delay("https://h/pencarian/pt/x"), 1.0)
+
+    def test_delay_is_bounded(self):
+        """Test min_delay and max_delay clamp the percentile."""
+        policy = HedgePolicy(min_delay=0.05, max_delay=0.5, min_samples=8)
+        for _ in range(16):
+            policy.observe("https://h/a/b", 10.0)
+            policy.observe("https://h/c/d", 0.0)
+        self.assertEqual(policy.delay("https://h/a/b"), 0.5)
+        self.assertEqual(policy.delay("https://h/c/d"), 0.05)
+
+    def test_budget_caps_extra_load(self):
+        """Test at most max_extra hedges per request are allowed."""
+        policy = HedgePolicy(max_extra=0.1, burst=10)
+        hedges = 0
+        for _ in range(100):
+            policy.on_request()
+            hedges += policy.try_hedge()
+        self.assertEqual(hedges, 10)
+        self.assertEqual(policy.stats()["hedged"], 10)
+
+
+class TestClientHedging(unittest.IsolatedAsyncioTestCase):
+    """Verify the first response wins against the local stand-in."""
+
+    def setUp(self):
+        self.server = StubServer().__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def _policy(self, max_extra=1.0):
+        return HedgePolicy(max_extra=max_extra, burst=1, initial_delay=0.05)
+
+    def test_hedge_wins_over_slow_primary(self):
+        """Test a slow first request is overtaken by its duplicate."""
+        policy = self._policy()
+        with api(base_url=self.server.url, hedge=policy) as client:
+            start = time.perf_counter()
+            result = client.search_pt("slowfirst-1000 kampus")
+            elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(result[0]["path"], "/pencarian/pt/slowfirst-1000%20kampus")
+        self.assertEqual(len(self.server.paths), 2)
+        self.assertEqual(policy.hedge_wins, 1)
+
+    def test_fast_requests_are_not_hedged(self):
+        """Test requests answering within the delay are sent once."""
+        policy = self._policy()
+        with api(base_url=self.server.url, hedge=policy) as client:
+            client.search_pt("kampus")
+        self.assertEqual(len(self.server.paths), 1)
+        self.assertEqual(policy.hedged, 0)
+
+    def test_no_budget_no_hedge(self):
+        """Test an exhausted budget waits for the primary."""
+        policy = self._policy(max_extra=0.0)
+        with api(base_url=self.server.url, hedge=policy) as client:
+            start = time.perf_counter()
+            client.search_pt("slowfirst-300 kampus")
+        self.assertGreaterEqual(time.perf_counter() - start, 0.3)
+        self.assertEqual(len(self.server.paths), 1)
+
+    async def test_async_hedge(self):
+        """Test the asyncio client hedges and cancels the loser."""
+        policy = self._policy()
+        async with AsyncApi(base_url=self.server.url, hedge=policy) as client:
+            start = time.perf_counter()
+            await client.search_dosen("slowfirst-1000 budi")
+            self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(policy.hedge_wins, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+PDDIKTI Load Test Harness Test Suite
+
+Verifies the traffic generator and the latency summary of the service
+load test, without starting the service.
+
+Test Framework: Python unittest
+"""
+
+import os
+import random
+import sys
+import unittest
+
+# Add the parent directory to the path to import the benchmarks package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.loadtest import DEFAULT_MIX, Workload, Zipf, _summarise, percentile
+
+
+class TestLoadTestHarness(unittest.TestCase):
+    """Verify the Zipf workload and the phase report."""
+
+    def test_zipf_favours_low_ranks(self):
+        """Test rank 0 is drawn about twice as often as rank 1 when s=1."""
+        rng = random.Random(0)
+        zipf = Zipf(100, 1.0)
+        counts = [0] * 100
+        for _ in range(20000):
+            counts[zipf.sample(rng)] += 1
+        self.assertAlmostEqual(counts[0] / counts[1], 2.0, delta=0.3)
+        self.assertGreater(counts[1], counts[50])
+
+    def test_workload_is_reproducible(self):
+        """Test the same seed gives the same paths, from the route mix."""
+        workload = Workload(keywords=20, ids=20, seed=3)
+        paths = workload.paths(200, seed=1)
+        self.assertEqual(paths, workload.paths(200, seed=1))
+        self.assertNotEqual(paths, workload.paths(200, seed=2))
+        self.assertTrue({route for route, _ in paths} <= set(DEFAULT_MIX))
+        for route, path in paths:
+            if "{id}" in route:
+                self.assertEqual(len(path.split("/")[3].split("?")[0]), 32)
+
+    def test_percentile_nearest_rank(self):
+        """Test nearest-rank percentiles of a sorted sample."""
+        ordered = list(range(1, 101))
+        self.assertEqual(percentile(ordered, 50), 50)
+        self.assertEqual(percentile(ordered, 99), 99)
+        self.assertEqual(percentile(ordered, 100), 100)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_summary_counts_errors_and_throughput(self):
+        """Test the phase report counts non-2xx responses as errors."""
+        samples = [("/a", 200, 0.01)] * 8 + [("/a", 503, 0.2), ("/b", 599, 0.3)]
+        report = _summarise("cold", samples, duration=2.0)
+        self.assertEqual(report.requests, 10)
+        self.assertEqual(report.errors, 2)
+        self.assertEqual(report.throughput_rps, 5.0)
+        self.assertAlmostEqual(report.p50_ms, 10.0)
+        self.assertEqual(report.routes["/a"]["requests"], 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
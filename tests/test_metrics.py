@@ -0,0 +1,142 @@
+"""
+PDDIKTI Metrics Test Suite
+
+Verifies the Prometheus text output, per-thread counters and the upstream
+metrics fed by client events.
+
+Test Framework: Python unittest
+"""
+
+import os
+import sys
+import threading
+import unittest
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pddiktipy import api, EventHooks, MemoryTransport, RetryPolicy, TransportResponse
+from pddiktipy.metrics import MetricsRegistry, UpstreamMetrics
+
+
+def _sample(text, line_start):
+    """Value of the first exposition line starting with ``line_start``."""
+    for line in text.splitlines():
+        if line.startswith(line_start):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"no sample {line_start!r} in:\n{text}")
+
+
+class TestRegistry(unittest.TestCase):
+    """Verify the metric types and the exposition format."""
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_counter_and_gauge(self):
+        """Test counters and gauges render with escaped labels."""
+        hits = self.registry.counter("hits_total", "Hits", ["route"])
+        busy = self.registry.gauge("busy", "Busy workers")
+        hits.inc('/a"b')
+        hits.inc('/a"b', amount=2)
+        busy.inc()
+        busy.inc()
+        busy.dec()
+        text = self.registry.render()
+        self.assertIn("# TYPE hits_total counter", text)
+        self.assertIn('hits_total{route="/a\\"b"} 3', text)
+        self.assertIn("busy 1", text)
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test bucket counts include smaller buckets and bounds are inclusive."""
+        latency = self.registry.histogram("latency_seconds", "Latency", ["family"],
+                                          buckets=[0.1, 1])
+        for value in (0.05, 0.1, 0.5, 3):
+            latency.observe(value, "pt/count")
+        text = self.registry.render()
+        prefix = 'latency_seconds_bucket{family="pt/count",'
+        self.assertEqual(_sample(text, prefix + 'le="0.1"}'), 2)
+        self.assertEqual(_sample(text, prefix + 'le="1"}'), 3)
+        self.assertEqual(_sample(text, prefix + 'le="+Inf"}'), 4)
+        self.assertEqual(_sample(text, 'latency_seconds_count{family="pt/count"}'), 4)
+        self.assertAlmostEqual(_sample(text, 'latency_seconds_sum{family="pt/count"}'), 3.65)
+
+    def test_threads_are_summed(self):
+        """Test values recorded by many threads add up without locks."""
+        hits = self.registry.counter("hits_total", "Hits")
+        in_flight = self.registry.gauge("in_flight", "In flight")
+
+        def work():
+            for _ in range(1000):
+                hits.inc()
+                in_flight.inc()
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Decrements from another thread than the increments
+        in_flight.dec(amount=8000)
+        text = self.registry.render()
+        self.assertEqual(_sample(text, "hits_total "), 8000)
+        self.assertEqual(_sample(text, "in_flight "), 0)
+
+    def test_ended_threads_are_retired(self):
+        """Test shards of finished threads fold into one total instead of piling up."""
+        duration = self.registry.histogram("duration_seconds", "Duration", ["route"])
+        for _ in range(50):
+            thread = threading.Thread(target=duration.observe, args=(0.02, "/pt"))
+            thread.start()
+            thread.join()
+        self.assertLessEqual(len(duration._shards), 1)
+        text = self.registry.render()
+        self.assertEqual(_sample(text, 'duration_seconds_count{route="/pt"}'), 50)
+
+    def test_callback_and_errors(self):
+        """Test callback metrics, duplicate names and wrong label counts."""
+        self.registry.callback("entries", "Entries", "gauge", ["cache"],
+                               lambda: [(("search",), 5)])
+        self.assertIn('entries{cache="search"} 5', self.registry.render())
+        with self.assertRaises(ValueError):
+            self.registry.gauge("entries", "Again")
+        hits = self.registry.counter("hits_total", "Hits", ["route"])
+        with self.assertRaises(ValueError):
+            hits.inc()
+
+
+class TestUpstreamMetrics(unittest.TestCase):
+    """Verify client request events become upstream metrics."""
+
+    def test_requests_retries_and_in_flight(self):
+        """Test statuses, retries and in-flight requests per family."""
+        registry = MetricsRegistry()
+        events = EventHooks()
+        metrics = UpstreamMetrics(registry)
+        metrics.attach(events)
+        seen_in_flight = []
+        busy = [TransportResponse(503)]
+
+        def reply(url, headers):
+            seen_in_flight.append(metrics.in_flight.totals()[()][0])
+            return busy.pop() if busy else [{"nama": "UGM"}]
+
+        fake = MemoryTransport({"/pencarian/pt/ugm": reply})
+        with api(transport=fake, events=events, circuit_breakers=False,
+                 retry=RetryPolicy(max_attempts=2, backoff=0)) as client:
+            client.search_pt("ugm")
+            client.search_pt("missing")
+        text = registry.render()
+        self.assertEqual(seen_in_flight, [1, 1])
+        self.assertEqual(_sample(text, "pddikti_upstream_in_flight "), 0)
+        self.assertEqual(_sample(
+            text, 'pddikti_upstream_requests_total{family="pencarian/pt",status="200"}'), 1)
+        self.assertEqual(_sample(
+            text, 'pddikti_upstream_requests_total{family="pencarian/pt",status="404"}'), 1)
+        self.assertEqual(_sample(
+            text, 'pddikti_upstream_retries_total{family="pencarian/pt"}'), 1)
+        self.assertEqual(_sample(
+            text, 'pddikti_upstream_request_duration_seconds_count{family="pencarian/pt"}'), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
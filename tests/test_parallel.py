@@ -0,0 +1,251 @@
+"""
+PDDIKTI Composite Call Test Suite
+
+Offline tests for the concurrent section runners and the composite
+profile methods, using a local stand-in server.
+
+Test Framework: Python unittest
+"""
+
+import time
+import unittest
+import os
+import sys
+from datetime import date
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pddiktipy import api, AsyncApi, APIResponseError
+from pddiktipy.parallel import (
+    run_sections, run_sections_async, current_semester, iter_many
+)
+from tests.stub_server import StubServer
+
+SAMPLE_ID = "lCOatIX_hCe2RQSG1Rghn5kO81hHLJdY"
+
+
+def _sleeper(seconds, value="ok"):
+    def call():
+        time.sleep(seconds)
+        return value
+    return call
+
+
+def _failing():
+    raise APIResponseError("Endpoint not found", status_code=404)
+
+
+class TestRunSections(unittest.TestCase):
+    """Verify concurrency, deadlines and per-section status."""
+
+    def test_latency_is_bounded_by_slowest_section(self):
+        """Test sections run concurrently rather than back to back."""
+        sections = {f"s{i}": _sleeper(0.2) for i in range(6)}
+        start = time.perf_counter()
+        result = run_sections(sections, max_workers=6, timeout=5)
+        self.assertLess(time.perf_counter() - start, 0.6)
+        self.assertTrue(result.ok)
+        self.assertEqual(list(result.sections), list(sections))
+
+    def test_per_section_errors(self):
+        """Test a failing section does not fail the composite."""
+        result = run_sections({"good": _sleeper(0, {"a": 1}), "bad": _failing,
+                               "empty": _sleeper(0, None)})
+        self.assertEqual(result["good"], {"a": 1})
+        self.assertEqual(result.sections["bad"].status, "error")
+        self.assertEqual(result.sections["bad"].error_type, "APIResponseError")
+        self.assertEqual(result.sections["empty"].status, "empty")
+        self.assertEqual(list(result.failed), ["bad"])
+        self.assertFalse(result.ok)
+
+    def test_deadline_marks_stragglers(self):
+        """Test sections past the overall deadline are reported as timeouts."""
+        start = time.perf_counter()
+        result = run_sections({"fast": _sleeper(0), "slow": _sleeper(1)}, timeout=0.2)
+        self.assertLess(time.perf_counter() - start, 0.6)
+        self.assertEqual(result.sections["fast"].status, "ok")
+        self.assertEqual(result.sections["slow"].status, "timeout")
+        payload = result.to_dict()
+        self.assertEqual(payload["status"]["slow"]["status"], "timeout")
+        self.assertFalse(payload["complete"])
+
+    def test_threads_are_reused(self):
+        """Test composite calls share one pool instead of starting threads each."""
+        import threading
+        for _ in range(20):
+            run_sections({f"s{i}": _sleeper(0) for i in range(4)}, max_workers=2)
+        names = {thread.name for thread in threading.enumerate()
+                 if thread.name.startswith("pddikti-fanout")}
+        before = len(names)
+        for _ in range(20):
+            result = run_sections({f"s{i}": _sleeper(0) for i in range(4)}, max_workers=2)
+            self.assertTrue(result.ok)
+        names = {thread.name for thread in threading.enumerate()
+                 if thread.name.startswith("pddikti-fanout")}
+        self.assertEqual(len(names), before)
+
+    def test_current_semester(self):
+        """Test academic semester boundaries."""
+        self.assertEqual(current_semester(date(2024, 8, 1)), 20241)
+        self.assertEqual(current_semester(date(2025, 1, 31)), 20241)
+        self.assertEqual(current_semester(date(2025, 2, 1)), 20242)
+        self.assertEqual(current_semester(date(2025, 7, 31)), 20242)
+
+
+class TestIterMany(unittest.TestCase):
+    """Verify bulk lookups stream, dedupe and bound concurrency."""
+
+    def test_completion_order_and_dedupe(self):
+        """Test fast items arrive first and repeated IDs are fetched once."""
+        calls = []
+
+        def fetch(item):
+            calls.append(item)
+            time.sleep(item)
+            return {"id": item}
+
+        results = list(iter_many(fetch, [0.3, 0.0, 0.3, 0.1, 0.0], concurrency=4))
+        self.assertEqual([r.id for r in results], [0.0, 0.1, 0.3])
+        self.assertEqual(sorted(calls), [0.0, 0.1, 0.3])
+
+    def test_bounded_concurrency(self):
+        """Test no more than ``concurrency`` lookups run at once."""
+        import threading
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def fetch(item):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return item
+
+        results = list(iter_many(fetch, iter(range(50)), concurrency=3))
+        self.assertEqual(len(results), 50)
+        self.assertLessEqual(state["peak"], 3)
+
+    def test_shares_the_fanout_pool(self):
+        """Test bulk lookups run on the shared pool, also with nested composites."""
+        import threading
+
+        def fetch(item):
+            sections = {f"s{i}": _sleeper(0.01, item) for i in range(3)}
+            return run_sections(sections, timeout=5).data
+
+        start = time.perf_counter()
+        results = list(iter_many(fetch, range(100), concurrency=80))
+        self.assertLess(time.perf_counter() - start, 5)
+        self.assertTrue(all(r.ok for r in results))
+        names = [thread.name for thread in threading.enumerate()]
+        self.assertFalse(any(name.startswith("pddikti-bulk") for name in names))
+        self.assertLessEqual(sum(name.startswith("pddikti-fanout") for name in names), 64)
+
+    def test_per_item_errors(self):
+        """Test failures are reported per item instead of as None."""
+        def fetch(item):
+            if item == "bad":
+                _failing()
+            return item
+
+        results = {r.id: r for r in iter_many(fetch, ["good", "bad"])}
+        self.assertTrue(results["good"].ok)
+        self.assertEqual(results["bad"].status, "error")
+        self.assertEqual(results["bad"].error_type, "APIResponseError")
+
+
+class TestAsyncRunSections(unittest.IsolatedAsyncioTestCase):
+    """Verify the asyncio runner honours the deadline."""
+
+    async def test_deadline(self):
+        import asyncio
+
+        async def slow():
+            await asyncio.sleep(1)
+
+        async def fast():
+            return [1]
+
+        result = await run_sections_async({"slow": slow, "fast": fast}, timeout=0.1)
+        self.assertEqual(result.sections["slow"].status, "timeout")
+        self.assertEqual(result["fast"], [1])
+
+
+class TestPTFullProfile(unittest.IsolatedAsyncioTestCase):
+    """Exercise get_pt_full_profile against the local stand-in server."""
+
+    def setUp(self):
+        self.server = StubServer().__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def test_sync_profile(self):
+        """Test every university section is fetched once."""
+        with api(base_url=self.server.url) as client:
+            profile = client.get_pt_full_profile(SAMPLE_ID, 20241)
+        self.assertEqual(len(profile.sections), 12)
+        self.assertTrue(profile.ok)
+        self.assertEqual(len(self.server.paths), 12)
+        self.assertEqual(profile["prodi"][0]["path"], f"/pt/prodi/{SAMPLE_ID}/20241")
+        self.assertTrue(profile["logo"].startswith("iVBOR"))
+
+    def test_errors_are_reported_per_section(self):
+        """Test upstream failures keep their exception type."""
+        with api(base_url=self.server.url) as client:
+            profile = client.get_pt_full_profile("status-404-abcdef", 20241)
+        self.assertEqual(len(profile.failed), 12)
+        self.assertEqual(profile.sections["detail"].error_type, "APIResponseError")
+
+    def test_invalid_input_returns_none(self):
+        """Test validation happens before any request."""
+        with api(base_url=self.server.url) as client:
+            self.assertIsNone(client.get_pt_full_profile("short"))
+            self.assertIsNone(client.get_pt_full_profile(SAMPLE_ID, 20243))
+        self.assertEqual(self.server.paths, [])
+
+    def test_dosen_portfolio(self):
+        """Test the lecturer portfolio exposes typed sections and timings."""
+        with api(base_url=self.server.url) as client:
+            portfolio = client.get_dosen_portfolio(SAMPLE_ID)
+        self.assertEqual(len(self.server.paths), 7)
+        self.assertEqual(portfolio.profile, [{"path": f"/dosen/profile/{SAMPLE_ID}"}])
+        self.assertEqual(
+            portfolio.penelitian[0]["path"], f"/dosen/portofolio/penelitian/{SAMPLE_ID}"
+        )
+        self.assertEqual(set(portfolio.timings), {
+            "profile", "penelitian", "pengabdian", "karya", "paten",
+            "study_history", "teaching_history"
+        })
+
+    def test_detail_mhs_many(self):
+        """Test bulk student lookups against the stand-in server."""
+        ids = [f"{SAMPLE_ID}{i}" for i in range(20)] * 2 + ["short"]
+        with api(base_url=self.server.url) as client:
+            results = list(client.get_detail_mhs_many(ids, concurrency=5))
+        self.assertEqual(len(results), 21)
+        self.assertEqual(len(self.server.paths), 20)
+        invalid = [r for r in results if r.id == "short"][0]
+        self.assertEqual(invalid.error_type, "ValidationError")
+
+    async def test_async_dosen_profile_many(self):
+        """Test the asyncio bulk lookup streams results."""
+        ids = [f"{SAMPLE_ID}{i}" for i in range(10)]
+        async with AsyncApi(base_url=self.server.url) as client:
+            results = [r async for r in client.get_dosen_profile_many(ids, concurrency=4)]
+        self.assertEqual(sorted(r.id for r in results), sorted(ids))
+        self.assertTrue(all(r.ok for r in results))
+
+    async def test_async_profile(self):
+        """Test the asyncio client returns the same sections."""
+        async with AsyncApi(base_url=self.server.url) as client:
+            profile = await client.get_pt_full_profile(SAMPLE_ID, 20241)
+        self.assertEqual(len(profile.sections), 12)
+        self.assertTrue(profile.ok)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+PDDIKTI Client Pool Test Suite
+
+Offline tests for the shared ClientPool used by the REST service.
+
+Test Framework: Python unittest
+"""
+
+import threading
+import unittest
+import os
+import sys
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pddiktipy import api, ClientPool, PDDIKTIError, ValidationError
+
+
+class TestClientPool(unittest.TestCase):
+    """Verify client reuse, sizing and draining of ClientPool."""
+
+    def test_adapter_uses_pool_settings(self):
+        """Test pool_connections/pool_maxsize reach the HTTPAdapter."""
+        client = api(pool_connections=3, pool_maxsize=7)
+        adapter = client.H.session.get_adapter("https://example.org")
+        self.assertEqual(adapter._pool_connections, 3)
+        self.assertEqual(adapter._pool_maxsize, 7)
+        client.close()
+
+    def test_client_is_reused(self):
+        """Test a released client is handed out again."""
+        pool = ClientPool(size=2)
+        with pool.client() as first:
+            pass
+        with pool.client() as second:
+            self.assertIs(first, second)
+        self.assertEqual(pool.created, 1)
+        pool.close()
+
+    def test_size_is_bounded(self):
+        """Test the pool never creates more than ``size`` clients."""
+        pool = ClientPool(size=2, acquire_timeout=0.05)
+        a = pool.acquire()
+        b = pool.acquire()
+        with self.assertRaises(PDDIKTIError):
+            pool.acquire()
+        pool.release(a)
+        self.assertIs(pool.acquire(), a)
+        pool.release(a)
+        pool.release(b)
+        pool.close()
+
+    def test_concurrent_acquire(self):
+        """Test many threads share a small pool without errors."""
+        pool = ClientPool(size=3)
+        seen = set()
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(20):
+                with pool.client() as client:
+                    with lock:
+                        seen.add(id(client))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertLessEqual(len(seen), 3)
+        self.assertLessEqual(pool.created, 3)
+        pool.close()
+
+    def test_close_drains_clients(self):
+        """Test close() closes sessions and the pool can be reused."""
+        pool = ClientPool(size=2)
+        pool.warm(2)
+        clients = list(pool._clients)
+        for client in clients:
+            client.H.session  # open the session
+        pool.close()
+        self.assertEqual(pool.created, 0)
+        for client in clients:
+            self.assertIsNone(client.H.transport._session)
+        with pool.client() as client:
+            self.assertNotIn(client, clients)
+        pool.close()
+
+    def test_invalid_size(self):
+        """Test a non-positive size is rejected."""
+        with self.assertRaises(ValidationError):
+            ClientPool(size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
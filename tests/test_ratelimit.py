@@ -0,0 +1,145 @@
+"""
+PDDIKTI Rate Limiter Test Suite
+
+Verifies the token bucket and its AIMD reaction to HTTP 429.
+
+Test Framework: Python unittest
+"""
+
+import threading
+import time
+import unittest
+import os
+import sys
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pddiktipy import api, AsyncApi, ClientPool, MemoryTransport, RateLimiter, RetryPolicy
+from pddiktipy.ratelimit import parse_retry_after
+from tests.stub_server import StubServer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Verify token accounting with a fake clock."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_burst_then_spacing(self):
+        """Test a full bucket allows a burst, then requests are spaced."""
+        limiter = RateLimiter(rate=10, burst=2, clock=self.clock)
+        self.assertEqual(limiter.reserve(), 0)
+        self.assertEqual(limiter.reserve(), 0)
+        self.assertAlmostEqual(limiter.reserve(), 0.1)
+        self.assertAlmostEqual(limiter.reserve(), 0.2)
+
+    def test_reserve_within_max_wait(self):
+        """Test a slot farther away than max_wait is refused without taking a token."""
+        limiter = RateLimiter(rate=10, burst=1, clock=self.clock)
+        self.assertEqual(limiter.reserve(max_wait=0.05), 0)
+        for _ in range(5):
+            self.assertIsNone(limiter.reserve(max_wait=0.05))
+        self.assertAlmostEqual(limiter.reserve(max_wait=0.5), 0.1)
+
+    def test_429_halves_rate_and_pauses(self):
+        """Test multiplicative decrease and the Retry-After pause."""
+        limiter = RateLimiter(rate=10, clock=self.clock)
+        limiter.on_rate_limited(retry_after=3)
+        self.assertEqual(limiter.rate, 5)
+        self.assertAlmostEqual(limiter.reserve(), 3 + 1 / 5)
+        limiter.on_rate_limited(retry_after=3)
+        limiter.on_rate_limited(retry_after=3)
+        limiter.on_rate_limited(retry_after=3)
+        limiter.on_rate_limited(retry_after=3)
+        self.assertEqual(limiter.rate, 0.5)  # min_rate floor
+
+    def test_additive_recovery(self):
+        """Test healthy responses raise the rate once per second up to the ceiling."""
+        limiter = RateLimiter(rate=4, increase=1, clock=self.clock)
+        limiter.on_rate_limited(retry_after=0)
+        self.assertEqual(limiter.rate, 2)
+        limiter.on_success()
+        self.assertEqual(limiter.rate, 2)
+        for _ in range(5):
+            self.clock.now += 1
+            limiter.on_success()
+        self.assertEqual(limiter.rate, 4)
+
+    def test_parse_retry_after(self):
+        """Test delta-seconds, HTTP dates and missing values."""
+        self.assertEqual(parse_retry_after("7"), 7)
+        self.assertEqual(parse_retry_after(None, default=2), 2)
+        self.assertEqual(parse_retry_after("Mon, 01 Jan 2001 00:00:00 GMT"), 0)
+        self.assertEqual(parse_retry_after("soon", default=1), 1)
+
+
+class TestClientRateLimit(unittest.IsolatedAsyncioTestCase):
+    """Verify clients pace requests and back off on 429."""
+
+    def setUp(self):
+        self.server = StubServer().__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def test_threads_share_one_bucket(self):
+        """Test concurrent threads of one client respect the rate."""
+        with api(base_url=self.server.url, coalesce=False,
+                 rate_limit=RateLimiter(rate=20, burst=1)) as client:
+            start = time.perf_counter()
+            threads = [threading.Thread(target=client.search_pt, args=(f"kampus{i}",))
+                       for i in range(10)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertGreaterEqual(time.perf_counter() - start, 0.4)
+        self.assertEqual(len(self.server.paths), 10)
+
+    def test_rejected_budgets_leave_no_debt(self):
+        """Test calls whose budget cannot cover the wait do not delay later callers."""
+        fake = MemoryTransport({"/pt/count": {"jumlah": 1}})
+        with api(transport=fake, rate_limit=RateLimiter(rate=5, burst=1),
+                 retry=RetryPolicy(max_attempts=1), circuit_breakers=False) as client:
+            self.assertIsNotNone(client.get_pt_count())
+            for _ in range(5):
+                self.assertIsNone(client.get_pt_count(budget=0.1))
+            start = time.perf_counter()
+            self.assertIsNotNone(client.get_pt_count())
+            self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(len(fake.requests), 2)
+
+    def test_429_backs_off_pool(self):
+        """Test a 429 slows every client of a pool."""
+        pool = ClientPool(size=2, base_url=self.server.url, rate_limit=50,
+                          retry=RetryPolicy(max_attempts=1))
+        with pool.client() as client:
+            self.assertIsNone(client.search_pt("status-429"))
+        self.assertEqual(len(self.server.paths), 1)
+        self.assertEqual(pool.limiter.rate, 25)
+        self.assertEqual(pool.limiter.throttled, 1)
+        with pool.client() as a, pool.client() as b:
+            self.assertIs(a.H.limiter, b.H.limiter)
+        pool.close()
+
+    async def test_async_client_paces(self):
+        """Test the asyncio client waits without blocking the loop."""
+        import asyncio
+        async with AsyncApi(base_url=self.server.url, coalesce=False,
+                            rate_limit=RateLimiter(rate=20, burst=1)) as client:
+            start = time.perf_counter()
+            await asyncio.gather(*[client.search_pt(f"kampus{i}") for i in range(6)])
+        self.assertGreaterEqual(time.perf_counter() - start, 0.2)
+
+
+if __name__ == '__main__':
+    unittest.main()
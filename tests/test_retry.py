@@ -0,0 +1,124 @@
+"""
+PDDIKTI Retry Policy Test Suite
+
+Verifies the unified retry budget and which errors it retries.
+
+Test Framework: Python unittest
+"""
+
+import time
+import unittest
+import os
+import sys
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pddiktipy import (
+    api, AsyncApi, RetryPolicy, APIResponseError, APITimeoutError,
+    APIRateLimitError, MemoryTransport, TransportResponse, ValidationError
+)
+from tests.stub_server import StubServer
+
+FAST = RetryPolicy(max_attempts=3, deadline=5, backoff=0.01, max_backoff=0.02)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Verify attempt caps, deadlines and retryability."""
+
+    def _counting(self, error, succeed_after=None):
+        calls = []
+
+        def attempt(timeout):
+            calls.append(timeout)
+            if succeed_after is not None and len(calls) > succeed_after:
+                return "ok"
+            raise error
+        return attempt, calls
+
+    def test_retries_transient_errors(self):
+        """Test timeouts and 5xx are retried until success."""
+        attempt, calls = self._counting(APITimeoutError("slow"), succeed_after=2)
+        self.assertEqual(FAST.run(attempt, timeout=1), "ok")
+        self.assertEqual(len(calls), 3)
+
+    def test_attempts_are_capped(self):
+        """Test the last error is raised after max_attempts."""
+        attempt, calls = self._counting(APIResponseError("down", status_code=503))
+        with self.assertRaises(APIResponseError):
+            FAST.run(attempt)
+        self.assertEqual(len(calls), 3)
+
+    def test_never_retries_client_errors(self):
+        """Test validation errors and 404s fail on the first attempt."""
+        for error in (ValidationError("bad id"),
+                      APIResponseError("Endpoint not found", status_code=404)):
+            attempt, calls = self._counting(error)
+            with self.assertRaises(type(error)):
+                FAST.run(attempt)
+            self.assertEqual(len(calls), 1)
+
+    def test_deadline_bounds_total_time(self):
+        """Test attempt timeouts shrink and retries stop at the deadline."""
+        policy = RetryPolicy(max_attempts=10, deadline=0.3, backoff=0.1, max_backoff=0.1)
+        calls = []
+
+        def attempt(timeout):
+            calls.append(timeout)
+            time.sleep(0.05)
+            raise APITimeoutError("slow")
+
+        start = time.perf_counter()
+        with self.assertRaises(APITimeoutError):
+            policy.run(attempt, timeout=30)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertLessEqual(calls[0], 0.3)
+        self.assertLess(len(calls), 10)
+
+    def test_honours_retry_after(self):
+        """Test a 429's Retry-After is the minimum backoff."""
+        error = APIRateLimitError("slow down", status_code=429, retry_after=2.5)
+        self.assertGreaterEqual(FAST.delay(1, error), 2.5)
+
+
+class TestClientRetries(unittest.IsolatedAsyncioTestCase):
+    """Verify clients send exactly the attempts the policy allows."""
+
+    def setUp(self):
+        self.server = StubServer().__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def test_server_errors_are_retried(self):
+        """Test a 500 is attempted max_attempts times in total."""
+        with api(base_url=self.server.url, retry=FAST) as client:
+            self.assertIsNone(client.search_pt("status-500"))
+        self.assertEqual(len(self.server.paths), 3)
+
+    def test_not_found_is_not_retried(self):
+        """Test a 404 is sent once."""
+        with api(base_url=self.server.url, retry=FAST) as client:
+            self.assertIsNone(client.get_detail_pt("status-404-abcdef"))
+        self.assertEqual(len(self.server.paths), 1)
+
+    def test_bare_429_is_retried(self):
+        """Test a 429 without Retry-After backs off like other transient errors."""
+        busy = [TransportResponse(429)]
+        fake = MemoryTransport()
+        fake.add("/pencarian/pt/busy",
+                 lambda url, headers: busy.pop() if busy else [{"nama": "UGM"}])
+        with api(transport=fake, retry=FAST, circuit_breakers=False) as client:
+            self.assertEqual(client.search_pt("busy"), [{"nama": "UGM"}])
+        self.assertEqual(len(fake.requests), 2)
+
+    async def test_async_retries(self):
+        """Test the asyncio client shares the same policy."""
+        async with AsyncApi(base_url=self.server.url, retry=FAST) as client:
+            self.assertIsNone(await client.search_pt("status-503"))
+            self.assertIsNone(await client.search_pt("status-404"))
+        self.assertEqual(len(self.server.paths), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+PDDIKTI REST Service Test Suite
+
+Runs the FastAPI service in-process against a local stand-in upstream.
+
+Test Framework: Python unittest
+"""
+
+import unittest
+import os
+import sys
+
+# Add the parent directory to the path to import the service module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.testclient import TestClient
+
+import pddikti_service
+from pddiktipy import ClientPool
+from tests.stub_server import StubServer
+
+SAMPLE_ID = "lCOatIX_hCe2RQSG1Rghn5kO81hHLJdY"
+
+
+class TestServiceRoutes(unittest.TestCase):
+    """Exercise service routes with the shared client pool."""
+
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self._original_pool = pddikti_service._client_pool
+        pddikti_service._client_pool = ClientPool(size=4, base_url=self.server.url)
+        pddikti_service.cached_search_mahasiswa.cache_clear()
+        self.client = TestClient(pddikti_service.app)
+
+    def tearDown(self):
+        pddikti_service._client_pool.close()
+        pddikti_service._client_pool = self._original_pool
+        self.server.__exit__(None, None, None)
+
+    def test_detail_prodi_composite(self):
+        """Test /detail/prodi/{id} returns every section in one response."""
+        r = self.client.get(f"/detail/prodi/{SAMPLE_ID}", params={"semester": 20241})
+        self.assertEqual(r.status_code, 200)
+        body = r.json()
+        self.assertEqual(len(body["status"]), 10)
+        self.assertTrue(body["complete"])
+        self.assertEqual(
+            body["data"]["homebase"][0]["path"],
+            f"/dosen/homebase/{SAMPLE_ID}?semester=20241"
+        )
+
+    def test_detail_dosen_full_portfolio(self):
+        """Test /detail/dosen/{id}?full=true returns the portfolio at once."""
+        r = self.client.get(f"/detail/dosen/{SAMPLE_ID}", params={"full": "true"})
+        self.assertEqual(r.status_code, 200)
+        body = r.json()
+        self.assertEqual(len(body["data"]), 7)
+        self.assertIn("elapsed", body["status"]["karya"])
+
+    def test_detail_prodi_not_found(self):
+        """Test invalid or unknown study programs return 404."""
+        self.assertEqual(self.client.get("/detail/prodi/short").status_code, 404)
+        self.assertEqual(
+            self.client.get("/detail/prodi/status-404-abcdef").status_code, 404
+        )
+
+    def test_search_is_cached(self):
+        """Test repeated searches are served from the TTL cache."""
+        for _ in range(3):
+            r = self.client.get("/search/mahasiswa/viral")
+            self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.json()["count"], 1)
+        self.assertEqual(len(self.server.paths), 1)
+
+    def test_stats_reports_cache_counters(self):
+        """Test /stats exposes the response cache counters per lookup."""
+        before = self.client.get("/stats").json()["caches"]["search_mahasiswa"]
+        for _ in range(2):
+            self.client.get("/search/mahasiswa/viral")
+        caches = self.client.get("/stats").json()["caches"]
+        self.assertEqual(set(caches), set(pddikti_service.CACHED_LOOKUPS))
+        self.assertEqual(caches["search_mahasiswa"]["misses"] - before["misses"], 1)
+        self.assertEqual(caches["search_mahasiswa"]["hits"] - before["hits"], 1)
+
+    def test_metrics_exposition(self):
+        """Test /metrics reports route, upstream and cache metrics."""
+        pddikti_service._client_pool.close()
+        pddikti_service._client_pool = ClientPool(size=4, base_url=self.server.url,
+                                                  events=pddikti_service.UPSTREAM_EVENTS)
+        self.client.get("/search/mahasiswa/viral")
+        r = self.client.get("/metrics")
+        self.assertEqual(r.status_code, 200)
+        self.assertTrue(r.headers["content-type"].startswith("text/plain; version=0.0.4"))
+        text = r.text
+        self.assertIn('pddikti_http_request_duration_seconds_count'
+                      '{route="/search/mahasiswa/{keyword}",status="200"}', text)
+        self.assertIn('pddikti_upstream_requests_total{family="pencarian/mhs",status="200"}', text)
+        self.assertIn('pddikti_cache_misses_total{cache="search_mahasiswa"}', text)
+        self.assertIn("pddikti_upstream_in_flight 0", text)
+
+    def test_empty_and_fallback_results_expire_quickly(self):
+        """Test negative results get the short TTL, real data the default."""
+        negative = pddikti_service.NEGATIVE_TTL
+        self.assertEqual(pddikti_service.result_ttl(None), negative)
+        self.assertEqual(pddikti_service.result_ttl([]), negative)
+        self.assertEqual(pddikti_service.result_ttl({"data": []}), negative)
+        self.assertEqual(pddikti_service.result_ttl({"fallback_mode": True}), negative)
+        self.assertIsNone(pddikti_service.result_ttl([{"nama": "x"}]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,230 @@
+"""
+PDDIKTI Request Coalescing Test Suite
+
+Verifies that identical concurrent upstream calls share one request.
+
+Test Framework: Python unittest
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+import os
+import sys
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pddiktipy import api, AsyncApi, APIResponseError, MemoryTransport, RetryPolicy
+from pddiktipy import DeadlineExceededError, deadline_scope
+from pddiktipy.singleflight import AsyncSingleFlight, SingleFlight, singleflight
+from tests.stub_server import StubServer
+
+
+def _run_threads(target, count):
+    barrier = threading.Barrier(count)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(target())
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Verify the thread-based coalescing group."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test ten concurrent calls for one key run the function once."""
+        flights = SingleFlight()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.2)
+            return "value"
+
+        results = _run_threads(lambda: flights.do("key", slow), 10)
+        self.assertEqual(results, ["value"] * 10)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flights.coalesced, 9)
+        self.assertEqual(flights.in_flight, 0)
+
+    def test_errors_are_shared(self):
+        """Test followers receive the leader's exception."""
+        flights = SingleFlight()
+
+        def failing():
+            time.sleep(0.1)
+            raise APIResponseError("boom")
+
+        def call():
+            try:
+                flights.do("key", failing)
+            except APIResponseError as e:
+                return e.message
+
+        self.assertEqual(_run_threads(call, 5), ["boom"] * 5)
+
+    def test_followers_keep_their_deadline(self):
+        """Test a follower stops waiting on a slow leader when its budget runs out."""
+        flights = SingleFlight()
+        leader = threading.Thread(target=flights.do, args=("key", time.sleep, 1.0))
+        leader.start()
+        time.sleep(0.05)
+        start = time.perf_counter()
+        with deadline_scope(0.2):
+            with self.assertRaises(DeadlineExceededError):
+                flights.do("key", lambda: "never")
+        self.assertLess(time.perf_counter() - start, 0.5)
+        leader.join()
+
+    def test_leader_deadline_is_not_shared(self):
+        """Test followers with time left retry when only the leader's deadline ran out."""
+        flights = SingleFlight()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.2)
+            # The first call runs under a 0.1s budget, like a hurried leader
+            if len(calls) == 1:
+                raise DeadlineExceededError("leader budget spent")
+            return "value"
+
+        def hurried():
+            with deadline_scope(0.1):
+                try:
+                    return flights.do("key", fetch)
+                except DeadlineExceededError:
+                    return "expired"
+
+        leader = threading.Thread(target=hurried)
+        leader.start()
+        time.sleep(0.05)
+        self.assertEqual(flights.do("key", fetch), "value")
+        leader.join()
+        self.assertEqual(len(calls), 2)
+
+    def test_sequential_calls_are_not_cached(self):
+        """Test completed calls are not reused."""
+        counter = []
+
+        @singleflight
+        def fetch(keyword):
+            counter.append(keyword)
+            return keyword
+
+        fetch("a")
+        fetch("a")
+        self.assertEqual(counter, ["a", "a"])
+
+
+class TestHelperCoalescing(unittest.IsolatedAsyncioTestCase):
+    """Verify helper.response coalesces identical endpoint URLs."""
+
+    def setUp(self):
+        self.server = StubServer().__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+
+    def test_sync_clients_share_upstream_request(self):
+        """Test separate clients (as in the service pool) share one GET."""
+        clients = [api(base_url=self.server.url) for _ in range(10)]
+        index = iter(range(10))
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                client = clients[next(index)]
+            return client.search_mahasiswa("delay-300 viral")
+
+        results = _run_threads(call, 10)
+        self.assertEqual(len(self.server.paths), 1)
+        self.assertTrue(all(r == results[0] for r in results))
+        # Every caller gets its own decoded object
+        self.assertEqual(len({id(r) for r in results}), 10)
+        for client in clients:
+            client.close()
+
+    def test_clients_with_own_transports_do_not_share(self):
+        """Test concurrent clients on different transports get their own responses."""
+        def slow(body):
+            def handler(url, headers):
+                time.sleep(0.2)
+                return body
+            return handler
+
+        fakes = [MemoryTransport({"/pencarian/mhs/viral": slow([{"nama": name}])})
+                 for name in ("A", "B")]
+        clients = [api(transport=fake, retry=RetryPolicy(max_attempts=1)) for fake in fakes]
+        index = iter(range(2))
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                client = clients[next(index)]
+            return client, client.search_mahasiswa("viral")
+
+        results = dict((id(client), body) for client, body in _run_threads(call, 2))
+        self.assertEqual(results[id(clients[0])], [{"nama": "A"}])
+        self.assertEqual(results[id(clients[1])], [{"nama": "B"}])
+
+    def test_coalescing_can_be_disabled(self):
+        """Test coalesce=False sends every request."""
+        clients = [api(base_url=self.server.url, coalesce=False) for _ in range(3)]
+        index = iter(range(3))
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                client = clients[next(index)]
+            return client.search_mahasiswa("delay-200 viral")
+
+        _run_threads(call, 3)
+        self.assertEqual(len(self.server.paths), 3)
+
+    async def test_async_followers_keep_their_deadline(self):
+        """Test async followers give up at their deadline and retry after the leader's."""
+        flights = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.3)
+            if len(calls) == 1:
+                raise DeadlineExceededError("leader budget spent")
+            return "value"
+
+        leader = asyncio.ensure_future(flights.do("key", fetch))
+        await asyncio.sleep(0.01)
+        start = time.perf_counter()
+        with deadline_scope(0.1):
+            with self.assertRaises(DeadlineExceededError):
+                await flights.do("key", fetch)
+        self.assertLess(time.perf_counter() - start, 0.25)
+        self.assertEqual(await flights.do("key", fetch), "value")
+        with self.assertRaises(DeadlineExceededError):
+            await leader
+        self.assertEqual(len(calls), 2)
+
+    async def test_async_coalescing(self):
+        """Test concurrent coroutines share one GET."""
+        async with AsyncApi(base_url=self.server.url) as client:
+            results = await asyncio.gather(*[
+                client.search_dosen("delay-200 viral") for _ in range(10)
+            ])
+        self.assertEqual(len(self.server.paths), 1)
+        self.assertTrue(all(r == results[0] for r in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
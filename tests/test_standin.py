@@ -0,0 +1,113 @@
+"""
+PDDIKTI Stand-in Server Test Suite
+
+Verifies the bundled local stand-in answers every endpoint method of the
+client and honours its latency, error and result size settings.
+
+Test Framework: Python unittest
+"""
+
+import inspect
+import random
+import time
+import unittest
+import os
+import sys
+
+import requests
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pddiktipy import api, RetryPolicy
+from pddiktipy.standin import Latency, StandInServer
+
+SAMPLE_ID = "lCOatIX_hCe2RQSG1Rghn5kO81hHLJdY"
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def _sample_args(method):
+    """Plausible arguments for an endpoint method, by parameter name."""
+    args = []
+    for name in inspect.signature(method.__wrapped__).parameters:
+        if name == "self":
+            continue
+        if name == "keyword":
+            args.append("kampus")
+        elif name in ("tahun", "semester"):
+            args.append(20241)
+        else:
+            args.append(SAMPLE_ID)
+    return args
+
+
+class TestStandInServer(unittest.TestCase):
+    """Verify endpoint coverage and the tunable behaviour."""
+
+    def test_every_endpoint_method(self):
+        """Test every api endpoint method gets a non-empty payload."""
+        methods = {name: attr for name, attr in vars(api).items()
+                   if not name.startswith('_') and hasattr(attr, '__wrapped__')}
+        with StandInServer(rows=3) as server, \
+                api(base_url=server.url, circuit_breakers=False, coalesce=False) as client:
+            for name, method in methods.items():
+                with self.subTest(method=name):
+                    self.assertTrue(getattr(client, name)(*_sample_args(method)))
+            self.assertNotIn("not_found", server.stats())
+
+    def test_payloads_are_deterministic(self):
+        """Test the same path always returns the same payload and ETag."""
+        with StandInServer() as server:
+            first = requests.get(f"{server.url}/detail/pt/{SAMPLE_ID}")
+            second = requests.get(f"{server.url}/detail/pt/{SAMPLE_ID}",
+                                  headers={"If-None-Match": first.headers["ETag"]})
+        self.assertEqual(first.json()["id"], SAMPLE_ID)
+        self.assertEqual(second.status_code, 304)
+
+    def test_large_result_sets(self):
+        """Test rows controls search and study program list sizes."""
+        with StandInServer(rows=2000) as server, api(base_url=server.url) as client:
+            self.assertEqual(len(client.search_mahasiswa("budi")), 2000)
+            self.assertEqual(len(client.get_prodi_pt(SAMPLE_ID, 20241)), 2000)
+
+    def test_latency(self):
+        """Test per-family latency overrides the default."""
+        with StandInServer(family_latency={"detail/pt": Latency.constant(0.2)}) as server:
+            start = time.perf_counter()
+            requests.get(f"{server.url}/pencarian/pt/ugm")
+            fast = time.perf_counter() - start
+            start = time.perf_counter()
+            requests.get(f"{server.url}/detail/pt/{SAMPLE_ID}")
+            slow = time.perf_counter() - start
+        self.assertLess(fast, 0.15)
+        self.assertGreaterEqual(slow, 0.2)
+
+    def test_injected_errors(self):
+        """Test injected statuses, Retry-After and the error counters."""
+        with StandInServer(errors={429: 1.0}, retry_after=2) as server:
+            response = requests.get(f"{server.url}/pencarian/pt/ugm")
+            with api(base_url=server.url, retry=NO_RETRY, circuit_breakers=False) as client:
+                self.assertIsNone(client.search_pt("ugm"))
+            stats = server.stats()
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers["Retry-After"], "2")
+        self.assertEqual(stats["errors_429"], 2)
+
+    def test_error_rate(self):
+        """Test error probabilities are roughly honoured."""
+        with StandInServer(errors={503: 0.25}, seed=7) as server:
+            statuses = [requests.get(f"{server.url}/pt/count").status_code for _ in range(200)]
+        self.assertAlmostEqual(statuses.count(503) / 200, 0.25, delta=0.1)
+
+    def test_latency_specs(self):
+        """Test command line latency specs are in milliseconds."""
+        rng = random.Random(1)
+        self.assertEqual(Latency.parse("constant:50").sample(rng), 0.05)
+        self.assertTrue(0.01 <= Latency.parse("uniform:10:20").sample(rng) <= 0.02)
+        self.assertLessEqual(Latency.parse("lognormal:40:2:100").sample(rng), 0.1)
+        with self.assertRaises(ValueError):
+            Latency.parse("pareto:1")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+PDDIKTI Client Statistics Test Suite
+
+Verifies the latency sketch accuracy and the per-method statistics kept by
+the clients.
+
+Test Framework: Python unittest
+"""
+
+import math
+import os
+import random
+import sys
+import unittest
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pddiktipy import (
+    api, AsyncApi, ClientPool, LatencySketch, MemoryTransport, RetryPolicy, TransportResponse
+)
+from pddiktipy.stats import WindowedSketch
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+SAMPLE_ID = "lCOatIX_hCe2RQSG1Rghn5kO81hHLJdY"
+
+
+def _exact(values, q):
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(q * len(ordered))) - 1]
+
+
+class TestLatencySketch(unittest.TestCase):
+    """Verify quantile accuracy, merging and the rolling window."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test quantiles of long-tailed latencies stay within 1%."""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(math.log(0.08), 0.9) for _ in range(20000)]
+        sketch = LatencySketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.record(value)
+        for q in (0.5, 0.9, 0.95, 0.99, 0.999):
+            exact = _exact(values, q)
+            self.assertAlmostEqual(sketch.quantile(q), exact, delta=exact * 0.01)
+        self.assertEqual(sketch.count, len(values))
+        self.assertEqual(sketch.max, max(values))
+        self.assertLess(len(sketch._buckets), 1100)
+
+    def test_empty_and_merge(self):
+        """Test empty sketches report None and merged sketches add up."""
+        first, second = LatencySketch(), LatencySketch()
+        self.assertIsNone(first.quantile(0.5))
+        self.assertIsNone(first.mean)
+        for ms in range(1, 51):
+            first.record(ms / 1000)
+            second.record((ms + 50) / 1000)
+        first.merge(second)
+        self.assertEqual(first.count, 100)
+        self.assertAlmostEqual(first.quantile(0.99), 0.099, delta=0.001)
+        with self.assertRaises(ValueError):
+            first.merge(LatencySketch(relative_accuracy=0.05))
+
+    def test_window_follows_recent_latency(self):
+        """Test old latencies leave the window after two generations."""
+        window = WindowedSketch(window=100)
+        for _ in range(200):
+            window.record(1.0)
+        for _ in range(200):
+            window.record(0.01)
+        self.assertEqual(window.count, 200)
+        self.assertAlmostEqual(window.quantile(0.99), 0.01, delta=0.0002)
+
+
+class TestClientStats(unittest.TestCase):
+    """Verify the statistics reported by api.stats()."""
+
+    def setUp(self):
+        body = [{"nama": "UGM"}]
+        self.fake = MemoryTransport({"/pencarian/pt/ugm": body,
+                                     "/pt/count": {"jumlah": 4000}})
+        self.size = len(b'[{"nama": "UGM"}]')
+
+    def test_per_method_report(self):
+        """Test counts, quantiles, bytes and errors per method."""
+        with api(transport=self.fake, retry=NO_RETRY, circuit_breakers=False,
+                 stats=True) as client:
+            for _ in range(4):
+                client.search_pt("ugm")
+            client.search_pt("missing")
+            client.search_pt("")
+            client.get_pt_count()
+            stats = client.stats()
+        self.assertEqual(set(stats), {"search_pt", "get_pt_count"})
+        search = stats["search_pt"]
+        self.assertEqual(search["count"], 6)
+        self.assertEqual(search["requests"], 5)
+        self.assertEqual(search["errors"], {"APIResponseError": 1, "ValidationError": 1})
+        self.assertGreaterEqual(search["bytes"], 4 * self.size)
+        self.assertLessEqual(search["p50"], search["p95"])
+        self.assertLessEqual(search["p95"], search["p99"])
+        self.assertLessEqual(search["p99"], search["max"])
+        self.assertEqual(stats["get_pt_count"]["count"], 1)
+
+    def test_retries_and_reset(self):
+        """Test retries are counted and reset clears the report."""
+        busy = [TransportResponse(503)]
+        self.fake.add("/pencarian/pt/busy",
+                      lambda url, headers: busy.pop() if busy else [{"nama": "UGM"}])
+        with api(transport=self.fake, circuit_breakers=False, stats=True,
+                 retry=RetryPolicy(max_attempts=2, backoff=0)) as client:
+            client.search_pt("busy")
+            stats = client.stats(reset=True)
+            self.assertEqual(client.stats(), {})
+        self.assertEqual((stats["search_pt"]["requests"], stats["search_pt"]["retries"]), (2, 1))
+
+    def test_disabled_by_default(self):
+        """Test clients and pools keep no statistics and no subscriber by default."""
+        with api(transport=self.fake) as client:
+            client.search_pt("ugm")
+            self.assertEqual(client.stats(), {})
+            self.assertFalse(client.events.active)
+        pool = ClientPool(size=1, transport=self.fake)
+        self.addCleanup(pool.close)
+        with pool.client() as client:
+            client.search_pt("ugm")
+        self.assertEqual(pool.stats(), {})
+        self.assertFalse(pool.events.active)
+
+    def test_composite_sections_are_counted(self):
+        """Test composite calls report each section as a method call."""
+        fake = MemoryTransport(default=[{"id": SAMPLE_ID}])
+        with api(transport=fake, retry=NO_RETRY, circuit_breakers=False,
+                 stats=True) as client:
+            client.get_prodi_full_profile(SAMPLE_ID, 20241)
+            stats = client.stats()
+        self.assertEqual(stats["get_detail_prodi"]["count"], 1)
+        self.assertEqual(stats["get_homebase_prodi"]["requests"], 1)
+        self.assertEqual(len(stats), 10)
+
+    def test_pool_aggregates_clients(self):
+        """Test a pool reports the calls of all its clients together."""
+        pool = ClientPool(size=2, transport=self.fake, retry=NO_RETRY, circuit_breakers=False,
+                          stats=True)
+        self.addCleanup(pool.close)
+        with pool.client() as first, pool.client() as second:
+            first.search_pt("ugm")
+            second.search_pt("ugm")
+            self.assertEqual(first.stats()["search_pt"]["count"], 2)
+        self.assertEqual(pool.stats()["search_pt"]["count"], 2)
+        self.assertEqual(pool.stats()["search_pt"]["requests"], 2)
+
+
+class TestAsyncClientStats(unittest.IsolatedAsyncioTestCase):
+    """Verify the async client keeps the same statistics."""
+
+    async def test_per_method_report(self):
+        """Test concurrent async calls are counted per method."""
+        fake = MemoryTransport({"/pencarian/pt/ugm": [{"nama": "UGM"}]})
+        async with AsyncApi(transport=fake, retry=NO_RETRY, circuit_breakers=False,
+                            coalesce=False, stats=True) as client:
+            for _ in range(3):
+                await client.search_pt("ugm")
+            await client.search_pt("missing")
+            stats = client.stats()
+        self.assertEqual(stats["search_pt"]["count"], 4)
+        self.assertEqual(stats["search_pt"]["requests"], 4)
+        self.assertEqual(stats["search_pt"]["errors"], {"APIResponseError": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
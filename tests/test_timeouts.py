@@ -0,0 +1,161 @@
+"""
+PDDIKTI Adaptive Timeout Test Suite
+
+Verifies connect and read timeouts are learned per endpoint family within
+their bounds, and that a stalled upstream is cut off early.
+
+Test Framework: Python unittest
+"""
+
+import os
+import sys
+import time
+import unittest
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pddiktipy import (
+    AdaptiveTimeouts, APITimeoutError, AsyncApi, RetryPolicy, TransportResponse, api
+)
+from pddiktipy.transport import Transport
+from tests.stub_server import StubServer
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+COUNT_URL = "https://h/pt/count"
+
+
+class RecordingTransport(Transport):
+    """Answers every GET at once and records the timeouts it was given."""
+
+    def __init__(self):
+        self.timeouts = []
+
+    def get(self, url, headers, timeout):
+        self.timeouts.append(timeout)
+        return TransportResponse(200, content=b'{"jumlah": 1}', elapsed=0.01)
+
+
+class TestAdaptiveTimeouts(unittest.TestCase):
+    """Verify what is learned from observed latency."""
+
+    def test_unknown_until_enough_samples(self):
+        """Test static timeouts apply until min_samples latencies are known."""
+        timeouts = AdaptiveTimeouts(min_samples=16)
+        for _ in range(15):
+            timeouts.observe(COUNT_URL, 0.05)
+        self.assertIsNone(timeouts.timeouts(COUNT_URL, 30))
+        timeouts.observe(COUNT_URL, 0.05)
+        self.assertIsNotNone(timeouts.timeouts(COUNT_URL, 30))
+
+    def test_learned_per_family(self):
+        """Test read follows the percentile and connect the time to first byte."""
+        timeouts = AdaptiveTimeouts(read_floor=0.01, connect_floor=0.01, min_samples=16)
+        for _ in range(32):
+            timeouts.observe(COUNT_URL, 0.1, ttfb=0.02)
+            timeouts.observe("https://h/pt/prodi/x/2024", 1.0)
+        connect, read = timeouts.timeouts(COUNT_URL, 30)
+        self.assertAlmostEqual(read, 0.3, delta=0.01)
+        self.assertAlmostEqual(connect, 0.06, delta=0.002)
+        self.assertAlmostEqual(timeouts.timeouts("https://h/pt/prodi/y/2023", 30)[1], 3.0, delta=0.05)
+        self.assertIsNone(timeouts.timeouts("https://h/detail/pt/x", 30))
+
+    def test_bounds_and_caller_timeout(self):
+        """Test floors, ceilings and the caller's timeout limit the result."""
+        timeouts = AdaptiveTimeouts(read_floor=2, read_ceiling=5, connect_floor=1,
+                                    connect_ceiling=3, min_samples=8)
+        for _ in range(8):
+            timeouts.observe(COUNT_URL, 0.001)
+            timeouts.observe("https://h/pt/prodi/x/2024", 60.0)
+        self.assertEqual(timeouts.timeouts(COUNT_URL, 30), (1, 2))
+        self.assertEqual(timeouts.timeouts("https://h/pt/prodi/x/2024", 30), (3, 5))
+        self.assertEqual(timeouts.timeouts("https://h/pt/prodi/x/2024", 0.5), (0.5, 0.5))
+        with self.assertRaises(ValueError):
+            AdaptiveTimeouts(read_floor=5, read_ceiling=2)
+
+    def test_timeouts_widen_the_timeout(self):
+        """Test attempts that time out raise the learned read timeout."""
+        timeouts = AdaptiveTimeouts(read_floor=0.1, min_samples=8)
+        for _ in range(96):
+            timeouts.observe(COUNT_URL, 0.05)
+        before = timeouts.timeouts(COUNT_URL, 30)[1]
+        for _ in range(16):
+            # Clients send the current learned timeout, which widens as it goes
+            timeouts.observe_timeout(COUNT_URL, timeouts.timeouts(COUNT_URL, 30)[1])
+        self.assertGreater(timeouts.timeouts(COUNT_URL, 30)[1], before)
+        self.assertEqual(timeouts.stats()["timeouts_observed"], 16)
+
+    def test_shortened_timeouts_are_ignored(self):
+        """Test timeouts below the learned read timeout do not pull it down."""
+        timeouts = AdaptiveTimeouts(read_floor=0.1, min_samples=8)
+        for _ in range(16):
+            timeouts.observe(COUNT_URL, 0.5)
+        before = timeouts.timeouts(COUNT_URL, 30)
+        for _ in range(64):
+            timeouts.observe_timeout(COUNT_URL, 0.05)
+            timeouts.observe(COUNT_URL, 0.5)
+        self.assertEqual(timeouts.timeouts(COUNT_URL, 30), before)
+        self.assertEqual(timeouts.stats()["timeouts_observed"], 0)
+
+
+class HangingTransport(Transport):
+    """Times out every GET at once."""
+
+    def get(self, url, headers, timeout):
+        raise APITimeoutError("Request timeout", endpoint=url)
+
+
+class TestClientTimeouts(unittest.TestCase):
+    """Verify the client sends the learned timeouts."""
+
+    def test_requests_use_learned_timeouts(self):
+        """Test the transport gets static timeouts first, learned ones later."""
+        transport = RecordingTransport()
+        learned = AdaptiveTimeouts(read_floor=0.5, connect_floor=0.2, min_samples=8)
+        with api(transport=transport, adaptive_timeouts=learned, retry=NO_RETRY,
+                 circuit_breakers=False) as client:
+            for _ in range(9):
+                client.get_pt_count()
+        self.assertEqual(transport.timeouts[0], (10.0, 30))
+        self.assertEqual(transport.timeouts[-1], (0.2, 0.5))
+
+    def test_stalled_upstream_is_cut_early(self):
+        """Test a hung request fails after the learned timeout, not the static one."""
+        learned = AdaptiveTimeouts(read_floor=0.2, connect_floor=0.2, min_samples=8)
+        with StubServer() as server, api(base_url=server.url, adaptive_timeouts=learned,
+                                         retry=NO_RETRY, circuit_breakers=False) as client:
+            for i in range(8):
+                self.assertIsNotNone(client.search_pt(f"fast{i}"))
+            start = time.perf_counter()
+            self.assertIsNone(client.search_pt("delay-2000"))
+            self.assertLess(time.perf_counter() - start, 1.5)
+        self.assertEqual(learned.stats()["timeouts_observed"], 1)
+
+    def test_deadline_cut_attempts_are_not_recorded(self):
+        """Test only attempts given their full timeout count as timeouts."""
+        learned = AdaptiveTimeouts(min_samples=8)
+        with api(transport=HangingTransport(), adaptive_timeouts=learned, retry=NO_RETRY,
+                 circuit_breakers=False) as client:
+            for _ in range(5):
+                self.assertIsNone(client.get_pt_count(budget=0.5))
+            self.assertEqual(learned.stats()["timeouts_observed"], 0)
+            self.assertIsNone(client.get_pt_count())
+        self.assertEqual(learned.stats()["timeouts_observed"], 1)
+
+
+class TestAsyncClientTimeouts(unittest.IsolatedAsyncioTestCase):
+    """Verify the async client learns the same way."""
+
+    async def test_requests_use_learned_timeouts(self):
+        """Test async requests switch to the learned timeouts."""
+        transport = RecordingTransport()
+        learned = AdaptiveTimeouts(read_floor=0.5, connect_floor=0.2, min_samples=8)
+        async with AsyncApi(transport=transport, adaptive_timeouts=learned, retry=NO_RETRY,
+                            circuit_breakers=False) as client:
+            for _ in range(9):
+                await client.get_pt_count()
+        self.assertEqual(transport.timeouts[-1], (0.2, 0.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
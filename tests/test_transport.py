@@ -0,0 +1,144 @@
+"""
+PDDIKTI Transport Test Suite
+
+Verifies the client runs offline on the in-memory fake and that cassettes
+record real responses and replay them without the network.
+
+Test Framework: Python unittest
+"""
+
+import base64
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to the path to import the pddiktipy module
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pddiktipy import (
+    api, AsyncApi, APIConnectionError, CassetteTransport, MemoryTransport,
+    RequestsTransport, RetryPolicy, TransportResponse
+)
+from tests.stub_server import StubServer
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+SAMPLE_ID = "lCOatIX_hCe2RQSG1Rghn5kO81hHLJdY"
+
+
+class TestMemoryTransport(unittest.IsolatedAsyncioTestCase):
+    """Verify canned replies go through the normal response handling."""
+
+    def test_json_reply(self):
+        """Test a JSON payload is served for a path."""
+        fake = MemoryTransport({"/pencarian/pt/ugm": [{"nama": "UGM"}]})
+        with api(transport=fake) as client:
+            self.assertEqual(client.search_pt("ugm"), [{"nama": "UGM"}])
+        self.assertEqual(len(fake.requests), 1)
+        self.assertTrue(fake.requests[0].endswith("/pencarian/pt/ugm"))
+
+    def test_unknown_path_is_404(self):
+        """Test unknown URLs are mapped like an upstream 404."""
+        with api(transport=MemoryTransport(), circuit_breakers=False) as client:
+            self.assertIsNone(client.search_pt("nothing"))
+
+    def test_status_and_errors(self):
+        """Test canned statuses and exceptions reach the retry policy."""
+        fake = MemoryTransport({
+            "/pencarian/pt/busy": TransportResponse(503),
+            "/pencarian/pt/down": APIConnectionError("refused"),
+        })
+        with api(transport=fake, retry=RetryPolicy(max_attempts=2, backoff=0),
+                 circuit_breakers=False) as client:
+            self.assertIsNone(client.search_pt("busy"))
+            self.assertIsNone(client.search_pt("down"))
+        self.assertEqual(len(fake.requests), 4)
+
+    def test_callable_reply_and_image(self):
+        """Test callables build replies and images are base64 encoded."""
+        fake = MemoryTransport(default=lambda url, headers: TransportResponse(
+            200, {"Content-Type": "image/png"}, b"\x89PNG"
+        ))
+        with api(transport=fake) as client:
+            logo = client.get_logo_pt(SAMPLE_ID)
+        self.assertEqual(base64.b64decode(logo), b"\x89PNG")
+
+    def test_supplied_transport_is_not_closed(self):
+        """Test the client leaves a caller-supplied transport open."""
+        transport = RequestsTransport()
+        session = transport.session
+        api(transport=transport).close()
+        self.assertIs(transport.session, session)
+
+    async def test_async_client(self):
+        """Test the asyncio client accepts a sync fake."""
+        fake = MemoryTransport({"/pencarian/dosen/budi": [{"nama": "Budi"}]})
+        async with AsyncApi(transport=fake) as client:
+            self.assertEqual(await client.search_dosen("budi"), [{"nama": "Budi"}])
+
+
+class TestCassetteTransport(unittest.IsolatedAsyncioTestCase):
+    """Verify recording against the local stand-in and offline replay."""
+
+    def setUp(self):
+        self.server = StubServer().__enter__()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "cassette.json")
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+        self.tmp.cleanup()
+
+    def _record(self):
+        cassette = CassetteTransport(self.path, mode="record")
+        with api(base_url=self.server.url, transport=cassette) as client:
+            search = client.search_pt("kampus")
+            logo = client.get_logo_pt(SAMPLE_ID)
+        cassette.close()
+        return search, logo
+
+    def test_record_then_replay(self):
+        """Test a replayed cassette returns the recorded payloads offline."""
+        search, logo = self._record()
+        with open(self.path, encoding="utf-8") as f:
+            interactions = json.load(f)["interactions"]
+        self.assertEqual(interactions[f"/pt/logo/{SAMPLE_ID}"]["encoding"], "base64")
+
+        cassette = CassetteTransport(self.path)
+        # Port 9 (discard) is never contacted: everything comes from disk
+        with api(base_url="http://127.0.0.1:9", transport=cassette) as client:
+            self.assertEqual(client.search_pt("kampus"), search)
+            self.assertEqual(client.get_logo_pt(SAMPLE_ID), logo)
+        self.assertEqual(len(self.server.paths), 2)
+
+    def test_replay_miss_raises(self):
+        """Test replay mode never falls back to the network."""
+        self._record()
+        cassette = CassetteTransport(self.path)
+        with self.assertRaises(APIConnectionError):
+            cassette.get("http://h/pencarian/pt/other", {}, (1, 1))
+        with self.assertRaises(FileNotFoundError):
+            CassetteTransport(os.path.join(self.tmp.name, "missing.json"))
+
+    def test_auto_records_only_misses(self):
+        """Test auto mode forwards only unrecorded requests."""
+        self._record()
+        cassette = CassetteTransport(self.path, mode="auto")
+        with api(base_url=self.server.url, transport=cassette, retry=NO_RETRY) as client:
+            client.search_pt("kampus")
+            client.search_pt("baru")
+        cassette.save()
+        self.assertEqual(len(self.server.paths), 3)
+        self.assertIn("/pencarian/pt/baru", CassetteTransport(self.path).interactions)
+
+    async def test_async_replay(self):
+        """Test the asyncio client replays a cassette."""
+        search, _ = self._record()
+        async with AsyncApi(base_url="http://127.0.0.1:9",
+                            transport=CassetteTransport(self.path)) as client:
+            self.assertEqual(await client.search_pt("kampus"), search)
+
+
+if __name__ == '__main__':
+    unittest.main()